@@ -5,7 +5,7 @@ Optimisations pour environnement de production
 
 import os
 from pathlib import Path
-from typing import Type, Union
+from typing import List, Type, Union
 
 
 # Configuration de base
@@ -17,6 +17,49 @@ class ProductionConfig:
     CACHE_TTL = 3600  # 1 heure de cache
     MAX_WORKERS = 8  # Nombre de workers parallèles
 
+    # Pool de rendu (hors boucle d'événements)
+    RENDER_POOL_MODE = os.getenv("RENDER_POOL_MODE", "thread")  # thread | process
+    RENDER_QUEUE_SIZE = 64  # Rendus en cours + en attente avant 503
+    RENDER_RETRY_AFTER = 2  # secondes (en-tête Retry-After)
+    RENDER_LIMITS = {  # Rendus concurrents max par type de générateur
+        "ultimate": 2,
+        "realism": 2,
+        "ai_moon": 2,
+        "ultra_max": 4,
+        "raster": 4,  # Rastérisations PNG
+    }
+
+    # Warm-up des rendus au démarrage (variantes × tailles × générateurs)
+    WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "false").lower() == "true"
+    WARMUP_SIZES = [50, 100, 200, 500]
+    WARMUP_GENERATORS: List[str] = []  # Vide = tous les générateurs
+    WARMUP_PERSIST = False  # True = écrit aussi les fichiers dans exports/
+
+    # Nettoyage des exports (index en mémoire, tâche périodique)
+    EXPORT_MAX_AGE = 24 * 3600  # secondes
+    EXPORT_MAX_BYTES = 512 * 1024 * 1024  # budget disque des exports
+    EXPORT_CLEANUP_INTERVAL = 60  # secondes entre deux évictions
+
+    # Génération par lot (/generate/batch)
+    BATCH_MAX_ITEMS = 100  # Éléments distincts max par lot
+
+    # Rastérisation PNG (/generate?format=png)
+    RASTER_CACHE_SIZE = 256  # Images PNG en cache
+    RASTER_MAX_DIMENSION = 4096  # Côté maximal en pixels
+
+    # Variantes personnalisées (palettes) internées en mémoire
+    CUSTOM_VARIANTS_MAX = 256
+
+    # Gabarits SVG compilés et squelettes de couleurs conservés (LRU)
+    TEMPLATE_CACHE_MAX = 128
+    TEMPLATE_SKELETONS_MAX = 256
+
+    # Densité des éléments (particules, rayons, nœuds) : 1.0 = logo standard
+    # Plafonnée à la plus grande densité compilée (svg_template.COMPILED_DENSITIES) :
+    # une requête API ne coûte jamais plus de 4× le rendu standard. Le CLI
+    # (affiches, bannières) n'est pas limité.
+    MAX_DENSITY = 4.0
+
     # Optimisations SVG
     SVG_COMPRESSION = True
     SVG_MINIFICATION = True
@@ -31,6 +74,8 @@ class ProductionConfig:
     # Monitoring
     ENABLE_METRICS = True
     METRICS_INTERVAL = 60  # secondes
+    # Répertoire partagé des métriques multi-workers (vide = mono-processus)
+    METRICS_MULTIPROC_DIR = os.getenv("METRICS_MULTIPROC_DIR", "")
     LOG_LEVEL = "INFO"
 
     # Sécurité
@@ -64,12 +109,57 @@ class ProductionConfig:
             "optimization_level": cls.SVG_OPTIMIZATION_LEVEL,
         }
 
+    @classmethod
+    def get_render_pool_config(cls):
+        """Configuration du pool de rendu"""
+        return {
+            "mode": cls.RENDER_POOL_MODE,
+            "max_workers": cls.MAX_WORKERS,
+            "max_queue": cls.RENDER_QUEUE_SIZE,
+            "retry_after": cls.RENDER_RETRY_AFTER,
+            "generator_limits": dict(cls.RENDER_LIMITS),
+        }
+
+    @classmethod
+    def get_warmup_config(cls):
+        """Configuration du warm-up"""
+        return {
+            "enabled": cls.WARMUP_ENABLED,
+            "sizes": list(cls.WARMUP_SIZES),
+            "generators": list(cls.WARMUP_GENERATORS),
+            "persist": cls.WARMUP_PERSIST,
+        }
+
+    @classmethod
+    def get_raster_config(cls):
+        """Configuration de la rastérisation PNG"""
+        return {
+            "cache_size": cls.RASTER_CACHE_SIZE,
+            "ttl": cls.CACHE_TTL,
+            "max_dimension": cls.RASTER_MAX_DIMENSION,
+        }
+
+    @classmethod
+    def get_export_config(cls):
+        """Configuration du nettoyage des exports"""
+        return {
+            "max_age": cls.EXPORT_MAX_AGE,
+            "max_bytes": cls.EXPORT_MAX_BYTES,
+            "interval": cls.EXPORT_CLEANUP_INTERVAL,
+        }
+
+    @classmethod
+    def get_batch_config(cls):
+        """Configuration de la génération par lot"""
+        return {"max_items": cls.BATCH_MAX_ITEMS}
+
     @classmethod
     def get_monitoring_config(cls):
         """Configuration monitoring"""
         return {
             "enabled": cls.ENABLE_METRICS,
             "interval": cls.METRICS_INTERVAL,
+            "multiprocess_dir": cls.METRICS_MULTIPROC_DIR,
             "log_level": cls.LOG_LEVEL,
         }
 
@@ -81,6 +171,7 @@ class DevelopmentConfig(ProductionConfig):
     CACHE_SIZE = 100
     CACHE_TTL = 300
     MAX_WORKERS = 2
+    RENDER_QUEUE_SIZE = 16
     LOG_LEVEL = "DEBUG"
     ENABLE_METRICS = False
 
@@ -3,191 +3,173 @@
 API FastAPI pour la génération de logos via interface web
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
+import re
 import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import uvicorn
-from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, PlainTextResponse
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
 from pydantic import BaseModel, Field
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
+from config.production import get_config
+
 try:
+    from src.export_index import ExportIndex
     from src.generator_factory import LogoGeneratorFactory
-    from src.logo_generator import ArkaliaLunaLogo
-    from src.variants import LogoVariants
+    from src.logo_generator import ARTIFACT_DIGEST_LENGTH, ArkaliaLunaLogo
+    from src.metrics import PrometheusMetrics, create_value_store
+    from src.pack import (
+        COMPRESSION_METHODS,
+        MANIFEST_NAME,
+        PackEntry,
+        iter_pack_entries_async,
+        pack_entry_name,
+        pack_matrix,
+        stream_zip,
+        stream_zip_async,
+    )
+    from src.raster_renderer import PNG_MEDIA_TYPE, RasterImage, RasterRenderer
+    from src.render_cache import RenderCache, RenderedSVG
+    from src.render_pool import RenderPool, RenderPoolSaturatedError
+    from src.svg_optimizer import SVGOptimizer, negotiate_encoding, precompressed_path
+    from src.svg_template import template_engine
+    from src.variants import (
+        CustomPalette,
+        custom_variants,
+        variants_registry,
+    )
 except ImportError as e:
     print(f"Erreur d'import: {e}")
     ArkaliaLunaLogo = None  # type: ignore
     LogoGeneratorFactory = None  # type: ignore
-    LogoVariants = None  # type: ignore
+    variants_registry = None  # type: ignore
 
 # Configuration du logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-# Métriques Prometheus
-class PrometheusMetrics:
+class ReadinessState:
+    """État de préparation de l'instance (warm-up des rendus)"""
+
     def __init__(self):
-        self.start_time = time.time()
-        self.request_count = 0
-        self.request_count_by_route: Dict[str, int] = {}
-        self.response_status_by_route: Dict[str, Dict[int, int]] = {}
-        self.logo_generation_count = 0
-        self.logo_generation_count_by_label: Dict[str, int] = {}
-        self.total_generation_time = 0.0
-        self.error_count = 0
-        self.last_generation_time = 0.0
-        # Histogram (seconds)
-        self.duration_buckets = [0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0]
-        self.bucket_counts: Dict[float, int] = dict.fromkeys(self.duration_buckets, 0)
-        self.bucket_inf_count = 0
-        self.hist_count = 0
-        self.hist_sum = 0.0
-
-    def increment_request(self, route: Optional[str] = None) -> None:
-        self.request_count += 1
-        if route:
-            self.request_count_by_route[route] = (
-                self.request_count_by_route.get(route, 0) + 1
-            )
+        self.ready = False
+        self.warming_up = False
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self.duration: Optional[float] = None
+        self._started_at = 0.0
+
+    def start(self, total: int) -> None:
+        self.ready = False
+        self.warming_up = True
+        self.total = total
+        self.completed = 0
+        self.failed = 0
+        self.duration = None
+        self._started_at = time.time()
+
+    def finish(self) -> None:
+        self.warming_up = False
+        self.ready = True
+        if self._started_at:
+            self.duration = time.time() - self._started_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": "ready" if self.ready else "warming_up",
+            "warmup": {
+                "total": self.total,
+                "completed": self.completed,
+                "failed": self.failed,
+                "duration": self.duration,
+            },
+        }
+
+
+# Configuration selon l'environnement
+app_config = get_config()
+warmup_config = app_config.get_warmup_config()
+
+# Instance globale des métriques (fichiers mmap partagés si multi-workers)
+metrics = PrometheusMetrics(
+    store=create_value_store(app_config.METRICS_MULTIPROC_DIR or None)
+)
 
-    def increment_logo_generation(
-        self,
-        duration: float,
-        variant: Optional[str] = None,
-        generator: Optional[str] = None,
-    ) -> None:
-        self.logo_generation_count += 1
-        self.last_generation_time = duration
-        self.total_generation_time += duration
-        # label key format: variant|generator
-        label_key = f"variant={variant or 'unknown'},generator={generator or 'simple'}"
-        self.logo_generation_count_by_label[label_key] = (
-            self.logo_generation_count_by_label.get(label_key, 0) + 1
-        )
+# Pool de rendu borné (les rendus ne bloquent plus la boucle d'événements)
+render_pool = RenderPool(**app_config.get_render_pool_config())
 
-    def increment_error(self) -> None:
-        self.error_count += 1
-
-    def observe_generation_duration(self, duration: float) -> None:
-        placed = False
-        for b in self.duration_buckets:
-            if duration <= b:
-                self.bucket_counts[b] = self.bucket_counts.get(b, 0) + 1
-                placed = True
-                break
-        if not placed:
-            self.bucket_inf_count += 1
-        self.hist_sum += duration
-        self.hist_count += 1
-
-    def record_response_status(self, route: str, status_code: int) -> None:
-        by_status = self.response_status_by_route.setdefault(route, {})
-        by_status[status_code] = by_status.get(status_code, 0) + 1
-
-    def get_metrics(self) -> str:
-        uptime = time.time() - self.start_time
-        lines: List[str] = []
-        # Uptime
-        lines.append("# HELP arkalia_luna_uptime_seconds Total uptime in seconds")
-        lines.append("# TYPE arkalia_luna_uptime_seconds counter")
-        lines.append(f"arkalia_luna_uptime_seconds {uptime}")
-        lines.append("")
-        # Requests total
-        lines.append("# HELP arkalia_luna_requests_total Total number of requests")
-        lines.append("# TYPE arkalia_luna_requests_total counter")
-        lines.append(f"arkalia_luna_requests_total {self.request_count}")
-        # Requests by route (labels)
-        for route, count in self.request_count_by_route.items():
-            lines.append(f'arkalia_luna_requests_total{{route="{route}"}} {count}')
-        lines.append("")
-        # Responses by route and status
-        lines.append(
-            "# HELP arkalia_luna_responses_total Total responses by status and route"
-        )
-        lines.append("# TYPE arkalia_luna_responses_total counter")
-        for route, by_status in self.response_status_by_route.items():
-            for status, count in by_status.items():
-                lines.append(
-                    f'arkalia_luna_responses_total{{route="{route}",status_code="{status}"}} {count}'
-                )
-        lines.append("")
-        # Generations total
-        lines.append(
-            "# HELP arkalia_luna_logo_generations_total Total number of logo generations"
-        )
-        lines.append("# TYPE arkalia_luna_logo_generations_total counter")
-        lines.append(
-            f"arkalia_luna_logo_generations_total {self.logo_generation_count}"
-        )
-        # Generations by labels (variant, generator)
-        for label_key, count in self.logo_generation_count_by_label.items():
-            # label_key is already key=value pairs separated by comma
-            lines.append(f"arkalia_luna_logo_generations_total{{{label_key}}} {count}")
-        lines.append("")
-        # Errors
-        lines.append("# HELP arkalia_luna_errors_total Total number of errors")
-        lines.append("# TYPE arkalia_luna_errors_total counter")
-        lines.append(f"arkalia_luna_errors_total {self.error_count}")
-        lines.append("")
-        # Last and average duration
-        lines.append(
-            "# HELP arkalia_luna_last_generation_duration_seconds Duration of last logo generation"
-        )
-        lines.append("# TYPE arkalia_luna_last_generation_duration_seconds gauge")
-        lines.append(
-            f"arkalia_luna_last_generation_duration_seconds {self.last_generation_time}"
-        )
-        avg = (
-            self.total_generation_time / self.logo_generation_count
-            if self.logo_generation_count
-            else 0.0
-        )
-        lines.append(
-            "# HELP arkalia_luna_avg_generation_duration_seconds Average logo generation duration"
-        )
-        lines.append("# TYPE arkalia_luna_avg_generation_duration_seconds gauge")
-        lines.append(f"arkalia_luna_avg_generation_duration_seconds {avg}")
-        lines.append("")
-        # Histogram
-        lines.append(
-            "# HELP arkalia_luna_generation_duration_seconds Logo generation duration histogram"
-        )
-        lines.append("# TYPE arkalia_luna_generation_duration_seconds histogram")
-        cumulative = 0
-        for b in sorted(self.duration_buckets):
-            cumulative += self.bucket_counts.get(b, 0)
-            lines.append(
-                f'arkalia_luna_generation_duration_seconds_bucket{{le="{b}"}} {cumulative}'
-            )
-        lines.append(
-            f'arkalia_luna_generation_duration_seconds_bucket{{le="+Inf"}} {cumulative + self.bucket_inf_count}'
-        )
-        lines.append(f"arkalia_luna_generation_duration_seconds_sum {self.hist_sum}")
-        lines.append(
-            f"arkalia_luna_generation_duration_seconds_count {self.hist_count}"
-        )
-        lines.append("")
-        # Health
-        lines.append(
-            "# HELP arkalia_luna_health_status Health status (1=healthy, 0=unhealthy)"
-        )
-        lines.append("# TYPE arkalia_luna_health_status gauge")
-        lines.append("arkalia_luna_health_status 1")
-        return "\n".join(lines) + "\n"
+# Optimisation/pré-compression des SVG servis (SVG_* de la configuration)
+svg_optimizer = SVGOptimizer.from_config(app_config.get_svg_config())
+
+# Cache des rendus SVG, clé (generator_type, variant, size)
+render_cache = RenderCache(max_size=app_config.CACHE_SIZE, ttl=app_config.CACHE_TTL)
+
+# Rastérisation PNG sur le pool, cache clé (empreinte SVG, largeur, hauteur)
+raster_renderer = RasterRenderer(render_pool, **app_config.get_raster_config())
 
+# Variantes personnalisées internées (LRU borné, partagé par les générateurs)
+custom_variants.max_size = app_config.CUSTOM_VARIANTS_MAX
 
-# Instance globale des métriques
-metrics = PrometheusMetrics()
+# Gabarits compilés et squelettes de couleurs (LRU bornés, partagés)
+template_engine.max_templates = app_config.TEMPLATE_CACHE_MAX
+template_engine.max_skeletons = app_config.TEMPLATE_SKELETONS_MAX
+
+# État de préparation (/ready)
+readiness = ReadinessState()
+
+# Répertoire des artefacts servis par /download (noms adressés par contenu)
+EXPORT_DIR = Path("exports")
+ARTIFACT_NAME = re.compile(
+    rf"^[\w.-]+\.(?P<digest>[0-9a-f]{{{ARTIFACT_DIGEST_LENGTH}}})\.svg$"
+)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Tailles et formats acceptés par l'API, limites de la génération par lot
+ALLOWED_SIZES = [50, 100, 200, 500]
+OUTPUT_FORMATS = ("svg", "png")
+batch_config = app_config.get_batch_config()
+
+# Index des fichiers exportés (éviction périodique par âge et budget d'octets)
+export_config = app_config.get_export_config()
+export_index = ExportIndex(
+    max_age=export_config["max_age"], max_bytes=export_config["max_bytes"]
+)
+
+warmup_task: Optional["asyncio.Task[None]"] = None
+cleanup_task: Optional["asyncio.Task[None]"] = None
 
 # Rate limiter
 limiter = Limiter(key_func=get_remote_address)
@@ -216,6 +198,13 @@ app.add_middleware(
 
 
 # Modèles Pydantic pour l'API
+class PaletteRequest(BaseModel):
+    primary: Optional[str] = Field(None, description="Couleur principale (#rrggbb)")
+    secondary: Optional[str] = Field(None, description="Couleur secondaire")
+    accent: Optional[str] = Field(None, description="Couleur d'accent")
+    glow: Optional[str] = Field(None, description="Couleur de lueur")
+
+
 class LogoGenerationRequest(BaseModel):
     variant: str = Field(
         ...,
@@ -226,6 +215,22 @@ class LogoGenerationRequest(BaseModel):
         "simple",
         description="Type de générateur (simple, advanced, ultimate, ultra_max, realism_max, ai_moon, dashboard)",
     )
+    density: float = Field(
+        1.0,
+        gt=0,
+        le=app_config.MAX_DENSITY,
+        description="Densité des particules, rayons et nœuds (1.0 = standard)",
+    )
+    palette: Optional[PaletteRequest] = Field(
+        None,
+        description="Palette personnalisée (couleurs absentes : celles de la variante)",
+    )
+    animation_speed: Optional[float] = Field(
+        None, description="Vitesse d'animation personnalisée (0.1 à 5.0)"
+    )
+    glow_intensity: Optional[float] = Field(
+        None, description="Intensité de lueur personnalisée (0.0 à 2.0)"
+    )
 
 
 class LogoGenerationResponse(BaseModel):
@@ -236,6 +241,12 @@ class LogoGenerationResponse(BaseModel):
     generation_time: Optional[float] = None
 
 
+class LogoBatchRequest(BaseModel):
+    items: List[LogoGenerationRequest] = Field(
+        ..., min_length=1, description="Logos à générer (doublons ignorés)"
+    )
+
+
 class HealthResponse(BaseModel):
     status: str
     timestamp: datetime
@@ -251,7 +262,7 @@ generator_factory: Optional[LogoGeneratorFactory] = None
 @app.on_event("startup")
 async def startup_event():
     """Initialisation au démarrage de l'application"""
-    global logo_generator, generator_factory
+    global logo_generator, generator_factory, warmup_task, cleanup_task
 
     try:
         # Initialisation du générateur de logos
@@ -263,6 +274,21 @@ async def startup_event():
         os.makedirs("cache", exist_ok=True)
         os.makedirs("logs", exist_ok=True)
 
+        # Démarrage du pool de rendu
+        render_pool.start()
+
+        # Reprise des exports existants puis éviction périodique
+        export_index.scan(Path("exports"))
+        cleanup_task = asyncio.create_task(
+            run_export_cleanup(export_config["interval"])
+        )
+
+        # Warm-up des rendus en tâche de fond (/ready passe à 200 à la fin)
+        if warmup_config["enabled"]:
+            warmup_task = asyncio.create_task(warm_up_renders(warmup_config))
+        else:
+            readiness.finish()
+
         logger.info("🚀 Arkalia-LUNA Logo Generator API démarrée avec succès")
 
     except Exception as e:
@@ -270,6 +296,402 @@ async def startup_event():
         raise
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Arrêt propre de l'application"""
+    for task in (warmup_task, cleanup_task):
+        if task is not None and not task.done():
+            task.cancel()
+    render_pool.shutdown(wait=False)
+
+
+def get_generator(generator_type: str) -> ArkaliaLunaLogo:
+    """Récupère le générateur correspondant au type demandé"""
+    if generator_type == "simple":
+        # En mode processus, le générateur global n'existe pas dans le worker
+        if logo_generator is not None:
+            return logo_generator
+        return LogoGeneratorFactory.create_generator("default")
+    return LogoGeneratorFactory.create_generator(generator_type)
+
+
+def render_logo_svg(
+    generator_type: str,
+    variant: str,
+    size: int,
+    persist: bool = True,
+    density: float = 1.0,
+    palette: Optional[CustomPalette] = None,
+) -> Tuple[Optional[Path], bytes]:
+    """Rend un logo, et l'écrit sur disque si demandé (worker du pool)
+
+    Fonction de niveau module pour rester picklable en mode processus ; une
+    variante personnalisée est internée dans le registre du worker.
+    """
+    generator = get_generator(generator_type)
+    if palette is not None:
+        variant = generator.variants_manager.register_custom(palette).name
+    # Gabarits compilés : le squelette est optimisé une fois, pas à chaque rendu
+    content = generator.render_svg_logo(
+        variant_name=variant, size=size, density=density, optimizer=svg_optimizer
+    )
+    file_path = None
+    if persist:
+        digest = hashlib.sha256(content).hexdigest()
+        file_path = EXPORT_DIR / generator.get_artifact_name(variant, size, digest)
+        write_logo_files(file_path, content)
+    return file_path, content
+
+
+def write_logo_files(file_path: Path, content: bytes) -> None:
+    """Écrit le SVG et ses variantes pré-compressées (.svgz/.br)"""
+    file_path.write_bytes(content)
+    svg_optimizer.write_precompressed(file_path, content)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Vrai si l'en-tête If-None-Match désigne l'ETag (comparaison faible)"""
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in {
+        tag[2:] if tag.startswith("W/") else tag for tag in candidates
+    }
+
+
+def record_export(file_path: Path) -> None:
+    """Enregistre un SVG exporté et ses variantes dans l'index (processus API)"""
+    export_index.record_all(
+        [file_path]
+        + [precompressed_path(file_path, enc) for enc in svg_optimizer.encodings]
+    )
+
+
+def render_cache_key(
+    generator_type: str, variant: str, size: int, density: float = 1.0
+) -> Tuple[Any, ...]:
+    """Clé du cache de rendu (la densité standard garde la clé courte)"""
+    if density == 1.0:
+        return (generator_type, variant, size)
+    return (generator_type, variant, size, density)
+
+
+async def obtain_rendered_logo(
+    generator_type: str,
+    variant: str,
+    size: int,
+    persist: bool = True,
+    density: float = 1.0,
+    palette: Optional[CustomPalette] = None,
+) -> Tuple[RenderedSVG, Optional[Path]]:
+    """Récupère un rendu depuis le cache ou le calcule dans le pool de rendu
+
+    Avec ``persist=False``, aucun accès au système de fichiers n'est effectué.
+    Une variante personnalisée est identifiée par son nom canonique : une
+    palette répétée retrouve les mêmes entrées de cache.
+    """
+    base_variant = variant
+    if palette is not None:
+        variant = palette.name
+    cache_key = render_cache_key(generator_type, variant, size, density)
+    rendered = render_cache.get(cache_key)
+    if rendered is not None:
+        metrics.increment_cache_hit(generator=generator_type)
+        file_path = None
+        if persist:
+            file_path = EXPORT_DIR / get_generator(generator_type).get_artifact_name(
+                variant, size, rendered.digest
+            )
+            if not file_path.exists():
+                write_logo_files(file_path, rendered.content)
+                record_export(file_path)
+        return rendered, file_path
+
+    metrics.increment_cache_miss(generator=generator_type)
+    start_time = time.time()
+    try:
+        file_path, content = await render_pool.run(
+            generator_type,
+            render_logo_svg,
+            generator_type,
+            variant,
+            size,
+            persist,
+            density,
+            palette,
+        )
+    except RenderPoolSaturatedError as e:
+        logger.warning(f"⏳ {e}")
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        ) from e
+    rendered = RenderedSVG.from_content(content)
+    render_cache.put(cache_key, rendered)
+    if file_path is not None:
+        record_export(file_path)
+
+    generation_time = time.time() - start_time
+    metrics.increment_logo_generation(
+        generation_time, variant=base_variant, generator=generator_type
+    )
+    metrics.observe_generation_duration(generation_time)
+    return rendered, file_path
+
+
+async def rasterize_logo(rendered: RenderedSVG, width: int, height: int) -> RasterImage:
+    """PNG d'un rendu, depuis le cache raster ou rastérisé dans le pool"""
+    try:
+        return await raster_renderer.render(rendered, width, height)
+    except RenderPoolSaturatedError as e:
+        logger.warning(f"⏳ {e}")
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        ) from e
+
+
+def validate_logo_request(logo_request: LogoGenerationRequest) -> None:
+    """Valide la taille et le type de générateur d'une demande (HTTP 400)"""
+    if logo_request.size not in ALLOWED_SIZES:
+        raise HTTPException(
+            status_code=400,
+            detail="Taille invalide. Utilisez: 50, 100, 200, ou 500",
+        )
+
+    if logo_request.generator_type != "simple":
+        if not generator_factory:
+            raise HTTPException(
+                status_code=500, detail="Factory de générateurs non initialisée"
+            )
+        if logo_request.generator_type not in generator_factory.GENERATOR_TYPES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Type de générateur '{logo_request.generator_type}' non supporté",
+            )
+
+
+def resolve_custom_palette(
+    logo_request: LogoGenerationRequest,
+) -> Optional[CustomPalette]:
+    """Variante personnalisée demandée (None = variante prédéfinie), HTTP 400"""
+    colors = (
+        logo_request.palette.model_dump(exclude_none=True)
+        if logo_request.palette
+        else {}
+    )
+    if (
+        not colors
+        and logo_request.animation_speed is None
+        and logo_request.glow_intensity is None
+    ):
+        return None
+    try:
+        return variants_registry.custom_palette(
+            logo_request.variant,
+            colors,
+            animation_speed=logo_request.animation_speed,
+            glow_intensity=logo_request.glow_intensity,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+def get_warmup_matrix(config: Dict[str, Any]) -> List[Tuple[str, str, int]]:
+    """Matrice (générateur, variante, taille) à pré-rendre"""
+    generators = config["generators"] or ["simple"] + [
+        generator_type
+        for generator_type in LogoGeneratorFactory.GENERATOR_TYPES
+        if generator_type != "default"
+    ]
+    variants = variants_registry.list_variants()
+    return [
+        (generator_type, variant, size)
+        for generator_type in generators
+        for variant in variants
+        for size in config["sizes"]
+    ]
+
+
+async def warm_up_renders(config: Dict[str, Any]) -> None:
+    """Pré-rend la matrice complète dans le cache (et sur disque si demandé)
+
+    Les rendus passent par le pool : la concurrence est bornée par
+    ``max_workers`` pour ne jamais saturer la file de rendu.
+    """
+    matrix = get_warmup_matrix(config)
+    readiness.start(len(matrix))
+    if len(matrix) > render_cache.max_size:
+        logger.warning(
+            f"⚠️ Warm-up de {len(matrix)} rendus > taille du cache "
+            f"({render_cache.max_size}) : une partie sera évincée"
+        )
+    logger.info(f"🔥 Warm-up de {len(matrix)} rendus...")
+    semaphore = asyncio.Semaphore(render_pool.max_workers)
+
+    async def warm(generator_type: str, variant: str, size: int) -> None:
+        async with semaphore:
+            try:
+                await obtain_rendered_logo(
+                    generator_type, variant, size, persist=config["persist"]
+                )
+                readiness.completed += 1
+            except Exception as e:
+                readiness.failed += 1
+                logger.warning(
+                    f"⚠️ Warm-up échoué ({generator_type}/{variant}/{size}): {e}"
+                )
+
+    await asyncio.gather(*(warm(*combo) for combo in matrix))
+    readiness.finish()
+    logger.info(
+        f"✅ Warm-up terminé en {readiness.duration:.2f}s "
+        f"({readiness.completed} rendus, {readiness.failed} échecs)"
+    )
+
+
+BatchOutcome = Tuple[Dict[str, Any], Optional[RenderedSVG]]
+
+
+def dedupe_batch_items(
+    items: List[LogoGenerationRequest],
+) -> List[Tuple[str, str, int, float, Optional[CustomPalette]]]:
+    """Éléments distincts (générateur, variante, taille, densité, palette)
+
+    L'ordre reçu est conservé ; les palettes sont comparées sous forme
+    canonique (une palette invalide rejette le lot, HTTP 400).
+    """
+    return list(
+        dict.fromkeys(
+            (
+                item.generator_type,
+                item.variant,
+                item.size,
+                item.density,
+                resolve_custom_palette(item),
+            )
+            for item in items
+        )
+    )
+
+
+async def render_batch_item(
+    semaphore: asyncio.Semaphore,
+    generator_type: str,
+    variant: str,
+    size: int,
+    density: float = 1.0,
+    palette: Optional[CustomPalette] = None,
+) -> BatchOutcome:
+    """Rend un élément de lot ; les erreurs sont rapportées et non levées"""
+    result: Dict[str, Any] = {
+        "generator_type": generator_type,
+        "variant": variant,
+        "size": size,
+        "density": density,
+    }
+    if palette is not None:
+        result["custom_variant"] = palette.name
+    rendered = None
+    start_time = time.time()
+    try:
+        validate_logo_request(
+            LogoGenerationRequest(
+                variant=variant,
+                size=size,
+                generator_type=generator_type,
+                density=density,
+            )
+        )
+        async with semaphore:
+            start_time = time.time()
+            rendered, _ = await obtain_rendered_logo(
+                generator_type,
+                variant,
+                size,
+                persist=False,
+                density=density,
+                palette=palette,
+            )
+    except HTTPException as e:
+        result.update(success=False, status_code=e.status_code, error=str(e.detail))
+    except Exception as e:
+        metrics.increment_error()
+        result.update(success=False, status_code=500, error=str(e))
+    else:
+        result.update(
+            success=True,
+            status_code=200,
+            digest=rendered.digest,
+            bytes=len(rendered.content),
+        )
+    result["generation_time"] = time.time() - start_time
+    return result, rendered
+
+
+async def stream_batch_ndjson(
+    items: Iterable[Tuple[Any, ...]],
+    render: Callable[..., Awaitable[BatchOutcome]],
+    window: int,
+) -> AsyncIterator[bytes]:
+    """Émet une ligne JSON par élément, dans l'ordre de fin des rendus
+
+    Au plus ``window`` rendus sont en cours : chaque tâche est créée quand
+    une place se libère. En cas d'erreur ou de déconnexion du client, les
+    rendus en cours sont annulés et les éléments restants jamais démarrés.
+    """
+    remaining = iter(items)
+    running: Set[asyncio.Future[BatchOutcome]] = set()
+
+    def start_next() -> None:
+        item = next(remaining, None)
+        if item is not None:
+            running.add(asyncio.ensure_future(render(*item)))
+
+    try:
+        for _ in range(max(1, window)):
+            start_next()
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            running.difference_update(done)
+            for _ in done:
+                start_next()
+            for task in done:
+                result, rendered = task.result()
+                if rendered is not None:
+                    result["svg"] = rendered.content.decode("utf-8")
+                yield (json.dumps(result) + "\n").encode("utf-8")
+    finally:
+        for task in running:
+            task.cancel()
+
+
+def iter_batch_zip_entries(outcomes: List[BatchOutcome]) -> Iterator[PackEntry]:
+    """Entrées ZIP d'un lot : les SVG rendus puis le manifeste"""
+    for result, rendered in outcomes:
+        if rendered is not None:
+            result["filename"] = pack_entry_name(
+                result["generator_type"],
+                result.get("custom_variant", result["variant"]),
+                result["size"],
+                result["density"],
+            )
+            yield result["filename"], rendered.content
+    manifest = {"items": [result for result, _ in outcomes]}
+    yield MANIFEST_NAME, json.dumps(manifest, indent=2).encode("utf-8")
+
+
+async def render_pack_logo(generator_type: str, variant: str, size: int) -> bytes:
+    """Rendu d'un logo du pack : cache de rendu, sinon pool de rendu"""
+    try:
+        rendered, _ = await obtain_rendered_logo(
+            generator_type, variant, size, persist=False
+        )
+    except HTTPException as e:
+        raise RuntimeError(e.detail) from e
+    return rendered.content
+
+
 @app.get("/", response_model=Dict[str, str])
 async def root():
     """Endpoint racine"""
@@ -278,6 +700,8 @@ async def root():
         "version": "1.0.0",
         "docs": "/docs",
         "health": "/health",
+        "ready": "/ready",
+        "pack": "/pack",
     }
 
 
@@ -298,6 +722,16 @@ async def health_check():
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Sonde de préparation : 503 tant que le warm-up n'est pas terminé"""
+    metrics.increment_request(route="/ready")
+    status = readiness.to_dict()
+    if not readiness.ready:
+        return JSONResponse(status_code=503, content=status)
+    return status
+
+
 @app.get("/metrics", response_class=PlainTextResponse)
 async def prometheus_metrics():
     """Endpoint des métriques Prometheus"""
@@ -315,8 +749,7 @@ async def get_available_variants():
     """Récupérer toutes les variantes disponibles"""
     try:
         metrics.increment_request(route="/variants")
-        variants = LogoVariants()
-        return list(variants.get_all_variants().keys())
+        return variants_registry.list_variants()
     except Exception as e:
         logger.error(f"Erreur lors de la récupération des variantes: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -340,12 +773,17 @@ async def get_available_generators():
 async def generate_logo(
     request: Request,
     logo_request: LogoGenerationRequest,
-    background_tasks: BackgroundTasks,
+    inline: bool = Query(
+        False, description="Renvoie le SVG directement (image/svg+xml)"
+    ),
+    output_format: str = Query(
+        "svg", alias="format", description="Format de sortie (svg ou png)"
+    ),
+    scale: float = Query(1.0, gt=0, description="Échelle du PNG (taille × scale)"),
 ):
     """Générer un logo selon les paramètres spécifiés"""
     try:
         metrics.increment_request(route="/generate")
-        start_time = time.time()
 
         if not logo_generator:
             raise HTTPException(status_code=500, detail="Générateur non initialisé")
@@ -354,53 +792,83 @@ async def generate_logo(
             f"🎨 Génération de logo: {logo_request.variant} - {logo_request.size}px - {logo_request.generator_type}"
         )
 
-        # Validation des paramètres
-        if logo_request.size not in [50, 100, 200, 500]:
+        validate_logo_request(logo_request)
+        palette = resolve_custom_palette(logo_request)
+
+        if output_format not in OUTPUT_FORMATS:
             raise HTTPException(
-                status_code=400,
-                detail="Taille invalide. Utilisez: 50, 100, 200, ou 500",
+                status_code=400, detail="Format invalide. Utilisez: svg ou png"
             )
+        wants_png = output_format == "png"
+        if wants_png:
+            if not raster_renderer.available:
+                raise HTTPException(
+                    status_code=501, detail="Rendu PNG indisponible (cairosvg absent)"
+                )
+            try:
+                width, height = raster_renderer.dimensions(logo_request.size, scale)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e)) from e
+
+        # Mode inline : le document est renvoyé directement depuis la mémoire
+        wants_inline = inline or "image/svg+xml" in request.headers.get("accept", "")
 
-        # Génération du logo
         start_time = time.time()
+        rendered, file_path = await obtain_rendered_logo(
+            logo_request.generator_type,
+            logo_request.variant,
+            logo_request.size,
+            persist=not (wants_inline or wants_png),
+            density=logo_request.density,
+            palette=palette,
+        )
 
-        # Utilisation du générateur approprié
-        if logo_request.generator_type != "simple":
-            if not generator_factory:
-                raise HTTPException(
-                    status_code=500, detail="Factory de générateurs non initialisée"
-                )
-            generator = generator_factory.create_generator(logo_request.generator_type)
-            if generator:
-                # Logique spécifique au générateur
-                file_path = generator.generate_svg_logo(
-                    variant_name=logo_request.variant, size=logo_request.size
+        # PNG : toujours renvoyé depuis la mémoire, revalidé avant rastérisation
+        if wants_png:
+            etag = raster_renderer.etag(rendered, width, height)
+            if etag_matches(request.headers.get("if-none-match", ""), etag):
+                return Response(
+                    status_code=304,
+                    headers={
+                        "ETag": etag,
+                        "X-Generation-Time": f"{time.time() - start_time:.6f}",
+                    },
                 )
-            else:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Type de générateur '{logo_request.generator_type}' non supporté",
-                )
-        else:
-            # Générateur simple par défaut
-            file_path = logo_generator.generate_svg_logo(
-                variant_name=logo_request.variant, size=logo_request.size
+            image = await rasterize_logo(rendered, width, height)
+            headers = {
+                "ETag": etag,
+                "X-Generation-Time": f"{time.time() - start_time:.6f}",
+            }
+            return Response(
+                content=image.content, media_type=PNG_MEDIA_TYPE, headers=headers
             )
 
         generation_time = time.time() - start_time
-        metrics.increment_logo_generation(
-            generation_time,
-            variant=logo_request.variant,
-            generator=logo_request.generator_type,
-        )
-        metrics.observe_generation_duration(generation_time)
+
+        if wants_inline:
+            encoding = negotiate_encoding(
+                request.headers.get("accept-encoding", ""), svg_optimizer.encodings
+            )
+            body = rendered.encoded(encoding) if encoding else None
+            etag = f'"{rendered.digest}-{encoding}"' if body else f'"{rendered.digest}"'
+            headers = {
+                "ETag": etag,
+                "X-Generation-Time": f"{generation_time:.6f}",
+                "Vary": "Accept, Accept-Encoding",
+            }
+            if etag_matches(request.headers.get("if-none-match", ""), etag):
+                return Response(status_code=304, headers=headers)
+            if body is not None:
+                headers["Content-Encoding"] = encoding
+            return Response(
+                content=body if body is not None else rendered.content,
+                media_type="image/svg+xml",
+                headers=headers,
+            )
 
         # Le fichier est déjà créé par le générateur
         filename = file_path.name
 
-        # Nettoyage en arrière-plan
-        background_tasks.add_task(cleanup_old_files)
-
         logger.info(f"✅ Logo généré avec succès: {filename} en {generation_time:.2f}s")
 
         return LogoGenerationResponse(
@@ -426,17 +894,165 @@ async def generate_logo(
         ) from e
 
 
+@app.post("/generate/batch")
+@limiter.limit("10/minute")
+async def generate_logo_batch(
+    request: Request,
+    batch_request: LogoBatchRequest,
+    output_format: str = Query(
+        "ndjson",
+        alias="format",
+        description="ndjson (une ligne par logo, au fil des rendus) ou zip",
+    ),
+):
+    """Générer plusieurs logos en une requête (rendus concurrents)"""
+    route = "/generate/batch"
+    metrics.increment_request(route=route)
+    try:
+        if output_format not in ("ndjson", "zip"):
+            raise HTTPException(
+                status_code=400, detail="Format invalide. Utilisez: ndjson ou zip"
+            )
+        items = dedupe_batch_items(batch_request.items)
+        if len(items) > batch_config["max_items"]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Lot trop grand: {len(items)} éléments distincts "
+                f"(maximum {batch_config['max_items']})",
+            )
+    except HTTPException as http_exc:
+        metrics.record_response_status(route=route, status_code=http_exc.status_code)
+        raise
+
+    logger.info(f"🎨 Génération par lot: {len(items)} logos ({output_format})")
+    # Concurrence bornée par le pool : le lot ne sature jamais la file de rendu
+    semaphore = asyncio.Semaphore(render_pool.max_workers)
+    headers = {
+        "X-Batch-Items": str(len(items)),
+        "X-Batch-Duplicates": str(len(batch_request.items) - len(items)),
+    }
+    metrics.record_response_status(route=route, status_code=200)
+
+    if output_format == "zip":
+        outcomes = list(
+            await asyncio.gather(
+                *(render_batch_item(semaphore, *item) for item in items)
+            )
+        )
+        headers["Content-Disposition"] = 'attachment; filename="arkalia-luna-batch.zip"'
+        return StreamingResponse(
+            stream_zip(iter_batch_zip_entries(outcomes)),
+            media_type="application/zip",
+            headers=headers,
+        )
+    return StreamingResponse(
+        stream_batch_ndjson(
+            items, partial(render_batch_item, semaphore), render_pool.max_workers
+        ),
+        media_type="application/x-ndjson",
+        headers=headers,
+    )
+
+
+@app.get("/pack")
+@limiter.limit("10/minute")
+async def download_pack(
+    request: Request,
+    generators: List[str] = Query(["simple"], description="Types de générateur"),
+    variants: Optional[List[str]] = Query(None, description="Variantes (toutes)"),
+    sizes: List[int] = Query(ALLOWED_SIZES, description="Tailles en pixels"),
+    compression: str = Query("deflated", description="deflated ou stored"),
+):
+    """Télécharger le pack de logos en ZIP, rendu et compressé en flux
+
+    Rien n'est écrit dans exports/ : chaque logo est rendu (ou lu dans le
+    cache) au moment où son entrée est émise.
+    """
+    route = "/pack"
+    metrics.increment_request(route=route)
+    try:
+        if compression not in COMPRESSION_METHODS:
+            raise HTTPException(
+                status_code=400,
+                detail="Compression invalide. Utilisez: deflated ou stored",
+            )
+        available_variants = variants_registry.list_variants()
+        unknown = set(variants or []) - set(available_variants)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Variante(s) inconnue(s): {', '.join(sorted(unknown))}",
+            )
+        matrix = pack_matrix(generators, variants or available_variants, sizes)
+        for generator_type, variant, size in matrix:
+            validate_logo_request(
+                LogoGenerationRequest(
+                    variant=variant, size=size, generator_type=generator_type
+                )
+            )
+    except HTTPException as http_exc:
+        metrics.record_response_status(route=route, status_code=http_exc.status_code)
+        raise
+
+    logger.info(f"📦 Pack de {len(matrix)} logos ({compression})")
+    metrics.record_response_status(route=route, status_code=200)
+    # Chaque entrée attend son rendu (pool de rendu) avant d'être compressée
+    return StreamingResponse(
+        stream_zip_async(
+            iter_pack_entries_async(matrix, render_pack_logo), compression
+        ),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": 'attachment; filename="arkalia-luna-pack.zip"',
+            "X-Pack-Items": str(len(matrix)),
+        },
+    )
+
+
 @app.get("/download/{filename}")
-async def download_logo(filename: str):
-    """Télécharger un logo généré"""
+async def download_logo(filename: str, request: Request):
+    """Télécharger un logo généré (variante pré-compressée si acceptée)
+
+    Les artefacts adressés par contenu sont servis avec un ETag fort dérivé
+    de leur nom et ``Cache-Control: immutable`` ; les autres fichiers sont
+    revalidés à chaque usage (ETag calculé depuis taille et date).
+    """
     try:
-        file_path = Path("exports") / filename
+        file_path = EXPORT_DIR / filename
 
-        if not file_path.exists():
+        if Path(filename).name != filename or not file_path.is_file():
             raise HTTPException(status_code=404, detail="Fichier non trouvé")
 
+        artifact = ARTIFACT_NAME.match(filename)
+        stat = file_path.stat()
+        if artifact:
+            etag = artifact.group("digest")
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        else:
+            etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+            cache_control = "no-cache"
+
+        headers = {"Vary": "Accept-Encoding", "Cache-Control": cache_control}
+        encoding = negotiate_encoding(
+            request.headers.get("accept-encoding", ""), svg_optimizer.encodings
+        )
+        if encoding and file_path.suffix == ".svg":
+            compressed_path = precompressed_path(file_path, encoding)
+            if compressed_path.exists():
+                headers["Content-Encoding"] = encoding
+                file_path = compressed_path
+                etag = f"{etag}-{encoding}"
+        headers["ETag"] = f'"{etag}"'
+
+        if etag_matches(request.headers.get("if-none-match", ""), headers["ETag"]):
+            headers.pop("Content-Encoding", None)
+            return Response(status_code=304, headers=headers)
+
         return FileResponse(
-            path=file_path, filename=filename, media_type="image/svg+xml"
+            path=file_path,
+            filename=filename,
+            media_type="image/svg+xml",
+            headers=headers,
         )
 
     except HTTPException:
@@ -457,7 +1073,12 @@ async def get_generation_stats():
                 "variants_used": stats.get("variants", {}),
                 "sizes_used": stats.get("sizes", {}),
                 "last_generation": stats.get("last_generation"),
-                "cache_hits": stats.get("cache_hits", 0),
+                "cache_hits": render_cache.hits,
+                "render_cache": render_cache.get_stats(),
+                "raster": raster_renderer.get_stats(),
+                "custom_variants": custom_variants.get_stats(),
+                "render_pool": render_pool.get_stats(),
+                "exports": export_index.get_stats(),
             }
         return {"error": "Générateur non initialisé"}
 
@@ -472,6 +1093,7 @@ async def cleanup_files():
     try:
         if logo_generator:
             count = logo_generator.cleanup_generated_files()
+            export_index.scan(logo_generator.output_dir)
             return {"message": f"{count} fichiers nettoyés", "cleaned_count": count}
         return {"error": "Générateur non initialisé"}
 
@@ -480,21 +1102,30 @@ async def cleanup_files():
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-async def cleanup_old_files():
-    """Nettoyage automatique des anciens fichiers"""
-    try:
-        # Supprimer les fichiers de plus de 24h
-        exports_dir = Path("exports")
-        if exports_dir.exists():
-            current_time = datetime.now()
-            for file_path in exports_dir.glob("*.svg"):
-                if (
-                    current_time - datetime.fromtimestamp(file_path.stat().st_mtime)
-                ).days > 1:
-                    file_path.unlink()
-                    logger.info(f"🗑️ Fichier ancien supprimé: {file_path.name}")
-    except Exception as e:
-        logger.error(f"Erreur lors du nettoyage automatique: {e}")
+async def cleanup_exports() -> Dict[str, int]:
+    """Évince les exports trop anciens ou hors budget (suppressions hors boucle)"""
+    loop = asyncio.get_event_loop()
+    evicted = await loop.run_in_executor(None, export_index.evict)
+    metrics.increment_export_evictions(
+        evicted["age"], evicted["budget"], evicted["bytes"]
+    )
+    metrics.set_export_usage(len(export_index), export_index.total_bytes)
+    if evicted["age"] or evicted["budget"]:
+        logger.info(
+            f"🗑️ Exports évincés: {evicted['age']} anciens, "
+            f"{evicted['budget']} hors budget ({evicted['bytes']} octets)"
+        )
+    return evicted
+
+
+async def run_export_cleanup(interval: float) -> None:
+    """Tâche de fond unique : éviction périodique des exports"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await cleanup_exports()
+        except Exception as e:
+            logger.error(f"Erreur lors du nettoyage automatique: {e}")
 
 
 if __name__ == "__main__":
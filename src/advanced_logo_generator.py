@@ -18,17 +18,24 @@ except ImportError:
 class AdvancedArkaliaLunaLogo(ArkaliaLunaLogo):
     """Générateur principal des logos Arkalia-LUNA avec rendu exceptionnel"""
 
+    # Préfixe des fichiers SVG produits
+    logo_prefix = "arkalia-luna-advanced"
+
+    # Builder SVG spécialisé (instance partagée, voir builder_registry)
+    builder_class = AdvancedSVGBuilder
+
+    # Niveau de complexité de référence (densité inchangée)
+    DEFAULT_COMPLEXITY_LEVEL = 0.9
+
     def __init__(self, output_dir: Optional[Path] = None):
         # Appel du constructeur parent avec répertoire spécialisé
         super().__init__(output_dir or Path("exports-advanced"))
 
-        # Remplace le SVG builder par défaut par l'Advanced
-        self.svg_builder = AdvancedSVGBuilder(self.variants_manager)
         self.logger.info("🎨 Advanced Generator initialisé avec succès")
 
         # Configuration avancée spécialisée
         self.advanced_effects = True
-        self.complexity_level = 0.9
+        self.complexity_level = self.DEFAULT_COMPLEXITY_LEVEL
         self.quality_boost = True
 
     def generate_advanced_svg_logo(self, variant_name: str, size: int = 200) -> Path:
@@ -44,9 +51,7 @@ class AdvancedArkaliaLunaLogo(ArkaliaLunaLogo):
                 raise ValueError(f"Variante '{variant_name}' non reconnue")
 
             # Construction du chemin de sortie
-            output_path = (
-                self.output_dir / f"arkalia-luna-advanced-{variant_name}-{size}.svg"
-            )
+            output_path = self.get_logo_path(variant_name, size)
 
             # Génération et sauvegarde avec le builder avancé
             self.svg_builder.save_advanced_logo(variant_name, size, output_path)
@@ -114,10 +119,15 @@ class AdvancedArkaliaLunaLogo(ArkaliaLunaLogo):
         self.advanced_effects = enabled
         self.logger.info(f"🎨 Effets avancés: {'activés' if enabled else 'désactivés'}")
 
+    def complexity_factor(self) -> float:
+        """Le niveau de complexité module la densité (1.0 à 0.9)"""
+        return self.complexity_level / self.DEFAULT_COMPLEXITY_LEVEL
+
     def set_complexity_level(self, level: float) -> None:
         """Configure le niveau de complexité (0.1 à 1.0)"""
         if 0.1 <= level <= 1.0:
             self.complexity_level = level
+            self._apply_density()
             self.logger.info(f"🎯 Complexité avancée: {level:.2f}")
         else:
             raise ValueError("Niveau de complexité doit être entre 0.1 et 1.0")
@@ -18,12 +18,16 @@ except ImportError:
 class AIMoonLogoGenerator(ArkaliaLunaLogo):
     """Générateur de la LUNE IA VIVANTE ultra-réaliste et organique"""
 
+    # Préfixe des fichiers SVG produits
+    logo_prefix = "arkalia-luna-ai-moon"
+
+    # Builder SVG spécialisé (instance partagée, voir builder_registry)
+    builder_class = AIMoonSVGBuilder
+
     def __init__(self, output_dir: Optional[Path] = None):
         # Appel du constructeur parent avec répertoire spécialisé
         super().__init__(output_dir or Path("exports-ai-moon"))
 
-        # Remplace le SVG builder par défaut par l'AI Moon
-        self.svg_builder = AIMoonSVGBuilder(self.variants_manager)
         self.logger.info("🌙 AI Moon Generator initialisé avec succès")
 
         # Configuration IA spécialisée
@@ -44,9 +48,7 @@ class AIMoonLogoGenerator(ArkaliaLunaLogo):
                 raise ValueError(f"Variante '{variant_name}' non reconnue")
 
             # Construction du chemin de sortie
-            output_path = (
-                self.output_dir / f"arkalia-luna-ai-moon-{variant_name}-{size}.svg"
-            )
+            output_path = self.get_logo_path(variant_name, size)
 
             # Génération et sauvegarde avec le builder LUNE IA
             self.svg_builder.save_ai_moon_logo(variant_name, size, output_path)
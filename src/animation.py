@@ -0,0 +1,313 @@
+"""
+🌙 Animation Module
+Export animé (GIF, APNG, WebP) : évaluation des <animate> et encodage en mémoire
+"""
+
+import io
+import math
+import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from PIL import Image, features
+
+try:
+    from .raster_renderer import RasterBackend, rasterize_svg
+    from .svg_optimizer import SVG_NS, XML_DECLARATION
+except ImportError:
+    # Fallback pour exécution directe
+    from raster_renderer import RasterBackend, rasterize_svg
+    from svg_optimizer import SVG_NS, XML_DECLARATION
+
+ANIMATE_TAG = f"{{{SVG_NS}}}animate"
+
+# Format -> (format Pillow, type MIME, extension)
+ANIMATION_FORMATS: Dict[str, Tuple[str, str, str]] = {
+    "gif": ("GIF", "image/gif", ".gif"),
+    "apng": ("PNG", "image/apng", ".png"),
+    "webp": ("WEBP", "image/webp", ".webp"),
+}
+
+# Boucle la plus longue acceptée pour un bouclage parfait (secondes)
+MAX_LOOP_DURATION = 12.0
+
+# Index de palette réservé à la transparence (GIF)
+GIF_TRANSPARENT_INDEX = 255
+
+_CLOCK = re.compile(r"^\s*(-?[\d.]+(?:[eE][-+]?\d+)?)\s*(ms|s|min|h)?\s*$")
+_CLOCK_UNITS = {None: 1.0, "s": 1.0, "ms": 0.001, "min": 60.0, "h": 3600.0}
+
+
+def parse_clock(value: str) -> float:
+    """Valeur d'horloge SMIL (``2.5s``, ``500ms``…) en secondes"""
+    match = _CLOCK.match(value)
+    if match is None:
+        raise ValueError(f"Valeur d'horloge non prise en charge : '{value}'")
+    return float(match.group(1)) * _CLOCK_UNITS[match.group(2)]
+
+
+def _format_number(value: float) -> str:
+    text = f"{value:.4f}".rstrip("0").rstrip(".")
+    return "0" if text in ("-0", "") else text
+
+
+def _interpolate(start: str, end: str, fraction: float) -> str:
+    """Interpolation linéaire de deux valeurs (discrète si non numériques)"""
+    try:
+        a, b = float(start), float(end)
+    except ValueError:
+        return start if fraction < 1 else end
+    return _format_number(a + (b - a) * fraction)
+
+
+@dataclass(frozen=True)
+class Timeline:
+    """Chronologie d'un élément ``<animate>`` (sous-ensemble SMIL)
+
+    Pris en charge : ``values`` ou ``from``/``to``, ``dur``, ``begin``
+    (décalage), ``repeatCount``, ``keyTimes``, ``calcMode`` linéaire ou
+    discret (``spline`` et ``paced`` sont interpolés linéairement) et
+    ``fill="freeze"``.
+    """
+
+    attribute: str
+    values: Tuple[str, ...]
+    duration: float
+    begin: float = 0.0
+    repeat: Optional[float] = None  # None = indefinite
+    key_times: Optional[Tuple[float, ...]] = None
+    discrete: bool = False
+    freeze: bool = False
+
+    @classmethod
+    def from_element(
+        cls, element: ET.Element, base: Optional[str] = None
+    ) -> Optional["Timeline"]:
+        """Chronologie d'un élément ; None si elle n'est pas évaluable"""
+        attribute = element.get("attributeName")
+        duration = element.get("dur")
+        if attribute is None or duration in (None, "indefinite"):
+            return None
+        if element.get("values") is not None:
+            values = tuple(v.strip() for v in element.get("values", "").split(";"))
+        else:
+            start = element.get("from", base)
+            if start is None or element.get("to") is None:
+                return None
+            values = (start, element.get("to", ""))
+        repeat = element.get("repeatCount", "1")
+        key_times = element.get("keyTimes")
+        try:
+            return cls(
+                attribute=attribute,
+                values=values,
+                duration=parse_clock(duration),  # type: ignore[arg-type]
+                begin=parse_clock(element.get("begin", "0s")),
+                repeat=None if repeat == "indefinite" else float(repeat),
+                key_times=(
+                    tuple(float(k) for k in key_times.split(";")) if key_times else None
+                ),
+                discrete=element.get("calcMode") == "discrete",
+                freeze=element.get("fill") == "freeze",
+            )
+        except ValueError:
+            return None
+
+    def value_at(self, time: float) -> Optional[str]:
+        """Valeur à l'instant ``time`` ; None hors de la période active"""
+        local = time - self.begin
+        if local < 0 or self.duration <= 0:
+            return None
+        if self.repeat is not None and local >= self.repeat * self.duration:
+            return self.values[-1] if self.freeze else None
+        return self._sample((local % self.duration) / self.duration)
+
+    def _sample(self, fraction: float) -> str:
+        values = self.values
+        if len(values) == 1:
+            return values[0]
+        count = len(values)
+        if self.key_times is not None and len(self.key_times) == count:
+            keys: Sequence[float] = self.key_times
+        elif self.discrete:
+            keys = [i / count for i in range(count)]
+        else:
+            keys = [i / (count - 1) for i in range(count)]
+        index = max((i for i, key in enumerate(keys) if key <= fraction), default=0)
+        if self.discrete or index == count - 1:
+            return values[index]
+        span = keys[index + 1] - keys[index]
+        local = (fraction - keys[index]) / span if span > 0 else 1.0
+        return _interpolate(values[index], values[index + 1], local)
+
+
+class AnimatedSVG:
+    """Document SVG figé à un instant donné
+
+    Le document est analysé une fois ; chaque image ne fait que réaffecter
+    les attributs animés puis sérialiser l'arbre (sans ``<animate>``).
+    """
+
+    def __init__(self, svg: bytes):
+        self.root = ET.fromstring(svg)
+        parents = {child: parent for parent in self.root.iter() for child in parent}
+        self.timelines: List[Tuple[ET.Element, Timeline]] = []
+        self._base: Dict[Tuple[int, str], Tuple[ET.Element, Optional[str]]] = {}
+        for element in list(self.root.iter(ANIMATE_TAG)):
+            parent = parents[element]
+            parent.remove(element)
+            attribute = element.get("attributeName", "")
+            timeline = Timeline.from_element(element, parent.get(attribute))
+            if timeline is None:
+                continue
+            self.timelines.append((parent, timeline))
+            self._base.setdefault(
+                (id(parent), attribute), (parent, parent.get(attribute))
+            )
+
+    def loop_duration(self, max_duration: float = MAX_LOOP_DURATION) -> float:
+        """Durée d'une boucle parfaite (PPCM des durées, en ms)
+
+        Au-delà de ``max_duration``, la durée la plus longue est retenue.
+        """
+        durations = {round(t.duration * 1000) for _, t in self.timelines}
+        durations.discard(0)
+        if not durations:
+            return 0.0
+        period = math.lcm(*durations) / 1000
+        return period if period <= max_duration else max(durations) / 1000
+
+    def frame(self, time: float) -> bytes:
+        """Document statique à l'instant ``time`` (secondes)"""
+        for (_, attribute), (element, base) in self._base.items():
+            if base is None:
+                element.attrib.pop(attribute, None)
+            else:
+                element.set(attribute, base)
+        # Ordre du document : la dernière animation d'un attribut l'emporte
+        for element, timeline in self.timelines:
+            value = timeline.value_at(time)
+            if value is not None:
+                element.set(timeline.attribute, value)
+        svg = XML_DECLARATION + ET.tostring(self.root, encoding="unicode")
+        return svg.encode("utf-8")
+
+
+def frame_times(duration: float, fps: float) -> List[float]:
+    """Instants des images d'une boucle (au moins une image)"""
+    if fps <= 0:
+        raise ValueError("Le nombre d'images par seconde doit être positif")
+    count = max(1, round(duration * fps))
+    return [index / fps for index in range(count)]
+
+
+def rasterize_frames(
+    svg: bytes,
+    times: Sequence[float],
+    size: int,
+    rasterize: RasterBackend = rasterize_svg,
+) -> List[bytes]:
+    """PNG des images d'une portion de la chronologie (worker du pool)"""
+    animated = AnimatedSVG(svg)
+    return [rasterize(animated.frame(time), size, size) for time in times]
+
+
+def render_frames(
+    svg: bytes,
+    times: Sequence[float],
+    size: int,
+    workers: int = 1,
+    rasterize: RasterBackend = rasterize_svg,
+) -> List[Image.Image]:
+    """Rastérise les images, réparties par blocs contigus sur un pool"""
+    workers = max(1, min(workers, len(times)))
+    if workers == 1:
+        pngs = rasterize_frames(svg, times, size, rasterize)
+    else:
+        step = math.ceil(len(times) / workers)
+        chunks = [times[i : i + step] for i in range(0, len(times), step)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                rasterize_frames,
+                [svg] * len(chunks),
+                chunks,
+                [size] * len(chunks),
+                [rasterize] * len(chunks),
+            )
+            pngs = [png for chunk in results for png in chunk]
+    return [Image.open(io.BytesIO(png)).convert("RGBA") for png in pngs]
+
+
+def shared_palette(frames: Sequence[Image.Image], colors: int = 255) -> Image.Image:
+    """Palette commune à toutes les images (quantification d'une mosaïque)"""
+    width, height = frames[0].size
+    sample = frames[:: max(1, len(frames) // 16)]
+    mosaic = Image.new("RGB", (width, height * len(sample)))
+    for index, frame in enumerate(sample):
+        mosaic.paste(frame.convert("RGB"), (0, index * height))
+    return mosaic.quantize(colors=colors, method=Image.MEDIANCUT)
+
+
+def _gif_frames(frames: Sequence[Image.Image]) -> List[Image.Image]:
+    """Images en palette partagée, pixels transparents sur l'index réservé"""
+    palette = shared_palette(frames, GIF_TRANSPARENT_INDEX)
+    indexed = []
+    for frame in frames:
+        image = frame.convert("RGB").quantize(
+            palette=palette, dither=Image.FLOYDSTEINBERG
+        )
+        transparent = frame.getchannel("A").point(lambda a: 255 if a < 128 else 0)
+        image.paste(GIF_TRANSPARENT_INDEX, mask=transparent)
+        indexed.append(image)
+    return indexed
+
+
+def encode_animation(
+    frames: Sequence[Image.Image], fps: float, output_format: str = "gif"
+) -> bytes:
+    """Encode des images RGBA en animation bouclée (GIF, APNG ou WebP)"""
+    if output_format not in ANIMATION_FORMATS:
+        raise ValueError(
+            f"Format '{output_format}' inconnu. "
+            f"Utilisez: {', '.join(ANIMATION_FORMATS)}"
+        )
+    if output_format == "webp" and not features.check("webp_anim"):
+        raise ValueError("WebP animé non pris en charge par Pillow")
+    pil_format = ANIMATION_FORMATS[output_format][0]
+    options: Dict[str, object] = {"duration": round(1000 / fps), "loop": 0}
+    images = list(frames)
+    if output_format == "gif":
+        images = _gif_frames(images)
+        options.update(transparency=GIF_TRANSPARENT_INDEX, disposal=2)
+    elif output_format == "apng":
+        options.update(blend=0)  # APNG_BLEND_OP_SOURCE : images indépendantes
+    else:
+        options.update(quality=90, method=4)
+    buffer = io.BytesIO()
+    images[0].save(
+        buffer, pil_format, save_all=True, append_images=images[1:], **options
+    )
+    return buffer.getvalue()
+
+
+def export_animation(
+    svg: bytes,
+    size: int,
+    output_format: str = "gif",
+    fps: float = 15,
+    duration: Optional[float] = None,
+    workers: int = 1,
+    rasterize: RasterBackend = rasterize_svg,
+) -> bytes:
+    """Animation d'un logo SVG : chronologies évaluées image par image
+
+    Sans ``duration``, la boucle couvre le PPCM des durées des animations
+    (ou la plus longue d'entre elles au-delà de ``MAX_LOOP_DURATION``).
+    """
+    if duration is None:
+        duration = AnimatedSVG(svg).loop_duration()
+    times = frame_times(duration, fps)
+    frames = render_frames(svg, times, size, workers, rasterize)
+    return encode_animation(frames, fps, output_format)
@@ -0,0 +1,66 @@
+"""
+🌙 Builder Registry Module
+Builders SVG partagés : une instance par type, créée à la première demande
+"""
+
+import threading
+from typing import Any, Dict, Optional, Type
+
+try:
+    from .svg_builder import SVGBuilder
+    from .variants import variants_registry
+except ImportError:
+    # Fallback pour exécution directe
+    from svg_builder import SVGBuilder
+    from variants import variants_registry
+
+# Types simplifiés pour éviter les conflits
+LogoVariants = Any
+
+
+class BuilderRegistry:
+    """Registre des builders SVG partagés par tous les générateurs
+
+    Un rendu ne modifie jamais un builder : la densité et l'optimisation
+    propres à un générateur s'appliquent sur une copie (``with_density``,
+    ``with_optimizer``). Une seule instance par type suffit donc, quel que
+    soit le nombre de générateurs ou de threads.
+    """
+
+    def __init__(self, variants_manager: Optional[LogoVariants] = None):
+        self.variants_manager = variants_manager or variants_registry
+        self._builders: Dict[Type[SVGBuilder], SVGBuilder] = {}
+        self._lock = threading.Lock()
+
+    def get(self, builder_class: Type[SVGBuilder]) -> SVGBuilder:
+        """Builder partagé d'un type (créé à la première demande)"""
+        builder = self._builders.get(builder_class)
+        if builder is None:
+            with self._lock:
+                builder = self._builders.get(builder_class)
+                if builder is None:
+                    builder = builder_class(self.variants_manager)
+                    self._builders[builder_class] = builder
+        return builder
+
+    def clear(self) -> None:
+        """Oublie les builders créés"""
+        with self._lock:
+            self._builders.clear()
+
+    def __contains__(self, builder_class: object) -> bool:
+        return builder_class in self._builders
+
+    def __len__(self) -> int:
+        return len(self._builders)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne les statistiques du registre"""
+        return {
+            "builders": len(self._builders),
+            "types": sorted(cls.__name__ for cls in self._builders),
+        }
+
+
+# Registre partagé par tous les générateurs
+builder_registry = BuilderRegistry()
@@ -3,18 +3,41 @@
 Interface en ligne de commande pour la génération de logos
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import click
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import track
+from rich.progress import Progress, track
 from rich.table import Table
 from rich.text import Text
 
+from .animation import ANIMATION_FORMATS, export_animation
+from .converter import ConversionJob, convert_svgs, find_sources
+from .favicon import FAVICON_SIZES
+from .generator_factory import LogoGeneratorFactory
 from .logo_generator import ArkaliaLunaLogo
+from .pack import (
+    COMPRESSION_METHODS,
+    iter_pack_entries,
+    pack_matrix,
+    render_pack_logo,
+    stream_zip,
+)
+from .raster_renderer import raster_available
+from .svg_optimizer import SVGOptimizer
+
+try:
+    from config.production import ProductionConfig
+
+    DEFAULT_WORKERS = ProductionConfig.MAX_WORKERS
+except ImportError:
+    # Configuration absente (paquet installé seul)
+    DEFAULT_WORKERS = os.cpu_count() or 1
 
 # Configuration Rich
 console = Console()
@@ -51,14 +74,47 @@ def print_info(message: str):
     "--output-dir", "-o", type=click.Path(), help="Répertoire de sortie personnalisé"
 )
 @click.option("--verbose", "-v", is_flag=True, help="Mode verbeux")
+@click.option(
+    "--optimize",
+    "-O",
+    "optimization_level",
+    type=click.IntRange(0, 3),
+    default=0,
+    show_default=True,
+    help="Niveau d'optimisation des SVG écrits (0-3)",
+)
+@click.option(
+    "--compress", is_flag=True, help="Écrit aussi les variantes .svgz (et .br)"
+)
+@click.option(
+    "--density",
+    "-d",
+    type=click.FloatRange(min=0, min_open=True),
+    default=1.0,
+    show_default=True,
+    help="Densité des particules, rayons et nœuds (1.0 = standard)",
+)
 @click.pass_context
-def cli(ctx, output_dir: Optional[str], verbose: bool):
+def cli(
+    ctx,
+    output_dir: Optional[str],
+    verbose: bool,
+    optimization_level: int,
+    compress: bool,
+    density: float,
+):
     """🌙 Arkalia-LUNA Logo Generator - Interface CLI professionnelle"""
     ctx.ensure_object(dict)
 
     # Configuration du contexte
     ctx.obj["output_dir"] = Path(output_dir) if output_dir else Path("exports")
     ctx.obj["verbose"] = verbose
+    ctx.obj["density"] = density
+    ctx.obj["optimizer"] = (
+        SVGOptimizer(level=optimization_level, compress=compress)
+        if optimization_level or compress
+        else None
+    )
 
     # Affichage de la bannière
     print_banner()
@@ -66,6 +122,8 @@ def cli(ctx, output_dir: Optional[str], verbose: bool):
     # Initialisation du générateur
     try:
         ctx.obj["generator"] = ArkaliaLunaLogo(ctx.obj["output_dir"])
+        ctx.obj["generator"].set_optimizer(ctx.obj["optimizer"])
+        ctx.obj["generator"].set_density(density)
         if verbose:
             print_info(f"Répertoire de sortie : {ctx.obj['output_dir']}")
     except Exception as e:
@@ -145,42 +203,126 @@ def generate(ctx, variant: str, size: int, output: Optional[str]):
         sys.exit(1)
 
 
+def render_job(
+    generator_type: str,
+    variant: str,
+    size: int,
+    output_dir: Path,
+    optimizer: Optional[SVGOptimizer] = None,
+    density: float = 1.0,
+) -> Path:
+    """Génère un logo de la matrice (exécuté dans un processus du pool)"""
+    generator = LogoGeneratorFactory.create_generator(generator_type, output_dir)
+    generator.set_optimizer(optimizer)
+    generator.set_density(density)
+    return generator.generate_svg_logo(variant, size)
+
+
 @cli.command()
-@click.option("--size", "-s", default=200, help="Taille des logos en pixels")
 @click.option(
-    "--parallel", "-p", is_flag=True, help="Génération parallèle (si supportée)"
+    "--size",
+    "-s",
+    type=int,
+    multiple=True,
+    default=[200],
+    show_default=True,
+    help="Taille des logos en pixels (option répétable)",
+)
+@click.option(
+    "--generator",
+    "-g",
+    "generator_types",
+    type=click.Choice(list(LogoGeneratorFactory.GENERATOR_TYPES)),
+    multiple=True,
+    default=["default"],
+    show_default=True,
+    help="Type de générateur (option répétable)",
+)
+@click.option(
+    "--parallel", "-p", is_flag=True, help="Génération parallèle (pool de processus)"
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+    help="Nombre de processus en mode parallèle",
 )
 @click.pass_context
-def generate_all(ctx, size: int, parallel: bool):
-    """Génère toutes les variantes du logo"""
+def generate_all(
+    ctx,
+    size: Tuple[int, ...],
+    generator_types: Tuple[str, ...],
+    parallel: bool,
+    workers: int,
+):
+    """Génère toutes les variantes du logo (générateurs × variantes × tailles)"""
     try:
         generator = ctx.obj["generator"]
+        output_dir = ctx.obj["output_dir"]
+        optimizer = ctx.obj["optimizer"]
+        density = ctx.obj["density"]
         variants = generator.list_all_variants()
-
+        jobs = [
+            (generator_type, variant, logo_size)
+            for generator_type in dict.fromkeys(generator_types)
+            for variant in variants
+            for logo_size in dict.fromkeys(size)
+        ]
+
+        mode = f"{workers} processus" if parallel else "séquentiel"
         console.print(
-            f"[bold blue]🎨 Génération de {len(variants)} variantes "
-            f"en taille {size}x{size}...[/bold blue]"
+            f"[bold blue]🎨 Génération de {len(jobs)} logos "
+            f"({len(variants)} variantes, tailles {', '.join(map(str, size))}) "
+            f"- {mode}...[/bold blue]"
         )
 
-        # Génération avec barre de progression
-        generated_files = []
-        for variant in track(variants, description="Génération des logos"):
-            try:
-                output_path = generator.generate_svg_logo(variant, size)
+        generated_files: List[Path] = []
+
+        def report(job: Tuple[str, str, int], output_path: Optional[Path], error=None):
+            generator_type, variant, logo_size = job
+            label = f"{generator_type}/{variant}/{logo_size}"
+            if error is None and output_path is not None:
                 generated_files.append(output_path)
-                console.print(f"[green]✅[/green] {variant} : {output_path.name}")
-            except Exception as e:
-                console.print(f"[red]❌[/red] {variant} : {e}")
+                console.print(f"[green]✅[/green] {label} : {output_path.name}")
+            else:
+                console.print(f"[red]❌[/red] {label} : {error}")
+
+        if parallel:
+            # Barre de progression pilotée par les fins de rendu
+            with Progress(console=console) as progress, ProcessPoolExecutor(
+                max_workers=workers
+            ) as executor:
+                task = progress.add_task("Génération des logos", total=len(jobs))
+                futures = {
+                    executor.submit(
+                        render_job, *job, output_dir, optimizer, density
+                    ): job
+                    for job in jobs
+                }
+                for future in as_completed(futures):
+                    try:
+                        report(futures[future], future.result())
+                    except Exception as e:
+                        report(futures[future], None, e)
+                    progress.advance(task)
+        else:
+            for job in track(jobs, description="Génération des logos"):
+                try:
+                    report(job, render_job(*job, output_dir, optimizer, density))
+                except Exception as e:
+                    report(job, None, e)
 
         # Résumé
         console.print("\n[bold green]🎉 Génération terminée ![/bold green]")
-        console.print(f"📁 {len(generated_files)}/{len(variants)} logos générés")
-        console.print(f"📂 Répertoire : {generator.get_output_directory()}")
+        console.print(f"📁 {len(generated_files)}/{len(jobs)} logos générés")
+        console.print(f"📂 Répertoire : {output_dir}")
 
         # Affichage des fichiers
         if generated_files:
             console.print("\n📋 Fichiers générés :")
-            for file_path in generated_files:
+            for file_path in sorted(generated_files):
                 console.print(f"  • {file_path.name}")
 
     except Exception as e:
@@ -188,6 +330,158 @@ def generate_all(ctx, size: int, parallel: bool):
         sys.exit(1)
 
 
+@cli.command()
+@click.option(
+    "--output",
+    "-o",
+    "output",
+    type=click.Path(dir_okay=False),
+    default="arkalia-luna-pack.zip",
+    show_default=True,
+    help="Archive ZIP produite",
+)
+@click.option(
+    "--size",
+    "-s",
+    type=int,
+    multiple=True,
+    default=[200],
+    show_default=True,
+    help="Taille des logos en pixels (option répétable)",
+)
+@click.option(
+    "--generator",
+    "-g",
+    "generator_types",
+    type=click.Choice(list(LogoGeneratorFactory.GENERATOR_TYPES)),
+    multiple=True,
+    default=["default"],
+    show_default=True,
+    help="Type de générateur (option répétable)",
+)
+@click.option(
+    "--compression",
+    type=click.Choice(list(COMPRESSION_METHODS)),
+    default="deflated",
+    show_default=True,
+    help="Méthode de compression des entrées",
+)
+@click.pass_context
+def pack(
+    ctx,
+    output: str,
+    size: Tuple[int, ...],
+    generator_types: Tuple[str, ...],
+    compression: str,
+):
+    """Exporte le pack de logos dans une archive ZIP (sans passer par le disque)"""
+    try:
+        optimizer = ctx.obj["optimizer"]
+        density = ctx.obj["density"]
+        variants = ctx.obj["generator"].list_all_variants()
+        matrix = pack_matrix(generator_types, variants, size)
+        failures: List[str] = []
+
+        def render(generator_type: str, variant: str, logo_size: int) -> bytes:
+            return render_pack_logo(
+                generator_type, variant, logo_size, optimizer, density
+            )
+
+        def report(item: dict) -> None:
+            if not item["success"]:
+                failures.append(
+                    f"{item['generator_type']}/{item['variant']}/{item['size']} "
+                    f": {item['error']}"
+                )
+            progress.advance(task)
+
+        console.print(
+            f"[bold blue]📦 Export de {len(matrix)} logos vers {output}...[/bold blue]"
+        )
+        with Progress(console=console) as progress, open(output, "wb") as archive:
+            task = progress.add_task("Export du pack", total=len(matrix))
+            for chunk in stream_zip(
+                iter_pack_entries(matrix, render, on_item=report), compression
+            ):
+                archive.write(chunk)
+
+        for failure in failures:
+            console.print(f"[red]❌[/red] {failure}")
+        print_success(
+            f"{len(matrix) - len(failures)}/{len(matrix)} logos exportés : {output}"
+        )
+
+    except Exception as e:
+        print_error(f"Impossible d'exporter le pack : {e}")
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("paths", nargs=-1, type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--size",
+    "-s",
+    type=click.IntRange(min=1),
+    multiple=True,
+    default=[200],
+    show_default=True,
+    help="Côté des PNG en pixels (option répétable)",
+)
+@click.option(
+    "--dest",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Répertoire des PNG (défaut : répertoire de sortie)",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+    help="Nombre de processus de conversion",
+)
+@click.option("--force", is_flag=True, help="Reconvertit même les PNG à jour")
+@click.pass_context
+def convert(
+    ctx,
+    paths: Tuple[Path, ...],
+    size: Tuple[int, ...],
+    dest: Optional[Path],
+    workers: int,
+    force: bool,
+):
+    """Convertit des SVG en PNG (fichiers ou répertoires, défaut : sortie)"""
+    if not raster_available():
+        print_error("Conversion PNG indisponible : installez cairosvg (extra raster)")
+        sys.exit(1)
+    try:
+        output_dir = ctx.obj["output_dir"]
+        sources = find_sources(paths or [output_dir])
+        destination = dest or output_dir
+        console.print(
+            f"[bold blue]🖼️ Conversion de {len(sources)} SVG "
+            f"(tailles {', '.join(map(str, size))}) - {workers} processus...[/bold blue]"
+        )
+
+        def report(job: ConversionJob, error: Optional[Exception]) -> None:
+            if error is None:
+                console.print(f"[green]✅[/green] {job.source.name}")
+            else:
+                console.print(f"[red]❌[/red] {job.source.name} : {error}")
+
+        result = convert_svgs(sources, size, destination, workers, force, on_job=report)
+        print_success(
+            f"{result['converted']} PNG convertis, {result['skipped']} à jour "
+            f"en {result['duration']:.2f}s : {destination}"
+        )
+        if result["failed"]:
+            sys.exit(1)
+
+    except Exception as e:
+        print_error(f"Impossible de convertir les SVG : {e}")
+        sys.exit(1)
+
+
 @cli.command()
 @click.option("--variant", "-v", required=True, help="Nom de la variante")
 @click.option("--size", "-s", default=32, help="Taille du favicon en pixels")
@@ -260,6 +554,164 @@ def favicon_all(ctx, size: int):
         sys.exit(1)
 
 
+@cli.command()
+@click.option("--variant", "-v", required=True, help="Nom de la variante")
+@click.option("--size", "-s", default=200, help="Taille de l'animation en pixels")
+@click.option(
+    "--generator",
+    "-g",
+    "generator_type",
+    type=click.Choice(list(LogoGeneratorFactory.GENERATOR_TYPES)),
+    default="default",
+    show_default=True,
+    help="Type de générateur",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(list(ANIMATION_FORMATS)),
+    default="gif",
+    show_default=True,
+    help="Format de l'animation",
+)
+@click.option(
+    "--fps",
+    type=click.FloatRange(min=0, min_open=True),
+    default=15.0,
+    show_default=True,
+    help="Images par seconde",
+)
+@click.option(
+    "--duration",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Durée en secondes (défaut : une boucle complète des animations)",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+    help="Nombre de processus de rastérisation",
+)
+@click.option("--output", "-o", type=click.Path(), help="Chemin de sortie personnalisé")
+@click.pass_context
+def animate(
+    ctx,
+    variant: str,
+    size: int,
+    generator_type: str,
+    output_format: str,
+    fps: float,
+    duration: Optional[float],
+    workers: int,
+    output: Optional[str],
+):
+    """Exporte un logo animé (GIF, APNG ou WebP) image par image"""
+    if not raster_available():
+        print_error("Export animé indisponible : installez cairosvg (extra raster)")
+        sys.exit(1)
+    try:
+        output_dir = ctx.obj["output_dir"]
+        generator = LogoGeneratorFactory.create_generator(generator_type, output_dir)
+        generator.set_density(ctx.obj["density"])
+        svg = generator.render_svg_logo(variant, size)
+        extension = ANIMATION_FORMATS[output_format][2]
+        output_path = (
+            Path(output)
+            if output
+            else generator.get_logo_path(variant, size).with_suffix(extension)
+        )
+
+        with console.status(
+            f"[bold blue]Animation '{variant}' ({output_format}, {fps:g} i/s)..."
+        ):
+            data = export_animation(svg, size, output_format, fps, duration, workers)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(data)
+        print_success(f"Animation exportée : {output_path} ({len(data)} octets)")
+
+    except Exception as e:
+        print_error(f"Impossible d'exporter l'animation : {e}")
+        sys.exit(1)
+
+
+def favicon_bundle_job(
+    generator_type: str, variant: str, output_dir: Path, sizes: Tuple[int, ...]
+) -> List[Path]:
+    """Crée le pack de favicons d'une variante (exécuté dans un processus du pool)"""
+    generator = LogoGeneratorFactory.create_generator(generator_type, output_dir)
+    return generator.create_favicon_bundle(variant, sizes)
+
+
+@cli.command()
+@click.option(
+    "--size",
+    "-s",
+    type=click.IntRange(min=1),
+    multiple=True,
+    default=list(FAVICON_SIZES),
+    show_default=True,
+    help="Taille des favicons en pixels (option répétable)",
+)
+@click.option(
+    "--generator",
+    "-g",
+    "generator_type",
+    type=click.Choice(list(LogoGeneratorFactory.GENERATOR_TYPES)),
+    default="default",
+    show_default=True,
+    help="Générateur du logo rastérisé en master",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+    help="Nombre de processus (une variante par processus)",
+)
+@click.pass_context
+def favicon_bundle(ctx, size: Tuple[int, ...], generator_type: str, workers: int):
+    """Crée les packs de favicons web (PNG, ICO, webmanifest) de toutes les variantes"""
+    try:
+        output_dir = ctx.obj["output_dir"]
+        variants = ctx.obj["generator"].list_all_variants()
+        console.print(
+            f"[bold blue]🎨 Création de {len(variants)} packs de favicons "
+            f"(tailles {', '.join(map(str, size))})...[/bold blue]"
+        )
+
+        created = 0
+        with ProcessPoolExecutor(max_workers=min(workers, len(variants))) as executor:
+            futures = {
+                executor.submit(
+                    favicon_bundle_job, generator_type, variant, output_dir, size
+                ): variant
+                for variant in variants
+            }
+            for future in as_completed(futures):
+                variant = futures[future]
+                try:
+                    written = future.result()
+                except Exception as e:
+                    console.print(f"[red]❌[/red] {variant} : {e}")
+                else:
+                    created += 1
+                    console.print(
+                        f"[green]✅[/green] {variant} : {len(written)} fichiers"
+                    )
+
+        print_success(
+            f"{created}/{len(variants)} packs de favicons : {output_dir / 'favicons'}"
+        )
+
+    except Exception as e:
+        print_error(f"Impossible de créer les packs de favicons : {e}")
+        sys.exit(1)
+
+
 @cli.command()
 @click.pass_context
 def stats(ctx):
@@ -0,0 +1,223 @@
+"""
+🌙 Converter Module
+Conversion SVG → PNG par lot : pool de processus et manifeste des sources
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+try:
+    from .raster_renderer import RasterSizesBackend, rasterize_svg_sizes
+except ImportError:
+    # Fallback pour exécution directe
+    from raster_renderer import RasterSizesBackend, rasterize_svg_sizes
+
+MANIFEST_NAME = ".png-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def png_name(source: Path, size: int, qualified: bool = False) -> str:
+    """Nom du PNG produit pour une source et une taille
+
+    ``qualified`` ajoute une empreinte courte du chemin de la source, pour
+    distinguer des SVG homonymes situés dans des répertoires différents.
+    """
+    if qualified:
+        tag = hashlib.sha256(str(source.resolve()).encode("utf-8")).hexdigest()[:8]
+        return f"{source.stem}-{tag}-{size}px.png"
+    return f"{source.stem}-{size}px.png"
+
+
+def source_digest(source: Path) -> str:
+    """Empreinte SHA-256 du contenu d'une source"""
+    return hashlib.sha256(source.read_bytes()).hexdigest()
+
+
+def find_sources(paths: Iterable[Path], pattern: str = "*.svg") -> List[Path]:
+    """Sources SVG : fichiers donnés et contenu des répertoires (sans doublons)"""
+    sources: Dict[Path, None] = {}
+    for path in paths:
+        if path.is_dir():
+            sources.update(dict.fromkeys(sorted(path.glob(pattern))))
+        elif path.is_file():
+            sources[path] = None
+    return list(sources)
+
+
+class ConversionManifest:
+    """Empreinte de la source de chaque PNG produit dans un répertoire
+
+    Un PNG est à jour si le fichier existe et que sa source n'a pas changé
+    depuis sa production : il n'est alors pas reconverti.
+    """
+
+    def __init__(self, path: Path, entries: Optional[Dict[str, Any]] = None):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = dict(entries or {})
+
+    @classmethod
+    def load(cls, directory: Path) -> "ConversionManifest":
+        """Charge le manifeste d'un répertoire (vide s'il est absent ou illisible)"""
+        path = directory / MANIFEST_NAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entries = data["entries"] if data.get("version") == MANIFEST_VERSION else {}
+        except (OSError, ValueError, KeyError, AttributeError):
+            entries = {}
+        return cls(path, entries)
+
+    def is_fresh(self, output: Path, digest: str) -> bool:
+        """Vrai si le PNG existe et provient d'une source identique"""
+        entry = self.entries.get(output.name)
+        return entry is not None and entry["digest"] == digest and output.exists()
+
+    def record(self, output: Path, source: Path, digest: str, size: int) -> None:
+        """Consigne un PNG tout juste produit"""
+        self.entries[output.name] = {
+            "source": str(source),
+            "digest": digest,
+            "size": size,
+        }
+
+    def save(self) -> None:
+        """Écrit le manifeste (remplacement atomique)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_text(
+            json.dumps(
+                {"version": MANIFEST_VERSION, "entries": self.entries},
+                indent=2,
+                sort_keys=True,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(temporary, self.path)
+
+
+@dataclass
+class ConversionJob:
+    """Source à convertir et PNG à produire (taille -> chemin)"""
+
+    source: Path
+    digest: str
+    targets: Dict[int, Path]
+
+
+def plan_conversions(
+    sources: Iterable[Path],
+    sizes: Sequence[int],
+    destination: Path,
+    manifest: ConversionManifest,
+    force: bool = False,
+) -> List[ConversionJob]:
+    """Conversions nécessaires : seules les tailles périmées sont produites
+
+    Les sources de même nom (répertoires différents) reçoivent des noms de
+    PNG qualifiés par leur chemin et ne s'écrasent pas mutuellement.
+    """
+    sources = list(sources)
+    stems = Counter(source.stem for source in sources)
+    jobs = []
+    for source in sources:
+        digest = source_digest(source)
+        qualified = stems[source.stem] > 1
+        targets = {
+            size: destination / png_name(source, size, qualified)
+            for size in dict.fromkeys(sizes)
+        }
+        if not force:
+            targets = {
+                size: output
+                for size, output in targets.items()
+                if not manifest.is_fresh(output, digest)
+            }
+        if targets:
+            jobs.append(ConversionJob(source, digest, targets))
+    return jobs
+
+
+def convert_source(
+    source: Path,
+    targets: Dict[int, Path],
+    backend: RasterSizesBackend = rasterize_svg_sizes,
+) -> Dict[int, int]:
+    """Convertit une source à toutes ses tailles (exécuté dans le pool)
+
+    Retourne la taille en octets de chaque PNG écrit.
+    """
+    images = backend(source.read_bytes(), list(targets))
+    written = {}
+    for size, output in targets.items():
+        output.write_bytes(images[size])
+        written[size] = len(images[size])
+    return written
+
+
+def convert_svgs(
+    sources: Iterable[Path],
+    sizes: Sequence[int],
+    destination: Path,
+    workers: int = 1,
+    force: bool = False,
+    backend: RasterSizesBackend = rasterize_svg_sizes,
+    on_job: Optional[Callable[[ConversionJob, Optional[Exception]], None]] = None,
+) -> Dict[str, Any]:
+    """Convertit les sources périmées, en parallèle si ``workers`` > 1
+
+    Retourne ``{"converted", "skipped", "failed", "duration"}`` (nombres de
+    PNG ; ``failed`` liste les sources en échec).
+    """
+    start_time = time.time()
+    sources = list(sources)
+    sizes = list(dict.fromkeys(sizes))
+    destination.mkdir(parents=True, exist_ok=True)
+    manifest = ConversionManifest.load(destination)
+    jobs = plan_conversions(sources, sizes, destination, manifest, force)
+    report: Dict[str, Any] = {
+        "converted": 0,
+        "skipped": len(sources) * len(sizes) - sum(len(job.targets) for job in jobs),
+        "failed": [],
+    }
+
+    def finish(job: ConversionJob, error: Optional[Exception]) -> None:
+        if error is None:
+            for size, output in job.targets.items():
+                manifest.record(output, job.source, job.digest, size)
+            report["converted"] += len(job.targets)
+        else:
+            report["failed"].append(f"{job.source}: {error}")
+        if on_job is not None:
+            on_job(job, error)
+
+    try:
+        if workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+                futures = {
+                    executor.submit(
+                        convert_source, job.source, job.targets, backend
+                    ): job
+                    for job in jobs
+                }
+                for future in as_completed(futures):
+                    error = future.exception()
+                    finish(futures[future], error)  # type: ignore[arg-type]
+        else:
+            for job in jobs:
+                try:
+                    convert_source(job.source, job.targets, backend)
+                except Exception as e:
+                    finish(job, e)
+                else:
+                    finish(job, None)
+    finally:
+        # Les conversions réussies sont conservées même après une interruption
+        manifest.save()
+    report["duration"] = time.time() - start_time
+    return report
@@ -18,10 +18,14 @@ except ImportError:
 class DashboardLogoGenerator(ArkaliaLunaLogo):
     """Générateur dashboard optimisé pour les interfaces et réseaux"""
 
+    # Préfixe des fichiers SVG produits
+    logo_prefix = "arkalia-luna-dashboard"
+
+    # Builder SVG spécialisé (instance partagée, voir builder_registry)
+    builder_class = DashboardSVGBuilder
+
     def __init__(self, output_dir: Optional[Path] = None):
         super().__init__(output_dir)
-        # Remplace le SVG builder par défaut par le Dashboard
-        self.svg_builder = DashboardSVGBuilder(self.variants_manager)
         self.logger.info("📊 Dashboard Generator initialisé avec succès")
 
         # Configuration dashboard
@@ -44,9 +48,7 @@ class DashboardLogoGenerator(ArkaliaLunaLogo):
                 raise ValueError(f"Variante '{variant_name}' non reconnue")
 
             # Construction du chemin de sortie avec suffixe dashboard
-            output_path = (
-                self.output_dir / f"arkalia-luna-dashboard-{variant_name}-{size}.svg"
-            )
+            output_path = self.get_logo_path(variant_name, size)
 
             # Génération avec le builder Dashboard
             self.svg_builder.save_logo(variant_name, size, output_path)
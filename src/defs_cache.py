@@ -0,0 +1,157 @@
+"""
+🌙 Defs Cache Module
+Cache des fragments <defs> (gradients, filtres, masques, motifs) par variante
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from xml.etree import ElementTree as etree
+
+from svgwrite.base import BaseElement
+from svgwrite.container import Defs
+
+# Types simplifiés pour éviter les conflits
+LogoVariant = Any
+SVGBuilder = Any
+
+# Fragment construit : (nom d'élément, arbre XML) pour chaque définition
+Fragment = Tuple[Tuple[str, etree.Element], ...]
+
+
+class SplicedElement(BaseElement):
+    """Élément svgwrite dont l'arbre XML est déjà construit
+
+    L'arbre est partagé entre tous les documents qui l'insèrent ; il n'est
+    jamais modifié après sa construction.
+    """
+
+    def __init__(self, elementname: str, xml: etree.Element):
+        super().__init__()
+        self.elementname = elementname
+        self._xml = xml
+
+    def get_xml(self) -> etree.Element:
+        return self._xml
+
+
+def variant_key(variant: LogoVariant) -> Optional[Hashable]:
+    """Clé des paramètres dont dépendent les définitions d'une variante
+
+    Retourne None pour une variante sonde (paramètres symboliques d'un
+    gabarit en compilation) : ses définitions ne sont pas mises en cache.
+    """
+    params = (variant.animation_speed, variant.glow_intensity)
+    if any(type(value) not in (int, float) for value in params):
+        return None
+    return (variant.variant_type.value, variant.colors, *params)
+
+
+class DefsCache:
+    """Cache LRU des fragments <defs>, par (builder, méthode, variante, args)
+
+    Chaque fragment est construit une fois avec svgwrite, converti en arbre
+    XML, puis inséré tel quel dans les rendus suivants, quelle que soit la
+    taille. Les définitions dépendant de la taille reçoivent celle-ci en
+    argument et ont donc leurs propres entrées.
+    """
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self._fragments: OrderedDict[Hashable, Fragment] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fragment_key(
+        builder: SVGBuilder,
+        method: Callable[..., Any],
+        variant: LogoVariant,
+        args: Tuple[Any, ...],
+    ) -> Optional[Hashable]:
+        """Clé d'un fragment ; None s'il ne peut pas être mis en cache"""
+        params = variant_key(variant)
+        if params is None:
+            return None
+        density = getattr(builder, "density", 1.0)
+        return (type(builder), method.__qualname__, builder.seed, density, params, args)
+
+    @staticmethod
+    def build(
+        builder: SVGBuilder,
+        method: Callable[..., Any],
+        variant: LogoVariant,
+        args: Tuple[Any, ...],
+    ) -> Fragment:
+        """Exécute une méthode de définitions sur un <defs> vierge"""
+        scratch = Defs()
+        method(builder, scratch, variant, *args)
+        return tuple(
+            (element.elementname, element.get_xml()) for element in scratch.elements
+        )
+
+    def splice(
+        self,
+        builder: SVGBuilder,
+        method: Callable[..., Any],
+        defs: Any,
+        variant: LogoVariant,
+        args: Tuple[Any, ...],
+    ) -> None:
+        """Ajoute à ``defs`` le fragment mis en cache (construit au besoin)"""
+        key = self.fragment_key(builder, method, variant, args)
+        if key is None:
+            method(builder, defs, variant, *args)
+            return
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+                self.hits += 1
+        if fragment is None:
+            fragment = self.build(builder, method, variant, args)
+            with self._lock:
+                self.misses += 1
+                self._fragments[key] = fragment
+                while len(self._fragments) > self.max_size:
+                    self._fragments.popitem(last=False)
+        for elementname, xml in fragment:
+            defs.add(SplicedElement(elementname, xml))
+
+    def clear(self) -> None:
+        """Vide le cache des fragments"""
+        with self._lock:
+            self._fragments.clear()
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retourne les statistiques du cache"""
+        return {
+            "fragments": len(self._fragments),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Cache partagé par tous les builders
+defs_cache = DefsCache()
+
+
+def cached_defs(method: Callable[..., None]) -> Callable[..., None]:
+    """Décorateur des méthodes ``_add_*(self, defs, variant, *args)``
+
+    Les arguments supplémentaires (taille…) font partie de la clé ; un
+    générateur aléatoire explicite (``rng=``) désactive le cache.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: SVGBuilder, defs: Any, variant: LogoVariant, *args, **kwargs):
+        if kwargs:
+            return method(self, defs, variant, *args, **kwargs)
+        return defs_cache.splice(self, method, defs, variant, args)
+
+    return wrapper
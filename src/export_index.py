@@ -0,0 +1,165 @@
+"""
+🌙 Export Index Module
+Index en mémoire des fichiers exportés et éviction par âge et budget d'octets
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+# Entrée de l'index : (date de modification, taille en octets)
+ExportEntry = Tuple[float, int]
+
+
+def _key(path: Path) -> Path:
+    """Chemin absolu : l'index ne dépend pas du répertoire courant"""
+    return path.absolute()
+
+
+class ExportIndex:
+    """Fichiers exportés, du plus ancien au plus récent
+
+    Les écritures enregistrent leurs fichiers (O(1)) ; l'éviction ne parcourt
+    que la tête de l'index et ne touche jamais au système de fichiers pour
+    les fichiers conservés. Le répertoire n'est parcouru qu'au démarrage
+    (``scan``) pour reprendre les fichiers d'une exécution précédente.
+    """
+
+    def __init__(
+        self,
+        max_age: Optional[float] = 86400,
+        max_bytes: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self._entries: OrderedDict[Path, ExportEntry] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def record(
+        self, path: Path, size: Optional[int] = None, mtime: Optional[float] = None
+    ) -> None:
+        """Enregistre (ou rafraîchit) un fichier tout juste écrit"""
+        path = _key(path)
+        if size is None:
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                return
+        mtime = self.clock() if mtime is None else mtime
+        with self._lock:
+            self._remove(path)
+            self._entries[path] = (mtime, size)
+            self._total_bytes += size
+
+    def record_all(self, paths: Iterable[Path]) -> None:
+        """Enregistre un fichier et ses variantes (ignore les absents)"""
+        for path in paths:
+            self.record(path)
+
+    def discard(self, path: Path) -> None:
+        """Retire un fichier de l'index sans le supprimer"""
+        with self._lock:
+            self._remove(_key(path))
+
+    def _remove(self, path: Path) -> Optional[ExportEntry]:
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+        return entry
+
+    def scan(self, directory: Path, pattern: str = "*.svg*") -> int:
+        """Reconstruit l'index d'un répertoire depuis le disque (démarrage)
+
+        Retourne le nombre de fichiers indexés.
+        """
+        directory = _key(directory)
+        found = []
+        if directory.exists():
+            for path in directory.glob(pattern):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                found.append((stat.st_mtime, path, stat.st_size))
+        found.sort()
+        with self._lock:
+            for path in [p for p in self._entries if p.parent == directory]:
+                self._remove(path)
+            # Fichiers existants avant les écritures déjà enregistrées
+            indexed = OrderedDict((path, (mtime, size)) for mtime, path, size in found)
+            indexed.update(self._entries)
+            self._entries = indexed
+            self._total_bytes += sum(size for _, _, size in found)
+        return len(found)
+
+    def evict(self, now: Optional[float] = None) -> Dict[str, int]:
+        """Supprime les fichiers trop anciens puis les plus anciens hors budget
+
+        Retourne ``{"age": n, "budget": n, "bytes": octets libérés}``.
+        """
+        now = self.clock() if now is None else now
+        freed = 0
+        with self._lock:
+            expired = []
+            if self.max_age is not None:
+                cutoff = now - self.max_age
+                for path, (mtime, _) in self._entries.items():
+                    if mtime > cutoff:
+                        break
+                    expired.append(path)
+            for path in expired:
+                freed += self._remove(path)[1]
+            over_budget = []
+            if self.max_bytes is not None:
+                while self._total_bytes > self.max_bytes and self._entries:
+                    path, (_, size) = self._entries.popitem(last=False)
+                    self._total_bytes -= size
+                    freed += size
+                    over_budget.append(path)
+            evicted: Dict[str, Tuple[Path, ...]] = {
+                "age": tuple(expired),
+                "budget": tuple(over_budget),
+            }
+
+        # Suppressions hors verrou : les écritures concurrentes ne sont pas bloquées
+        for paths in evicted.values():
+            for path in paths:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+        return {
+            "age": len(evicted["age"]),
+            "budget": len(evicted["budget"]),
+            "bytes": freed,
+        }
+
+    def clear(self) -> None:
+        """Vide l'index (les fichiers ne sont pas supprimés)"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, Path) and _key(path) in self._entries
+
+    def get_stats(self) -> Dict[str, Optional[float]]:
+        """Retourne les statistiques de l'index"""
+        return {
+            "files": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "max_age": self.max_age,
+        }
@@ -0,0 +1,140 @@
+"""
+🌙 Favicon Module
+Pack de favicons web : un master par variante, réduit à toutes les tailles
+"""
+
+import io
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from PIL import Image, ImageDraw
+
+try:
+    from .raster_renderer import raster_available, rasterize_svg
+    from .variants import ColorScheme
+except ImportError:
+    # Fallback pour exécution directe
+    from raster_renderer import raster_available, rasterize_svg
+    from variants import ColorScheme
+
+# Tailles d'un déploiement web (onglets, raccourcis, Apple, Android)
+FAVICON_SIZES = (16, 32, 48, 64, 180, 192, 512)
+# Images regroupées dans favicon.ico
+ICO_SIZES = (16, 32, 48, 64)
+# Icônes déclarées dans site.webmanifest
+MANIFEST_SIZES = (192, 512)
+
+ICO_NAME = "favicon.ico"
+WEBMANIFEST_NAME = "site.webmanifest"
+
+# Noms conventionnels des icônes spécifiques aux plateformes
+_PLATFORM_NAMES = {
+    180: "apple-touch-icon.png",
+    192: "android-chrome-192x192.png",
+    512: "android-chrome-512x512.png",
+}
+
+
+def favicon_file_name(size: int) -> str:
+    """Nom du PNG d'une taille dans le pack"""
+    return _PLATFORM_NAMES.get(size, f"favicon-{size}x{size}.png")
+
+
+def draw_favicon_master(colors: ColorScheme, size: int) -> Image.Image:
+    """Dessine le favicon simplifié (lune et Λ-core) à la taille donnée
+
+    Les proportions sont celles du favicon 32 px historique.
+    """
+    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    center = size // 2
+    radius = size // 3
+    draw.ellipse(
+        [center - radius, center - radius, center + radius, center + radius],
+        fill=colors.primary,
+    )
+    dx, dy = round(size * 3 / 32), round(size * 5 / 32)
+    draw.polygon(
+        [(center - dx, center - dy), (center, center + dx), (center + dx, center - dy)],
+        fill=colors.glow,
+    )
+    return img
+
+
+def render_favicon_master(
+    colors: ColorScheme, size: int, svg: Optional[bytes] = None
+) -> Image.Image:
+    """Master du pack : le logo SVG rastérisé si possible, sinon le dessin PIL"""
+    if svg is not None and raster_available():
+        png = rasterize_svg(svg, size, size)
+        return Image.open(io.BytesIO(png)).convert("RGBA")
+    return draw_favicon_master(colors, size)
+
+
+def downsample(master: Image.Image, sizes: Iterable[int]) -> Dict[int, Image.Image]:
+    """Réductions Lanczos du master (une image par taille)"""
+    return {
+        size: (
+            master
+            if size == master.width
+            else master.resize((size, size), Image.LANCZOS)
+        )
+        for size in sorted(set(sizes), reverse=True)
+    }
+
+
+def webmanifest(colors: ColorScheme, sizes: Iterable[int]) -> Dict[str, object]:
+    """Contenu de site.webmanifest pour les icônes disponibles"""
+    return {
+        "name": "Arkalia-LUNA",
+        "short_name": "LUNA",
+        "icons": [
+            {
+                "src": favicon_file_name(size),
+                "sizes": f"{size}x{size}",
+                "type": "image/png",
+            }
+            for size in MANIFEST_SIZES
+            if size in sizes
+        ],
+        "theme_color": colors.primary,
+        "background_color": colors.secondary,
+        "display": "standalone",
+    }
+
+
+def write_favicon_bundle(
+    master: Image.Image,
+    colors: ColorScheme,
+    directory: Path,
+    sizes: Iterable[int] = FAVICON_SIZES,
+) -> List[Path]:
+    """Écrit les PNG, favicon.ico et site.webmanifest d'un master
+
+    Retourne les chemins écrits.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    images = downsample(master, sizes)
+    written = []
+    for size, image in images.items():
+        path = directory / favicon_file_name(size)
+        image.save(path, "PNG", optimize=True)
+        written.append(path)
+
+    ico_images = [images[size] for size in ICO_SIZES if size in images]
+    if ico_images:
+        path = directory / ICO_NAME
+        largest = ico_images[-1]
+        largest.save(
+            path,
+            "ICO",
+            sizes=[image.size for image in ico_images],
+            append_images=ico_images[:-1],
+        )
+        written.append(path)
+
+    path = directory / WEBMANIFEST_NAME
+    path.write_text(json.dumps(webmanifest(colors, images), indent=2), "utf-8")
+    written.append(path)
+    return written
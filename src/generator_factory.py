@@ -8,6 +8,7 @@ from typing import Any, Dict, Optional
 
 from .advanced_logo_generator import AdvancedArkaliaLunaLogo
 from .ai_moon_generator import AIMoonLogoGenerator
+from .builder_registry import builder_registry
 from .dashboard_generator import DashboardLogoGenerator
 from .logo_generator import ArkaliaLunaLogo
 from .realism_max_generator import RealismMaxLogoGenerator
@@ -105,6 +106,7 @@ class LogoGeneratorFactory:
             "cached_generators": len(cls._generators_cache),
             "cache_keys": list(cls._generators_cache.keys()),
             "memory_usage": "Optimisé avec pattern Singleton",
+            "shared_builders": builder_registry.get_stats(),
         }
 
     @classmethod
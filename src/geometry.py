@@ -0,0 +1,190 @@
+"""
+🌙 Geometry Module
+Géométrie vectorisée (NumPy) des couches de particules, rayons et nœuds
+
+Angles, distances, coordonnées et troncatures sont calculés par tableaux.
+Trois étapes restent élément par élément, volontairement, pour que la sortie
+à densité 1.0 soit celle des boucles d'origine au bit près :
+- cosinus et sinus via ``math`` (``np.cos`` peut différer au dernier bit) ;
+- tirages aléatoires via ``random.Random``, dans l'ordre d'origine ;
+- formatage ``str(float)`` (``format_floats``), que NumPy ne reproduit pas.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Valeur fixe ou tableau d'une valeur par point
+Spread = Union[float, np.ndarray]
+
+
+def scaled_count(base: int, density: float = 1.0) -> int:
+    """Nombre d'éléments d'une couche mis à l'échelle par la densité (≥ 1)"""
+    if density <= 0:
+        raise ValueError("La densité doit être strictement positive")
+    return max(1, int(round(base * density)))
+
+
+def draw_columns(
+    rng: random.Random, count: int, *draws: Callable[[random.Random], float]
+) -> List[np.ndarray]:
+    """Tire ``count`` lignes de valeurs et les retourne en colonnes
+
+    Les tirages restent ceux du générateur du rendu, dans l'ordre des boucles
+    scalaires d'origine (élément par élément, un appel par tirage) : à
+    densité 1.0 les valeurs sont identiques, seule la géométrie qui en
+    découle est vectorisée.
+    """
+    rows = [[draw(rng) for draw in draws] for _ in range(count)]
+    return [np.array(column) for column in zip(*rows)]
+
+
+def ring_angles(count: int, offset: float = 0.0, start: float = 0) -> np.ndarray:
+    """Angles (radians) de ``count`` points régulièrement répartis
+
+    Calculés comme ``((i + start) × pas en degrés) × π/180``, à l'identique
+    du calcul scalaire d'origine ; ``start`` décale les indices (``count / 2``
+    donne le point opposé).
+    """
+    return offset + ((np.arange(count) + start) * (360 / count)) * (np.pi / 180)
+
+
+def polar_points(
+    center: float, radius: Union[float, np.ndarray], angles: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Coordonnées cartésiennes de points polaires autour d'un centre
+
+    Cosinus et sinus viennent de ``math`` (libm) : les valeurs sont celles des
+    boucles scalaires d'origine au bit près, ce que ``np.cos`` ne garantit pas.
+    """
+    angles = np.asarray(angles, dtype=float)
+    cos = np.fromiter(map(math.cos, angles.tolist()), float, angles.size)
+    sin = np.fromiter(map(math.sin, angles.tolist()), float, angles.size)
+    return center + radius * cos, center + radius * sin
+
+
+def truncate(values: np.ndarray) -> np.ndarray:
+    """Troncature vers zéro, comme ``int()`` sur chaque valeur"""
+    return np.trunc(values).astype(np.int64)
+
+
+def format_numbers(values: np.ndarray, precision: int = 2) -> List[str]:
+    """Formate un tableau de nombres en une passe (zéros finaux supprimés)"""
+    values = np.asarray(values)
+    if values.dtype.kind in "iu":
+        return values.astype(str).tolist()
+    text = np.char.mod(f"%.{precision}f", values.astype(float))
+    if precision > 0:
+        text = np.char.rstrip(np.char.rstrip(text, "0"), ".")
+    return ["0" if item == "-0" else item for item in text.tolist()]
+
+
+def format_floats(values: np.ndarray) -> List[str]:
+    """Formate un tableau comme ``str()`` en pleine précision
+
+    Reproduit à l'octet près les coordonnées des boucles scalaires d'origine
+    (entiers sans décimale, flottants au format ``repr``).
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in "iu":
+        return values.astype(str).tolist()
+    return [str(value) for value in values.astype(float).tolist()]
+
+
+def stagger(count: int, step: float, precision: Optional[int] = 3) -> List[str]:
+    """Décalages d'animation ``0, step, 2·step…`` formatés en secondes
+
+    Avec ``precision=None``, chaque décalage est ``f"{i * step}s"``, comme
+    dans les boucles scalaires d'origine.
+    """
+    if precision is None:
+        return [f"{index * step}s" for index in range(count)]
+    return [f"{value}s" for value in format_numbers(np.arange(count) * step, precision)]
+
+
+@dataclass(frozen=True)
+class PointLayer:
+    """Couche de points : centres, tailles et opacités (tableaux NumPy)
+
+    Les points sont stockés comme décalages (``dx``, ``dy``) par rapport au
+    centre de la couche ; ``x`` et ``y`` sont les coordonnées absolues.
+    """
+
+    dx: np.ndarray
+    dy: np.ndarray
+    size: np.ndarray
+    opacity: np.ndarray
+    center: float = 0.0
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.center + self.dx
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.center + self.dy
+
+    def __len__(self) -> int:
+        return len(self.dx)
+
+    def truncated(self) -> "PointLayer":
+        """Même couche avec des centres entiers : ``center + int(décalage)``
+
+        Seul le décalage par rapport au centre est tronqué (vers zéro), comme
+        dans le calcul scalaire d'origine.
+        """
+        return PointLayer(
+            truncate(self.dx), truncate(self.dy), self.size, self.opacity, self.center
+        )
+
+    def formatted(
+        self, precision: Optional[int] = 2
+    ) -> List[Tuple[str, str, str, str]]:
+        """Colonnes (x, y, taille, opacité) formatées en une passe
+
+        Avec ``precision=None``, chaque valeur est formatée comme ``str()``.
+        """
+
+        def fmt(values: np.ndarray) -> List[str]:
+            if precision is None:
+                return format_floats(values)
+            return format_numbers(values, precision)
+
+        return list(zip(fmt(self.x), fmt(self.y), fmt(self.size), fmt(self.opacity)))
+
+
+def _column(spread: Spread, count: int) -> np.ndarray:
+    """Tableau d'une valeur par point (valeur fixe répétée)"""
+    if isinstance(spread, np.ndarray):
+        return spread
+    return np.full(count, float(spread))
+
+
+def radial_layer(
+    count: int,
+    center: float,
+    distance: Spread,
+    size: Spread = 1.0,
+    opacity: Spread = 1.0,
+    angles: Optional[np.ndarray] = None,
+    angle_offset: float = 0.0,
+) -> PointLayer:
+    """Calcule une couche complète de points autour d'un centre
+
+    Les angles sont réguliers sauf s'ils sont fournis (tirages de
+    ``draw_columns``) ; distance, taille et opacité sont fixes ou données
+    point par point. Les coordonnées sont calculées en un appel par grandeur.
+    """
+    if angles is None:
+        angles = ring_angles(count, angle_offset)
+    dx, dy = polar_points(0, _column(distance, count), angles)
+    return PointLayer(
+        dx=dx,
+        dy=dy,
+        size=_column(size, count),
+        opacity=_column(opacity, count),
+        center=center,
+    )
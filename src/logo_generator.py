@@ -4,25 +4,47 @@ Générateur principal des logos Arkalia-LUNA
 """
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Type
 
 from PIL import Image, ImageDraw
 
 try:
+    from .builder_registry import builder_registry
+    from .favicon import FAVICON_SIZES, render_favicon_master, write_favicon_bundle
+    from .raster_renderer import raster_available
+    from .svg_builder import SVGBuilder
     from .svg_builder_advanced import AdvancedSVGBuilder
-    from .variants import LogoVariants
+    from .svg_optimizer import SVGOptimizer
+    from .variants import ColorScheme, variants_registry
 except ImportError:
     # Fallback pour exécution directe
+    from builder_registry import builder_registry
+    from favicon import FAVICON_SIZES, render_favicon_master, write_favicon_bundle
+    from raster_renderer import raster_available
+    from svg_builder import SVGBuilder
     from svg_builder_advanced import AdvancedSVGBuilder
-    from variants import LogoVariants
+    from svg_optimizer import SVGOptimizer
+    from variants import ColorScheme, variants_registry
+
+# Longueur de l'empreinte de contenu insérée dans les noms d'artefacts
+ARTIFACT_DIGEST_LENGTH = 16
 
 
 class ArkaliaLunaLogo:
     """Générateur principal des logos Arkalia-LUNA"""
 
+    # Préfixe des fichiers SVG produits
+    logo_prefix = "arkalia-luna"
+
+    # Densité des particules, rayons et nœuds (1.0 = logo standard)
+    density = 1.0
+
+    # Type de builder SVG (instance partagée, voir builder_registry)
+    builder_class: Type[SVGBuilder] = AdvancedSVGBuilder
+
     def __init__(self, output_dir: Optional[Path] = None):
-        self.variants_manager = LogoVariants()
-        self.svg_builder = AdvancedSVGBuilder(self.variants_manager)
+        self.variants_manager = variants_registry
+        self.svg_builder = builder_registry.get(self.builder_class)
         self.output_dir = output_dir or Path("exports")
         self.output_dir.mkdir(exist_ok=True)
 
@@ -55,7 +77,7 @@ class ArkaliaLunaLogo:
                 raise ValueError(f"Variante '{variant_name}' non reconnue")
 
             # Construction du chemin de sortie
-            output_path = self.output_dir / f"arkalia-luna-{variant_name}-{size}.svg"
+            output_path = self.get_logo_path(variant_name, size)
 
             # Génération et sauvegarde
             self.svg_builder.save_logo(variant_name, size, output_path)
@@ -69,6 +91,45 @@ class ArkaliaLunaLogo:
             )
             raise
 
+    def render_svg_logo(
+        self,
+        variant_name: str,
+        size: int = 200,
+        density: Optional[float] = None,
+        colors: Optional[ColorScheme] = None,
+        optimizer: Optional[SVGOptimizer] = None,
+    ) -> bytes:
+        """Rend un logo SVG en mémoire, sans écriture sur disque
+
+        ``density`` remplace la densité du générateur pour ce seul rendu ;
+        ``colors`` remplace la palette de la variante ; ``optimizer`` applique
+        une optimisation (identique à ``optimizer.optimize`` sur le rendu).
+        """
+        if not self.variants_manager.validate_variant(variant_name):
+            raise ValueError(f"Variante '{variant_name}' non reconnue")
+        density = self.effective_density(density)
+        if colors is None:
+            svg = self.svg_builder.render_compiled(
+                variant_name, size, density=density, optimizer=optimizer
+            )
+        else:
+            svg = self.svg_builder.render_palette(
+                variant_name, colors, size, density=density, optimizer=optimizer
+            )
+        return svg.encode("utf-8")
+
+    def get_logo_path(self, variant_name: str, size: int = 200) -> Path:
+        """Chemin de sortie du logo SVG d'une variante"""
+        return self.output_dir / f"{self.logo_prefix}-{variant_name}-{size}.svg"
+
+    def get_artifact_name(self, variant_name: str, size: int, digest: str) -> str:
+        """Nom de fichier adressé par contenu (``...-{size}.{empreinte}.svg``)
+
+        Le nom change avec le contenu : il peut être mis en cache indéfiniment.
+        """
+        short_digest = digest[:ARTIFACT_DIGEST_LENGTH]
+        return f"{self.logo_prefix}-{variant_name}-{size}.{short_digest}.svg"
+
     def generate_all_variants(self, size: int = 200) -> List[Path]:
         """Génère toutes les variantes du logo"""
         try:
@@ -175,6 +236,36 @@ class ArkaliaLunaLogo:
             self.logger.error(f"Erreur lors de la création de tous les favicons: {e}")
             raise
 
+    def get_favicon_bundle_dir(self, variant_name: str) -> Path:
+        """Répertoire du pack de favicons d'une variante"""
+        return self.output_dir / "favicons" / variant_name
+
+    def create_favicon_bundle(
+        self, variant_name: str, sizes: Sequence[int] = FAVICON_SIZES
+    ) -> List[Path]:
+        """Crée le pack de favicons web d'une variante
+
+        Le master est rendu une seule fois à la plus grande taille (logo SVG
+        rastérisé si cairosvg est installé, favicon dessiné sinon), puis
+        réduit à toutes les tailles ; le pack comprend ``favicon.ico`` et
+        ``site.webmanifest``.
+        """
+        variant = self.variants_manager.get_variant(variant_name)
+        master_size = max(sizes)
+        svg = (
+            self.render_svg_logo(variant_name, master_size)
+            if raster_available()
+            else None
+        )
+        master = render_favicon_master(variant.colors, master_size, svg)
+        written = write_favicon_bundle(
+            master, variant.colors, self.get_favicon_bundle_dir(variant_name), sizes
+        )
+        self.logger.info(
+            f"Pack de favicons '{variant_name}' créé : {len(written)} fichiers"
+        )
+        return written
+
     def get_variant_info(self, variant_name: str) -> Dict[str, Any]:
         """Récupère les informations d'une variante"""
         try:
@@ -203,6 +294,32 @@ class ArkaliaLunaLogo:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.logger.info(f"Répertoire de sortie changé vers : {self.output_dir}")
 
+    def set_optimizer(self, optimizer: Optional[SVGOptimizer]) -> None:
+        """Définit l'optimisation appliquée aux fichiers SVG écrits"""
+        self.svg_builder = self.svg_builder.with_optimizer(optimizer)
+
+    def set_density(self, density: float) -> None:
+        """Définit la densité des éléments (nombre de particules, rayons, nœuds)
+
+        Les effectifs et le temps de rendu croissent linéairement avec elle.
+        """
+        if density <= 0:
+            raise ValueError("La densité doit être strictement positive")
+        self.density = density
+        self._apply_density()
+
+    def complexity_factor(self) -> float:
+        """Facteur de densité lié au niveau de complexité du générateur"""
+        return 1.0
+
+    def effective_density(self, density: Optional[float] = None) -> float:
+        """Densité appliquée au builder (densité × complexité)"""
+        return (self.density if density is None else density) * self.complexity_factor()
+
+    def _apply_density(self) -> None:
+        """Reporte la densité effective sur le builder (copie du builder partagé)"""
+        self.svg_builder = self.svg_builder.with_density(self.effective_density())
+
     def cleanup_generated_files(self) -> int:
         """Nettoie tous les fichiers générés"""
         try:
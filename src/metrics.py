@@ -0,0 +1,647 @@
+"""
+🌙 Metrics Module
+Registre de métriques Prometheus thread-safe (compteurs shardés par thread)
+"""
+
+import contextlib
+import glob
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore
+
+# Clé d'un échantillon : (famille, labels déjà formatés, ex. 'route="/health"')
+SampleKey = Tuple[str, str]
+
+# Bornes de l'histogramme des durées de génération (secondes)
+DURATION_BUCKETS = (0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0)
+
+
+class _Shard:
+    """Valeurs écrites par un seul thread (aucun verrou à l'écriture)"""
+
+    __slots__ = ("thread", "counters", "latest", "version")
+
+    def __init__(self, thread: threading.Thread):
+        self.thread = thread
+        self.counters: Dict[SampleKey, float] = {}
+        self.latest: Dict[SampleKey, Tuple[float, float]] = {}
+        self.version = 0
+
+
+class ShardedValueStore:
+    """Stockage des compteurs avec un shard par thread, fusionnés à la lecture
+
+    Chaque thread n'écrit que dans son propre shard : les incréments sont
+    sans verrou et ne peuvent pas se perdre. Le verrou ne protège que la
+    liste des shards (création d'un shard, fusion des threads terminés).
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[_Shard] = []
+        self._retired_counters: Dict[SampleKey, float] = {}
+        self._retired_latest: Dict[SampleKey, Tuple[float, float]] = {}
+        self._retired_version = 0
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard(threading.current_thread())
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def inc(self, key: SampleKey, amount: float = 1) -> None:
+        """Incrémente un compteur"""
+        shard = self._shard()
+        shard.counters[key] = shard.counters.get(key, 0) + amount
+        shard.version += 1
+
+    def set_latest(self, key: SampleKey, value: float) -> None:
+        """Enregistre la dernière valeur d'une jauge (la plus récente gagne)"""
+        shard = self._shard()
+        shard.latest[key] = (time.time(), value)
+        shard.version += 1
+
+    def _retire_dead_shards(self) -> None:
+        """Fusionne les shards des threads terminés (appelé sous verrou)"""
+        alive = []
+        for shard in self._shards:
+            if shard.thread.is_alive():
+                alive.append(shard)
+                continue
+            _merge_into(self._retired_counters, self._retired_latest, shard)
+            self._retired_version += shard.version
+        self._shards = alive
+
+    def snapshot(
+        self,
+    ) -> Tuple[Dict[SampleKey, float], Dict[SampleKey, Tuple[float, float]]]:
+        """Fusionne tous les shards : (compteurs, jauges horodatées)"""
+        with self._lock:
+            self._retire_dead_shards()
+            counters = dict(self._retired_counters)
+            latest = dict(self._retired_latest)
+            shards = list(self._shards)
+        for shard in shards:
+            _merge_into(counters, latest, shard)
+        return counters, latest
+
+    def version(self) -> int:
+        """Somme des versions : change dès qu'une valeur change"""
+        with self._lock:
+            shards = list(self._shards)
+            total = self._retired_version
+        return total + sum(shard.version for shard in shards)
+
+
+def _merge_into(
+    counters: Dict[SampleKey, float],
+    latest: Dict[SampleKey, Tuple[float, float]],
+    shard: _Shard,
+) -> None:
+    """Ajoute les valeurs d'un shard aux agrégats"""
+    # dict.copy() est atomique sous le GIL : le thread propriétaire peut
+    # continuer à écrire pendant la fusion
+    for key, value in shard.counters.copy().items():
+        counters[key] = counters.get(key, 0) + value
+    for key, stamped in shard.latest.copy().items():
+        if key not in latest or stamped[0] >= latest[key][0]:
+            latest[key] = stamped
+
+
+class MmapedDict:
+    """Dictionnaire clé → (valeur, horodatage) adossé à un fichier mmap
+
+    Format : en-tête ``<QQd`` (octets utilisés, nombre d'écritures, instant
+    de démarrage du processus propriétaire), puis des entrées ``<I`` longueur
+    de clé, clé UTF-8 complétée à 8 octets, ``<dd`` valeur et horodatage.
+    Une entrée est entièrement écrite avant que l'en-tête ne l'expose : un
+    lecteur concurrent ne voit jamais d'entrée partielle.
+    """
+
+    _HEADER = struct.Struct("<QQd")
+    _VALUE = struct.Struct("<dd")
+    _INITIAL_SIZE = 1 << 16
+
+    def __init__(self, path: Union[str, Path], start_time: float = 0.0):
+        self.path = str(path)
+        self._file = open(self.path, "a+b")
+        if os.fstat(self._file.fileno()).st_size < self._HEADER.size:
+            self._file.truncate(self._INITIAL_SIZE)
+        self._capacity = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), self._capacity)
+        self._used, self._writes, self.start_time = self._HEADER.unpack_from(
+            self._map, 0
+        )
+        if self._used == 0:
+            self._used = self._HEADER.size
+            self.start_time = start_time
+            self._write_header()
+        self._positions: Dict[str, int] = {}
+        for key, _, _, position in _iter_entries(self._map, self._used):
+            self._positions[key] = position
+
+    def _write_header(self) -> None:
+        self._HEADER.pack_into(self._map, 0, self._used, self._writes, self.start_time)
+
+    def _grow(self, needed: int) -> None:
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+        self._map.close()
+        self._file.truncate(capacity)
+        self._capacity = capacity
+        self._map = mmap.mmap(self._file.fileno(), capacity)
+
+    def read_value(self, key: str) -> Tuple[float, float]:
+        position = self._positions.get(key)
+        if position is None:
+            return 0.0, 0.0
+        return self._VALUE.unpack_from(self._map, position)
+
+    def write_value(self, key: str, value: float, timestamp: float = 0.0) -> None:
+        position = self._positions.get(key)
+        if position is None:
+            encoded = key.encode("utf-8")
+            padded = encoded + b" " * (-(4 + len(encoded)) % 8)
+            entry = struct.pack(f"<I{len(padded)}s", len(encoded), padded)
+            end = self._used + len(entry) + self._VALUE.size
+            if end > self._capacity:
+                self._grow(end)
+            self._map[self._used : self._used + len(entry)] = entry
+            position = self._used + len(entry)
+            self._VALUE.pack_into(self._map, position, value, timestamp)
+            self._positions[key] = position
+            self._used = end
+        else:
+            self._VALUE.pack_into(self._map, position, value, timestamp)
+        self._writes += 1
+        self._write_header()
+
+    def items(self) -> Iterator[Tuple[str, float, float]]:
+        for key, value, timestamp, _ in _iter_entries(self._map, self._used):
+            yield key, value, timestamp
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+
+def _iter_entries(
+    buffer: Union[bytes, mmap.mmap], used: int
+) -> Iterator[Tuple[str, float, float, int]]:
+    """Parcourt les entrées d'un fichier mmap : (clé, valeur, horodatage, position)"""
+    position = MmapedDict._HEADER.size
+    used = min(used, len(buffer))
+    while position + 4 <= used:
+        (length,) = struct.unpack_from("<I", buffer, position)
+        position += 4
+        key = bytes(buffer[position : position + length]).decode("utf-8")
+        position += length + (-(4 + length) % 8)
+        if position + MmapedDict._VALUE.size > used:
+            break
+        value, timestamp = MmapedDict._VALUE.unpack_from(buffer, position)
+        yield key, value, timestamp, position
+        position += MmapedDict._VALUE.size
+
+
+def _read_file(path: str) -> Tuple[int, List[Tuple[str, float, float]]]:
+    """Lit un fichier de métriques d'un autre processus (écritures, entrées)"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < MmapedDict._HEADER.size:
+        return 0, []
+    used, writes, _ = MmapedDict._HEADER.unpack_from(data, 0)
+    entries = [(k, v, t) for k, v, t, _ in _iter_entries(data, used)]
+    return writes, entries
+
+
+def _read_header(path: str) -> Optional[Tuple[int, int, float]]:
+    """En-tête d'un fichier de métriques ; None s'il est absent ou incomplet"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(MmapedDict._HEADER.size)
+    except FileNotFoundError:
+        return None
+    if len(header) < MmapedDict._HEADER.size:
+        return None
+    return MmapedDict._HEADER.unpack(header)
+
+
+def _process_start_time(pid: int) -> float:
+    """Instant de démarrage d'un processus (tics depuis le boot) ; 0 si inconnu
+
+    Lu dans ``/proc/<pid>/stat`` (Linux) : distingue un PID réutilisé du
+    processus qui a créé le fichier.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+    except OSError:
+        return 0.0
+    # Champ 22 (starttime) ; le nom du processus peut contenir des espaces
+    fields = stat[stat.rfind(b")") + 2 :].split()
+    try:
+        return float(fields[19])
+    except (IndexError, ValueError):
+        return 0.0
+
+
+def _pid_alive(pid: int, start_time: float = 0.0) -> bool:
+    """Vérifie qu'un processus existe encore (et n'est pas un PID réutilisé)"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    if start_time:
+        current = _process_start_time(pid)
+        if current and current != start_time:
+            return False
+    return True
+
+
+class MultiProcessValueStore:
+    """Stockage des métriques partagé entre workers (un fichier mmap par PID)
+
+    Chaque worker écrit dans ``metrics_<pid>.db`` du répertoire partagé ; la
+    lecture fusionne tous les fichiers. Les fichiers des workers morts sont
+    fusionnés dans ``metrics_archive.db`` puis supprimés sous verrou exclusif ;
+    la lecture prend le verrou partagé, elle ne voit donc jamais un worker à
+    la fois archivé et encore présent. L'en-tête de chaque fichier porte
+    l'instant de démarrage du worker : un PID réutilisé ne garde pas un
+    fichier orphelin en vie.
+    """
+
+    ARCHIVE_NAME = "metrics_archive.db"
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._file: Optional[MmapedDict] = None
+
+    def _own_file(self) -> MmapedDict:
+        """Fichier du processus courant (rouvert après un fork)"""
+        pid = os.getpid()
+        if self._pid != pid:
+            self._file = MmapedDict(
+                self.directory / f"metrics_{pid}.db", _process_start_time(pid)
+            )
+            self._pid = pid
+        return self._file  # type: ignore[return-value]
+
+    @staticmethod
+    def _encode(kind: str, key: SampleKey) -> str:
+        return json.dumps([kind, key[0], key[1]])
+
+    def inc(self, key: SampleKey, amount: float = 1) -> None:
+        """Incrémente un compteur du worker courant"""
+        encoded = self._encode("counter", key)
+        with self._lock:
+            own = self._own_file()
+            value, _ = own.read_value(encoded)
+            own.write_value(encoded, value + amount)
+
+    def set_latest(self, key: SampleKey, value: float) -> None:
+        """Enregistre la dernière valeur d'une jauge"""
+        with self._lock:
+            self._own_file().write_value(
+                self._encode("latest", key), value, time.time()
+            )
+
+    def _worker_files(self) -> List[str]:
+        return sorted(glob.glob(str(self.directory / "metrics_*.db")))
+
+    @contextlib.contextmanager
+    def _directory_lock(self, operation: int) -> Iterator[None]:
+        """Verrou de fichier du répertoire (``LOCK_SH`` ou ``LOCK_EX``)"""
+        with open(self.directory / ".lock", "a") as lock_file:
+            fcntl.flock(lock_file, operation)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def collect_dead_workers(self) -> int:
+        """Archive puis supprime les fichiers des workers terminés"""
+        if fcntl is None:
+            return 0
+        collected = 0
+        with self._directory_lock(fcntl.LOCK_EX):
+            archive = None
+            for path in self._worker_files():
+                name = os.path.basename(path)
+                if name == self.ARCHIVE_NAME:
+                    continue
+                try:
+                    pid = int(name[len("metrics_") : -len(".db")])
+                except ValueError:
+                    continue
+                header = _read_header(path)
+                start_time = header[2] if header is not None else 0.0
+                if pid == os.getpid() or _pid_alive(pid, start_time):
+                    continue
+                if archive is None:
+                    archive = MmapedDict(self.directory / self.ARCHIVE_NAME)
+                for key, value, timestamp in _read_file(path)[1]:
+                    current, current_ts = archive.read_value(key)
+                    if key.startswith('["counter"'):
+                        archive.write_value(key, current + value)
+                    elif timestamp >= current_ts:
+                        archive.write_value(key, value, timestamp)
+                os.remove(path)
+                collected += 1
+            if archive is not None:
+                archive.close()
+        return collected
+
+    def snapshot(
+        self,
+    ) -> Tuple[Dict[SampleKey, float], Dict[SampleKey, Tuple[float, float]]]:
+        """Fusionne les fichiers de tous les workers (vivants et archivés)"""
+        self.collect_dead_workers()
+        counters: Dict[SampleKey, float] = {}
+        latest: Dict[SampleKey, Tuple[float, float]] = {}
+        lock = (
+            self._directory_lock(fcntl.LOCK_SH)
+            if fcntl is not None
+            else contextlib.nullcontext()
+        )
+        with lock:
+            for path in self._worker_files():
+                try:
+                    _, entries = _read_file(path)
+                except FileNotFoundError:
+                    continue
+                for encoded, value, timestamp in entries:
+                    kind, family, labels = json.loads(encoded)
+                    key = (family, labels)
+                    if kind == "counter":
+                        counters[key] = counters.get(key, 0) + value
+                    elif key not in latest or timestamp >= latest[key][0]:
+                        latest[key] = (timestamp, value)
+        return counters, latest
+
+    def version(self) -> Tuple[Tuple[str, int], ...]:
+        """Compteurs d'écritures de chaque fichier (lecture des seuls en-têtes)"""
+        versions = []
+        for path in self._worker_files():
+            header = _read_header(path)
+            if header is not None:
+                versions.append((path, header[1]))
+        return tuple(versions)
+
+
+ValueStore = Union[ShardedValueStore, MultiProcessValueStore]
+
+
+def create_value_store(multiprocess_dir: Optional[str] = None) -> ValueStore:
+    """Choisit le stockage : mmap multi-workers si un répertoire est configuré"""
+    if multiprocess_dir:
+        return MultiProcessValueStore(multiprocess_dir)
+    return ShardedValueStore()
+
+
+def _format_value(value: float) -> str:
+    """Formate un compteur entier sans décimale (comme le format historique)"""
+    if isinstance(value, float) and value.is_integer() and abs(value) < 2**53:
+        return str(int(value))
+    return str(value)
+
+
+class PrometheusMetrics:
+    """Métriques de l'API au format d'exposition Prometheus
+
+    Les écritures vont dans un ``ShardedValueStore`` (ou un
+    ``MultiProcessValueStore`` avec plusieurs workers). Le texte d'exposition est
+    mis en cache et n'est reconstruit que si une valeur a changé depuis le
+    dernier scrape (seule la ligne d'uptime est recalculée à chaque fois).
+    """
+
+    def __init__(self, store: Optional[ValueStore] = None):
+        self.start_time = time.time()
+        self.store = store or ShardedValueStore()
+        self.duration_buckets = list(DURATION_BUCKETS)
+        self._cache_lock = threading.Lock()
+        self._cached_version: Optional[object] = None
+        self._cached_body = ""
+
+    def increment_request(self, route: Optional[str] = None) -> None:
+        self.store.inc(("requests_total", ""))
+        if route:
+            self.store.inc(("requests_total", f'route="{route}"'))
+
+    def increment_logo_generation(
+        self,
+        duration: float,
+        variant: Optional[str] = None,
+        generator: Optional[str] = None,
+    ) -> None:
+        self.store.inc(("logo_generations_total", ""))
+        self.store.inc(("generation_time_total", ""), duration)
+        self.store.set_latest(("last_generation_duration_seconds", ""), duration)
+        labels = f"variant={variant or 'unknown'},generator={generator or 'simple'}"
+        self.store.inc(("logo_generations_total", labels))
+
+    def increment_error(self) -> None:
+        self.store.inc(("errors_total", ""))
+
+    def increment_cache_hit(self, generator: Optional[str] = None) -> None:
+        labels = f'generator="{generator or "simple"}"'
+        self.store.inc(("render_cache_hits_total", labels))
+
+    def increment_cache_miss(self, generator: Optional[str] = None) -> None:
+        labels = f'generator="{generator or "simple"}"'
+        self.store.inc(("render_cache_misses_total", labels))
+
+    def observe_generation_duration(self, duration: float) -> None:
+        bucket = next((b for b in self.duration_buckets if duration <= b), "+Inf")
+        self.store.inc(("generation_duration_bucket", f'le="{bucket}"'))
+        self.store.inc(("generation_duration_sum", ""), duration)
+        self.store.inc(("generation_duration_count", ""))
+
+    def increment_export_evictions(self, age: int, budget: int, freed: int) -> None:
+        for reason, count in (("age", age), ("budget", budget)):
+            if count:
+                self.store.inc(("export_evictions_total", f'reason="{reason}"'), count)
+        if freed:
+            self.store.inc(("export_evicted_bytes_total", ""), freed)
+
+    def set_export_usage(self, files: int, size: int) -> None:
+        self.store.set_latest(("export_files", ""), files)
+        self.store.set_latest(("export_bytes", ""), size)
+
+    def record_response_status(self, route: str, status_code: int) -> None:
+        labels = f'route="{route}",status_code="{status_code}"'
+        self.store.inc(("responses_total", labels))
+
+    def get_metrics(self) -> str:
+        uptime = time.time() - self.start_time
+        header = (
+            "# HELP arkalia_luna_uptime_seconds Total uptime in seconds\n"
+            "# TYPE arkalia_luna_uptime_seconds counter\n"
+            f"arkalia_luna_uptime_seconds {uptime}\n"
+            "\n"
+        )
+        version = self.store.version()
+        with self._cache_lock:
+            if version != self._cached_version:
+                self._cached_body = self._render_body()
+                self._cached_version = version
+            return header + self._cached_body
+
+    def _render_body(self) -> str:
+        """Construit le texte d'exposition (hors uptime) depuis un instantané"""
+        counters, latest = self.store.snapshot()
+
+        def labelled(family: str) -> Iterable[Tuple[str, float]]:
+            return sorted(
+                (labels, value)
+                for (name, labels), value in counters.items()
+                if name == family and labels
+            )
+
+        def total(family: str) -> float:
+            return counters.get((family, ""), 0)
+
+        lines: List[str] = []
+        # Requests
+        lines.append("# HELP arkalia_luna_requests_total Total number of requests")
+        lines.append("# TYPE arkalia_luna_requests_total counter")
+        lines.append(
+            f"arkalia_luna_requests_total {_format_value(total('requests_total'))}"
+        )
+        for labels, value in labelled("requests_total"):
+            lines.append(
+                f"arkalia_luna_requests_total{{{labels}}} {_format_value(value)}"
+            )
+        lines.append("")
+        # Responses by route and status
+        lines.append(
+            "# HELP arkalia_luna_responses_total Total responses by status and route"
+        )
+        lines.append("# TYPE arkalia_luna_responses_total counter")
+        for labels, value in labelled("responses_total"):
+            lines.append(
+                f"arkalia_luna_responses_total{{{labels}}} {_format_value(value)}"
+            )
+        lines.append("")
+        # Generations
+        generations = total("logo_generations_total")
+        lines.append(
+            "# HELP arkalia_luna_logo_generations_total Total number of logo generations"
+        )
+        lines.append("# TYPE arkalia_luna_logo_generations_total counter")
+        lines.append(
+            f"arkalia_luna_logo_generations_total {_format_value(generations)}"
+        )
+        for labels, value in labelled("logo_generations_total"):
+            lines.append(
+                f"arkalia_luna_logo_generations_total{{{labels}}} {_format_value(value)}"
+            )
+        lines.append("")
+        # Errors
+        lines.append("# HELP arkalia_luna_errors_total Total number of errors")
+        lines.append("# TYPE arkalia_luna_errors_total counter")
+        lines.append(
+            f"arkalia_luna_errors_total {_format_value(total('errors_total'))}"
+        )
+        lines.append("")
+        # Render cache
+        for family, help_text in (
+            ("render_cache_hits_total", "Render cache hits by generator"),
+            ("render_cache_misses_total", "Render cache misses by generator"),
+        ):
+            lines.append(f"# HELP arkalia_luna_{family} {help_text}")
+            lines.append(f"# TYPE arkalia_luna_{family} counter")
+            for labels, value in labelled(family):
+                lines.append(
+                    f"arkalia_luna_{family}{{{labels}}} {_format_value(value)}"
+                )
+            lines.append("")
+        # Export index
+        lines.append(
+            "# HELP arkalia_luna_export_evictions_total Exported files evicted by reason"
+        )
+        lines.append("# TYPE arkalia_luna_export_evictions_total counter")
+        for labels, value in labelled("export_evictions_total"):
+            lines.append(
+                f"arkalia_luna_export_evictions_total{{{labels}}} {_format_value(value)}"
+            )
+        lines.append(
+            "# HELP arkalia_luna_export_evicted_bytes_total Bytes freed by export eviction"
+        )
+        lines.append("# TYPE arkalia_luna_export_evicted_bytes_total counter")
+        lines.append(
+            "arkalia_luna_export_evicted_bytes_total "
+            f"{_format_value(total('export_evicted_bytes_total'))}"
+        )
+        for family, help_text in (
+            ("export_files", "Exported files tracked by the index"),
+            ("export_bytes", "Bytes of exported files tracked by the index"),
+        ):
+            value = latest.get((family, ""), (0.0, 0))[1]
+            lines.append(f"# HELP arkalia_luna_{family} {help_text}")
+            lines.append(f"# TYPE arkalia_luna_{family} gauge")
+            lines.append(f"arkalia_luna_{family} {_format_value(value)}")
+        lines.append("")
+        # Last and average duration
+        last = latest.get(("last_generation_duration_seconds", ""), (0.0, 0.0))[1]
+        lines.append(
+            "# HELP arkalia_luna_last_generation_duration_seconds Duration of last logo generation"
+        )
+        lines.append("# TYPE arkalia_luna_last_generation_duration_seconds gauge")
+        lines.append(f"arkalia_luna_last_generation_duration_seconds {last}")
+        avg = total("generation_time_total") / generations if generations else 0.0
+        lines.append(
+            "# HELP arkalia_luna_avg_generation_duration_seconds Average logo generation duration"
+        )
+        lines.append("# TYPE arkalia_luna_avg_generation_duration_seconds gauge")
+        lines.append(f"arkalia_luna_avg_generation_duration_seconds {avg}")
+        lines.append("")
+        # Histogram
+        lines.append(
+            "# HELP arkalia_luna_generation_duration_seconds Logo generation duration histogram"
+        )
+        lines.append("# TYPE arkalia_luna_generation_duration_seconds histogram")
+        cumulative = 0.0
+        for bucket in [*sorted(self.duration_buckets), "+Inf"]:
+            cumulative += counters.get(
+                ("generation_duration_bucket", f'le="{bucket}"'), 0
+            )
+            lines.append(
+                f'arkalia_luna_generation_duration_seconds_bucket{{le="{bucket}"}} '
+                f"{_format_value(cumulative)}"
+            )
+        lines.append(
+            "arkalia_luna_generation_duration_seconds_sum "
+            f"{float(total('generation_duration_sum'))}"
+        )
+        lines.append(
+            "arkalia_luna_generation_duration_seconds_count "
+            f"{_format_value(total('generation_duration_count'))}"
+        )
+        lines.append("")
+        # Health
+        lines.append(
+            "# HELP arkalia_luna_health_status Health status (1=healthy, 0=unhealthy)"
+        )
+        lines.append("# TYPE arkalia_luna_health_status gauge")
+        lines.append("arkalia_luna_health_status 1")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,251 @@
+"""
+🌙 Pack Module
+Export du pack de logos en archive ZIP diffusée en flux, sans fichier temporaire
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import zipfile
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+try:
+    from .generator_factory import LogoGeneratorFactory
+    from .svg_optimizer import SVGOptimizer
+except ImportError:
+    # Fallback pour exécution directe
+    from generator_factory import LogoGeneratorFactory
+    from svg_optimizer import SVGOptimizer
+
+# Entrée d'archive : (chemin dans le ZIP, contenu)
+PackEntry = Tuple[str, bytes]
+# Rendu d'un logo : (générateur, variante, taille) -> SVG
+PackRenderer = Callable[[str, str, int], bytes]
+# Rendu asynchrone d'un logo (pool de rendu de l'API)
+AsyncPackRenderer = Callable[[str, str, int], Awaitable[bytes]]
+
+COMPRESSION_METHODS = {"deflated": zipfile.ZIP_DEFLATED, "stored": zipfile.ZIP_STORED}
+
+# Date fixe des entrées : une même matrice produit les mêmes octets
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+MANIFEST_NAME = "manifest.json"
+
+
+class _ChunkSink(io.RawIOBase):
+    """Flux d'écriture non positionnable accumulant les octets produits
+
+    ``zipfile`` détecte l'absence de ``seek`` et écrit des descripteurs de
+    données : aucune réécriture des en-têtes, donc aucun tampon complet.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        """Retourne et oublie les octets accumulés"""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def pack_entry_name(
+    generator_type: str, variant: str, size: int, density: float = 1.0
+) -> str:
+    """Chemin d'un logo dans l'archive (densité suffixée si non standard)"""
+    suffix = "" if density == 1.0 else f"-d{density:g}"
+    return f"{generator_type}/arkalia-luna-{variant}-{size}{suffix}.svg"
+
+
+def pack_matrix(
+    generator_types: Iterable[str], variants: Iterable[str], sizes: Iterable[int]
+) -> List[Tuple[str, str, int]]:
+    """Matrice (générateur, variante, taille) sans doublons, dans l'ordre reçu"""
+    variants, sizes = list(dict.fromkeys(variants)), list(dict.fromkeys(sizes))
+    return [
+        (generator_type, variant, size)
+        for generator_type in dict.fromkeys(generator_types)
+        for variant in variants
+        for size in sizes
+    ]
+
+
+class ZipStream:
+    """Archive ZIP écrite entrée par entrée, chaque écriture rendant ses octets
+
+    Base commune des flux synchrone et asynchrone : l'appelant choisit quand
+    produire l'entrée suivante.
+    """
+
+    def __init__(self, compression: str = "deflated"):
+        if compression not in COMPRESSION_METHODS:
+            raise ValueError(
+                f"Compression '{compression}' inconnue. "
+                f"Utilisez: {', '.join(COMPRESSION_METHODS)}"
+            )
+        self._method = COMPRESSION_METHODS[compression]
+        self._sink = _ChunkSink()
+        self._archive = zipfile.ZipFile(self._sink, "w", compression=self._method)
+
+    def write(self, name: str, content: bytes) -> bytes:
+        """Ajoute une entrée et retourne les octets produits"""
+        info = zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME)
+        info.compress_type = self._method
+        self._archive.writestr(info, content)
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        """Termine l'archive et retourne le répertoire central"""
+        self._archive.close()
+        return self._sink.drain()
+
+
+def stream_zip(
+    entries: Iterable[PackEntry], compression: str = "deflated"
+) -> Iterator[bytes]:
+    """Produit une archive ZIP morceau par morceau (un morceau par entrée)
+
+    Seule l'entrée en cours est en mémoire : la consommation reste constante
+    quelle que soit la taille du pack.
+    """
+    archive = ZipStream(compression)
+    for name, content in entries:
+        chunk = archive.write(name, content)
+        if chunk:
+            yield chunk
+    # Répertoire central
+    yield archive.close()
+
+
+async def stream_zip_async(
+    entries: AsyncIterable[PackEntry], compression: str = "deflated"
+) -> AsyncIterator[bytes]:
+    """Variante asynchrone de ``stream_zip`` : chaque entrée est attendue
+
+    La compression (DEFLATE) s'exécute dans le pool de threads par défaut,
+    comme les rendus, pour ne pas bloquer la boucle d'événements. Les
+    écritures restent séquentielles : l'archive n'est jamais partagée.
+    """
+    loop = asyncio.get_running_loop()
+    archive = ZipStream(compression)
+    async for name, content in entries:
+        chunk = await loop.run_in_executor(None, archive.write, name, content)
+        if chunk:
+            yield chunk
+    yield await loop.run_in_executor(None, archive.close)
+
+
+def render_pack_logo(
+    generator_type: str,
+    variant: str,
+    size: int,
+    optimizer: Optional[SVGOptimizer] = None,
+    density: float = 1.0,
+) -> bytes:
+    """Rend un logo en mémoire via la factory (renderer par défaut)"""
+    generator = LogoGeneratorFactory.create_generator(generator_type)
+    return generator.render_svg_logo(
+        variant_name=variant, size=size, density=density, optimizer=optimizer
+    )
+
+
+def _pack_item(
+    generator_type: str,
+    variant: str,
+    size: int,
+    content: Optional[bytes] = None,
+    error: Optional[Exception] = None,
+) -> Tuple[Dict[str, Any], Optional[PackEntry]]:
+    """Ligne du manifeste et entrée d'archive (None si le rendu a échoué)"""
+    item: Dict[str, Any] = {
+        "generator_type": generator_type,
+        "variant": variant,
+        "size": size,
+    }
+    if error is not None or content is None:
+        item.update(success=False, error=str(error))
+        return item, None
+    name = pack_entry_name(generator_type, variant, size)
+    item.update(
+        success=True,
+        filename=name,
+        digest=hashlib.sha256(content).hexdigest(),
+        bytes=len(content),
+    )
+    return item, (name, content)
+
+
+def _manifest_entry(items: List[Dict[str, Any]]) -> PackEntry:
+    return MANIFEST_NAME, json.dumps({"items": items}, indent=2).encode("utf-8")
+
+
+def iter_pack_entries(
+    matrix: Iterable[Tuple[str, str, int]],
+    render: PackRenderer = render_pack_logo,
+    on_item: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Iterator[PackEntry]:
+    """Rend la matrice à la demande puis termine par ``manifest.json``
+
+    Un rendu en échec n'interrompt pas le pack : l'erreur est consignée dans
+    le manifeste.
+    """
+    items: List[Dict[str, Any]] = []
+    for generator_type, variant, size in matrix:
+        try:
+            content = render(generator_type, variant, size)
+        except Exception as e:
+            item, entry = _pack_item(generator_type, variant, size, error=e)
+        else:
+            item, entry = _pack_item(generator_type, variant, size, content)
+        if entry is not None:
+            yield entry
+        items.append(item)
+        if on_item is not None:
+            on_item(item)
+    yield _manifest_entry(items)
+
+
+async def iter_pack_entries_async(
+    matrix: Iterable[Tuple[str, str, int]],
+    render: AsyncPackRenderer,
+    on_item: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> AsyncIterator[PackEntry]:
+    """Variante asynchrone de ``iter_pack_entries`` (rendu attendu par entrée)
+
+    Chaque logo est rendu avant que son entrée ne soit émise : le rendu
+    passe par le pool de l'API sans bloquer la boucle d'événements.
+    """
+    items: List[Dict[str, Any]] = []
+    for generator_type, variant, size in matrix:
+        try:
+            content = await render(generator_type, variant, size)
+        except Exception as e:
+            item, entry = _pack_item(generator_type, variant, size, error=e)
+        else:
+            item, entry = _pack_item(generator_type, variant, size, content)
+        if entry is not None:
+            yield entry
+        items.append(item)
+        if on_item is not None:
+            on_item(item)
+    yield _manifest_entry(items)
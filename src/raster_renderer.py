@@ -0,0 +1,183 @@
+"""
+🌙 Raster Renderer Module
+Rastérisation PNG en mémoire des rendus SVG, avec cache par empreinte
+"""
+
+import asyncio
+import hashlib
+import io
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+try:
+    import cairosvg
+    from cairosvg.parser import Tree
+    from cairosvg.surface import PNGSurface
+except (ImportError, OSError):  # Dépendance optionnelle (et libcairo)
+    cairosvg = None  # type: ignore
+
+try:
+    from .render_cache import RenderCache, RenderedSVG
+    from .render_pool import RenderPool
+except ImportError:
+    # Fallback pour exécution directe
+    from render_cache import RenderCache, RenderedSVG
+    from render_pool import RenderPool
+
+# Rastérisation : (SVG, largeur, hauteur) -> PNG
+RasterBackend = Callable[[bytes, int, int], bytes]
+# Rastérisation multi-tailles : (SVG, côtés) -> {côté: PNG}
+RasterSizesBackend = Callable[[bytes, Sequence[int]], Dict[int, bytes]]
+# Clé du cache : (empreinte du SVG, largeur, hauteur)
+RasterKey = Tuple[str, int, int]
+
+# Clé du pool de rendu : limite de concurrence propre aux rastérisations
+RASTER_POOL_KEY = "raster"
+
+PNG_MEDIA_TYPE = "image/png"
+
+# Résolution de référence de cairosvg (px par pouce)
+RASTER_DPI = 96
+
+
+class RasterUnavailableError(RuntimeError):
+    """Levée quand aucun moteur de rastérisation n'est installé"""
+
+    def __init__(self):
+        super().__init__("Rendu PNG indisponible (installez cairosvg)")
+
+
+def raster_available() -> bool:
+    """Vrai si cairosvg (et libcairo) est installé"""
+    return cairosvg is not None
+
+
+def rasterize_svg(svg: bytes, width: int, height: int) -> bytes:
+    """Rastérise un document SVG en PNG avec cairosvg (worker du pool)
+
+    Fonction de niveau module pour rester picklable en mode processus.
+    """
+    if cairosvg is None:
+        raise RasterUnavailableError()
+    return cairosvg.svg2png(bytestring=svg, output_width=width, output_height=height)
+
+
+def rasterize_svg_sizes(svg: bytes, sizes: Sequence[int]) -> Dict[int, bytes]:
+    """Rastérise un SVG carré à plusieurs côtés en une seule analyse
+
+    Le document est analysé une fois ; seule la surface PNG est recréée
+    pour chaque taille.
+    """
+    if cairosvg is None:
+        raise RasterUnavailableError()
+    tree = Tree(bytestring=svg)
+    images = {}
+    for size in dict.fromkeys(sizes):
+        output = io.BytesIO()
+        PNGSurface(
+            tree, output, RASTER_DPI, output_width=size, output_height=size
+        ).finish()
+        images[size] = output.getvalue()
+    return images
+
+
+@dataclass(frozen=True)
+class RasterImage:
+    """Image PNG immuable avec son empreinte et ses dimensions"""
+
+    content: bytes
+    digest: str
+    width: int
+    height: int
+
+    @classmethod
+    def from_content(cls, content: bytes, width: int, height: int) -> "RasterImage":
+        return cls(
+            content=content,
+            digest=hashlib.sha256(content).hexdigest(),
+            width=width,
+            height=height,
+        )
+
+    def __len__(self) -> int:
+        return len(self.content)
+
+
+class RasterRenderer:
+    """Rastérisation des rendus SVG sur le pool de rendu
+
+    Les images sont mises en cache par ``(empreinte SVG, largeur, hauteur)`` :
+    un même logo à une même résolution n'est rastérisé qu'une fois, y compris
+    lorsque plusieurs requêtes identiques arrivent simultanément.
+    """
+
+    def __init__(
+        self,
+        pool: RenderPool,
+        cache_size: int = 256,
+        ttl: float = 3600,
+        max_dimension: int = 4096,
+        backend: Optional[RasterBackend] = None,
+    ):
+        self.pool = pool
+        self.max_dimension = max_dimension
+        self.backend = backend or rasterize_svg
+        self.cache = RenderCache(max_size=cache_size, ttl=ttl)
+        self.rasterized = 0
+        self.coalesced = 0
+        self._inflight: Dict[RasterKey, asyncio.Future[RasterImage]] = {}
+
+    @property
+    def available(self) -> bool:
+        """Vrai si un moteur de rastérisation est utilisable"""
+        return self.backend is not rasterize_svg or raster_available()
+
+    def dimensions(self, size: int, scale: float = 1.0) -> Tuple[int, int]:
+        """Dimensions du PNG d'un logo carré de ``size`` px à l'échelle ``scale``"""
+        if scale <= 0:
+            raise ValueError("L'échelle doit être strictement positive")
+        side = max(1, round(size * scale))
+        if side > self.max_dimension:
+            raise ValueError(
+                f"Image trop grande: {side}px (maximum {self.max_dimension}px)"
+            )
+        return side, side
+
+    @staticmethod
+    def etag(svg: RenderedSVG, width: int, height: int) -> str:
+        """ETag du PNG, connu sans rastériser (le rendu est déterministe)"""
+        return f'"{svg.digest}-{width}x{height}"'
+
+    async def render(self, svg: RenderedSVG, width: int, height: int) -> RasterImage:
+        """Retourne le PNG d'un rendu SVG, depuis le cache si possible"""
+        key = (svg.digest, width, height)
+        image = self.cache.get(key)
+        if image is not None:
+            return image  # type: ignore[return-value]
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._rasterize(key, svg.content))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+        # shield : l'abandon d'un client n'annule pas le rendu partagé
+        return await asyncio.shield(task)
+
+    async def _rasterize(self, key: RasterKey, content: bytes) -> RasterImage:
+        _, width, height = key
+        png = await self.pool.run(RASTER_POOL_KEY, self.backend, content, width, height)
+        image = RasterImage.from_content(png, width, height)
+        self.cache.put(key, image)  # type: ignore[arg-type]
+        self.rasterized += 1
+        return image
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne les statistiques de rastérisation"""
+        return {
+            "available": self.available,
+            "rasterized": self.rasterized,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+            "cache": self.cache.get_stats(),
+        }
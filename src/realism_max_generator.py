@@ -18,10 +18,14 @@ except ImportError:
 class RealismMaxLogoGenerator(ArkaliaLunaLogo):
     """Générateur de logos ultra-réalistes avec effets organiques"""
 
+    # Préfixe des fichiers SVG produits
+    logo_prefix = "arkalia-luna-realism"
+
+    # Builder SVG spécialisé (instance partagée, voir builder_registry)
+    builder_class = RealismMaxSVGBuilder
+
     def __init__(self, output_dir: Optional[Path] = None):
         super().__init__(output_dir)
-        # Remplace le SVG builder par défaut par le Realism Max
-        self.svg_builder = RealismMaxSVGBuilder(self.variants_manager)
         self.logger.info("🌙 Realism Max Generator initialisé avec succès")
 
     def generate_realistic_logo(
@@ -39,9 +43,7 @@ class RealismMaxLogoGenerator(ArkaliaLunaLogo):
                 raise ValueError(f"Variante '{variant_name}' non reconnue")
 
             # Construction du chemin de sortie avec suffixe réalisme
-            output_path = (
-                self.output_dir / f"arkalia-luna-realism-{variant_name}-{size}.svg"
-            )
+            output_path = self.get_logo_path(variant_name, size)
 
             # Génération avec le builder Realism Max
             self.svg_builder.save_logo(variant_name, size, output_path)
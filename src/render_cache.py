@@ -0,0 +1,118 @@
+"""
+🌙 Render Cache Module
+Cache LRU/TTL en mémoire des rendus SVG, adressé par contenu
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+try:
+    from .svg_optimizer import compress
+except ImportError:
+    # Fallback pour exécution directe
+    from svg_optimizer import compress
+
+
+@dataclass(frozen=True)
+class RenderedSVG:
+    """Rendu SVG immuable avec son empreinte de contenu"""
+
+    content: bytes
+    digest: str
+    # Variantes compressées, calculées une seule fois par encodage
+    _encoded: Dict[str, Optional[bytes]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    @classmethod
+    def from_content(cls, content: Any) -> "RenderedSVG":
+        """Construit un rendu à partir d'un contenu texte ou binaire"""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return cls(content=content, digest=hashlib.sha256(content).hexdigest())
+
+    def encoded(self, encoding: str) -> Optional[bytes]:
+        """Contenu compressé (``gzip`` ou ``br``), mémorisé ; None si indisponible"""
+        if encoding not in self._encoded:
+            self._encoded[encoding] = compress(self.content, encoding)
+        return self._encoded[encoding]
+
+    def __len__(self) -> int:
+        return len(self.content)
+
+
+class RenderCache:
+    """Cache LRU avec expiration (TTL) des rendus SVG
+
+    Les clés sont typiquement ``(generator_type, variant, size)`` ; l'espace
+    d'entrée étant petit, la quasi-totalité des requêtes devient une simple
+    recherche dans un dictionnaire.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: float = 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_size < 1:
+            raise ValueError("La taille du cache doit être >= 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, Tuple[float, RenderedSVG]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[RenderedSVG]:
+        """Récupère un rendu (None si absent ou expiré)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, rendered = entry
+                if self.ttl <= 0 or self._clock() - stored_at < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return rendered
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, rendered: RenderedSVG) -> None:
+        """Ajoute un rendu en évinçant le moins récemment utilisé si besoin"""
+        with self._lock:
+            self._entries[key] = (self._clock(), rendered)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Vide le cache"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne les statistiques du cache"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "bytes": sum(len(r) for _, r in self._entries.values()),
+            }
@@ -0,0 +1,152 @@
+"""
+🌙 Render Pool Module
+Pool d'exécution borné pour le rendu des logos hors de la boucle d'événements
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+POOL_MODES = ("thread", "process")
+
+
+class RenderPoolSaturatedError(RuntimeError):
+    """Levée quand la file de rendu est pleine (back-pressure)"""
+
+    def __init__(self, retry_after: int, generator_type: Optional[str] = None):
+        super().__init__(
+            f"File de rendu saturée (générateur '{generator_type or 'inconnu'}'), "
+            f"réessayez dans {retry_after}s"
+        )
+        self.retry_after = retry_after
+        self.generator_type = generator_type
+
+
+class RenderPool:
+    """Pool de rendu borné avec limites de concurrence par type de générateur
+
+    Les rendus sont exécutés dans un pool de threads ou de processus afin de ne
+    jamais bloquer la boucle d'événements. La file est bornée : au-delà de
+    ``max_queue`` rendus en cours ou en attente, ``run`` lève
+    ``RenderPoolSaturatedError`` au lieu de mettre la requête en file.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue: int = 32,
+        mode: str = "thread",
+        generator_limits: Optional[Dict[str, int]] = None,
+        default_limit: Optional[int] = None,
+        retry_after: int = 1,
+    ):
+        if mode not in POOL_MODES:
+            raise ValueError(
+                f"Mode de pool '{mode}' non reconnu. Modes disponibles: {list(POOL_MODES)}"
+            )
+        if max_workers < 1 or max_queue < 1:
+            raise ValueError("max_workers et max_queue doivent être >= 1")
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.generator_limits = dict(generator_limits or {})
+        self.default_limit = default_limit or max_workers
+        self.retry_after = retry_after
+
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._pending_by_type: Dict[str, int] = {}
+        self._rejected = 0
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def executor(self) -> Executor:
+        """Retourne l'exécuteur, créé à la demande"""
+        if self._executor is None:
+            self.start()
+        return self._executor  # type: ignore[return-value]
+
+    def start(self) -> None:
+        """Démarre l'exécuteur (à appeler depuis la boucle d'événements)"""
+        with self._lock:
+            if self._executor is None:
+                if self.mode == "process":
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="render"
+                    )
+            # Les sémaphores sont liés à la boucle courante : on les recrée
+            self._semaphores = {}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Arrête l'exécuteur"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def get_limit(self, generator_type: str) -> int:
+        """Retourne la limite de rendus concurrents pour un type de générateur"""
+        return max(1, self.generator_limits.get(generator_type, self.default_limit))
+
+    def _get_semaphore(self, generator_type: str) -> asyncio.Semaphore:
+        """Récupère (ou crée) le sémaphore d'un type de générateur"""
+        semaphore = self._semaphores.get(generator_type)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.get_limit(generator_type))
+            self._semaphores[generator_type] = semaphore
+        return semaphore
+
+    def _reserve(self, generator_type: str) -> None:
+        """Réserve une place dans la file ou lève une erreur de saturation"""
+        with self._lock:
+            if self._pending >= self.max_queue:
+                self._rejected += 1
+                raise RenderPoolSaturatedError(self.retry_after, generator_type)
+            self._pending += 1
+            self._pending_by_type[generator_type] = (
+                self._pending_by_type.get(generator_type, 0) + 1
+            )
+
+    def _release(self, generator_type: str) -> None:
+        """Libère une place dans la file"""
+        with self._lock:
+            self._pending -= 1
+            self._pending_by_type[generator_type] -= 1
+
+    async def run(
+        self, generator_type: str, func: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Exécute ``func(*args)`` dans le pool en respectant les limites
+
+        En mode processus, ``func`` et ses arguments doivent être picklables.
+        """
+        self._reserve(generator_type)
+        try:
+            async with self._get_semaphore(generator_type):
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self.executor, functools.partial(func, *args)
+                )
+        finally:
+            self._release(generator_type)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne l'état courant du pool"""
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "pending_by_generator": {
+                    k: v for k, v in self._pending_by_type.items() if v
+                },
+                "rejected": self._rejected,
+                "limits": {"default": self.default_limit, **self.generator_limits},
+            }
@@ -18,15 +18,22 @@ except ImportError:
 class SimpleAdvancedLogoGenerator(ArkaliaLunaLogo):
     """Générateur simple-advanced avec équilibre performance/qualité"""
 
+    # Préfixe des fichiers SVG produits
+    logo_prefix = "arkalia-luna-simple-advanced"
+
+    # Builder SVG spécialisé (instance partagée, voir builder_registry)
+    builder_class = SimpleAdvancedSVGBuilder
+
+    # Niveau de complexité de référence (densité inchangée)
+    DEFAULT_COMPLEXITY_LEVEL = 0.7
+
     def __init__(self, output_dir: Optional[Path] = None):
         super().__init__(output_dir)
-        # Remplace le SVG builder par défaut par le Simple Advanced
-        self.svg_builder = SimpleAdvancedSVGBuilder(self.variants_manager)
         self.logger.info("⚡ Simple Advanced Generator initialisé avec succès")
 
         # Configuration optimisée
         self.animation_enabled = True
-        self.complexity_level = 0.7
+        self.complexity_level = self.DEFAULT_COMPLEXITY_LEVEL
         self.performance_boost = True
 
     def generate_simple_advanced_logo(
@@ -44,10 +51,7 @@ class SimpleAdvancedLogoGenerator(ArkaliaLunaLogo):
                 raise ValueError(f"Variante '{variant_name}' non reconnue")
 
             # Construction du chemin de sortie avec suffixe simple-advanced
-            output_path = (
-                self.output_dir
-                / f"arkalia-luna-simple-advanced-{variant_name}-{size}.svg"
-            )
+            output_path = self.get_logo_path(variant_name, size)
 
             # Génération avec le builder Simple Advanced
             self.svg_builder.save_logo(variant_name, size, output_path)
@@ -120,10 +124,15 @@ class SimpleAdvancedLogoGenerator(ArkaliaLunaLogo):
         self.animation_enabled = enabled
         self.logger.info(f"⚡ Animations: {'activées' if enabled else 'désactivées'}")
 
+    def complexity_factor(self) -> float:
+        """Le niveau de complexité module la densité (1.0 à 0.7)"""
+        return self.complexity_level / self.DEFAULT_COMPLEXITY_LEVEL
+
     def set_complexity_level(self, level: float) -> None:
         """Configure le niveau de complexité (0.1 à 1.0)"""
         if 0.1 <= level <= 1.0:
             self.complexity_level = level
+            self._apply_density()
             self.logger.info(f"🎯 Complexité simple-advanced: {level:.2f}")
         else:
             raise ValueError("Niveau de complexité doit être entre 0.1 et 1.0")
@@ -3,11 +3,24 @@
 Construction des logos SVG Arkalia-LUNA de base
 """
 
+import copy
+import dataclasses
+import hashlib
+import io
+import random
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional
 
 import svgwrite
 
+try:
+    from .svg_optimizer import SVGOptimizer
+    from .svg_template import template_engine
+except ImportError:
+    # Fallback pour exécution directe
+    from svg_optimizer import SVGOptimizer
+    from svg_template import template_engine
+
 # Types simplifiés pour éviter les conflits
 LogoVariant = Any
 LogoVariants = Any
@@ -16,6 +29,15 @@ LogoVariants = Any
 class SVGBuilder(ABC):
     """Constructeur SVG professionnel pour les logos Arkalia-LUNA"""
 
+    # Graine de base des effets aléatoires (rendus reproductibles)
+    seed = 42
+
+    # Étape d'optimisation appliquée par save_logo (None = sortie pretty)
+    optimizer: Optional[SVGOptimizer] = None
+
+    # Multiplicateur du nombre de particules, rayons et nœuds (1.0 = standard)
+    density = 1.0
+
     def __init__(self, variants_manager: LogoVariants):
         self.variants_manager = variants_manager
         self._validate_svgwrite()
@@ -35,6 +57,75 @@ class SVGBuilder(ABC):
         """Méthode abstraite à implémenter par chaque builder spécialisé"""
         pass
 
+    def render_logo(self, variant_name: str, size: int) -> str:
+        """Rend un logo SVG en mémoire (document complet, identique au fichier)"""
+        drawing = self.build_logo(variant_name, size)
+        buffer = io.StringIO()
+        drawing.write(buffer, pretty=True)
+        return buffer.getvalue()
+
+    def render_compiled(
+        self,
+        variant_name: str,
+        size: int,
+        density: Optional[float] = None,
+        optimizer: Optional[SVGOptimizer] = None,
+    ) -> str:
+        """Rend un logo via son gabarit compilé (sortie identique à render_logo)
+
+        La structure est compilée une fois par (type de variante, taille,
+        densité) ; les rendus suivants ne construisent plus d'arbre svgwrite.
+        Avec ``optimizer``, la sortie est optimisée (squelette optimisé une fois).
+        """
+        variant = self.variants_manager.get_variant(variant_name)
+        if not variant:
+            raise ValueError(f"Variante '{variant_name}' non trouvée")
+        builder = self if density is None else self.with_density(density)
+        return template_engine.render(builder, variant, size, optimizer)
+
+    def render_palette(
+        self,
+        variant_name: str,
+        colors: Any,
+        size: int,
+        density: Optional[float] = None,
+        optimizer: Optional[SVGOptimizer] = None,
+    ) -> str:
+        """Rend une variante avec une palette personnalisée (``ColorScheme``)
+
+        Géométrie et animations sont celles de la variante : le squelette de
+        couleurs compilé est réutilisé, seule la palette est substituée.
+        """
+        variant = self.variants_manager.get_variant(variant_name)
+        if not variant:
+            raise ValueError(f"Variante '{variant_name}' non trouvée")
+        builder = self if density is None else self.with_density(density)
+        return template_engine.render(
+            builder, dataclasses.replace(variant, colors=colors), size, optimizer
+        )
+
+    def with_density(self, density: float) -> "SVGBuilder":
+        """Builder de même configuration avec une autre densité
+
+        Retourne une copie : une instance partagée entre threads n'est jamais
+        modifiée par un rendu.
+        """
+        if density <= 0:
+            raise ValueError("La densité doit être strictement positive")
+        if density == self.density:
+            return self
+        builder = copy.copy(self)
+        builder.density = density
+        return builder
+
+    def with_optimizer(self, optimizer: Optional[SVGOptimizer]) -> "SVGBuilder":
+        """Builder de même configuration avec une autre optimisation (copie)"""
+        if optimizer is self.optimizer:
+            return self
+        builder = copy.copy(self)
+        builder.optimizer = optimizer
+        return builder
+
     def save_logo(self, variant_name: str, size: int, output_path: Any) -> None:
         """Sauvegarde un logo SVG en utilisant build_logo()"""
         try:
@@ -44,20 +135,41 @@ class SVGBuilder(ABC):
                 raise ValueError(f"Variante '{variant_name}' non trouvée")
 
             # Construction du logo avec la méthode abstraite
-            drawing = self.build_logo(variant_name, size)
+            svg_content = self.render_logo(variant_name, size)
+            if self.optimizer is not None:
+                svg_content = self.optimizer.optimize(svg_content)
 
             # Sauvegarde avec gestion des Path objects
             if hasattr(output_path, "open"):
                 # C'est un Path object
                 with output_path.open("w", encoding="utf-8") as f:
-                    drawing.write(f, pretty=True)
+                    f.write(svg_content)
+                if self.optimizer is not None:
+                    self.optimizer.write_precompressed(
+                        output_path, svg_content.encode("utf-8")
+                    )
             else:
                 # C'est un objet fichier ou une chaîne
-                drawing.write(output_path, pretty=True)
+                output_path.write(svg_content)
 
         except Exception as e:
             raise RuntimeError(f"Erreur lors de la sauvegarde du logo: {e}") from e
 
+    def get_rng(
+        self, variant: LogoVariant, size: int, layer: str = ""
+    ) -> random.Random:
+        """Crée un générateur aléatoire dédié à un rendu
+
+        La graine est dérivée de (variante, taille, graine, couche) : des
+        entrées identiques donnent toujours le même SVG, et chaque rendu
+        dispose de sa propre instance (aucun état global partagé entre threads).
+        """
+        variant_key = getattr(variant, "variant_type", variant)
+        variant_key = getattr(variant_key, "value", variant_key)
+        material = f"{variant_key}|{size}|{self.seed}|{layer}".encode()
+        digest = hashlib.sha256(material).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
+
     def create_drawing(self, size: int) -> svgwrite.Drawing:
         """Crée un dessin SVG de base (méthode utilitaire)"""
         return svgwrite.Drawing(size=(size, size), viewBox=f"0 0 {size} {size}")
@@ -3,7 +3,6 @@
 Construction d'une LUNE IA VIVANTE ultra-réaliste avec effets EXTRÊMES
 """
 
-import math
 import random
 from pathlib import Path
 from typing import Optional, Tuple
@@ -11,10 +10,30 @@ from typing import Optional, Tuple
 import svgwrite
 
 try:
+    from .defs_cache import cached_defs
+    from .geometry import (
+        draw_columns,
+        format_floats,
+        polar_points,
+        radial_layer,
+        ring_angles,
+        scaled_count,
+        stagger,
+    )
     from .svg_builder import SVGBuilder
     from .variants import LogoVariant, LogoVariants
 except ImportError:
     # Fallback pour exécution directe
+    from defs_cache import cached_defs
+    from geometry import (
+        draw_columns,
+        format_floats,
+        polar_points,
+        radial_layer,
+        ring_angles,
+        scaled_count,
+        stagger,
+    )
     from svg_builder import SVGBuilder
     from variants import LogoVariant, LogoVariants
 
@@ -28,8 +47,8 @@ class AIMoonSVGBuilder(SVGBuilder):
 
     def _setup_ai_enhancements(self) -> None:
         """Configure les améliorations IA pour la génération"""
-        # Graine aléatoire pour la cohérence des effets IA
-        random.seed(42)
+        # Graine des effets IA (voir SVGBuilder.get_rng)
+        self.seed = 42
         self.ai_complexity = 0.95  # Niveau de complexité IA (0-1)
         self.neural_layers = 8  # Nombre de couches neuronales simulées
 
@@ -78,6 +97,7 @@ class AIMoonSVGBuilder(SVGBuilder):
         # Patterns neuronaux IA
         self._add_ai_neural_patterns(defs, variant)
 
+    @cached_defs
     def _add_ai_moon_gradient(self, defs, variant: LogoVariant) -> None:
         """Crée un gradient radial IA OPTIMISÉ avec 8 stops pour la performance"""
         gradient_id = f"aiMoonGradient-{variant.variant_type.value}"
@@ -109,6 +129,7 @@ class AIMoonSVGBuilder(SVGBuilder):
 
         defs.add(gradient)
 
+    @cached_defs
     def _add_ai_glow_filters(self, defs, variant: LogoVariant) -> None:
         """Crée des filtres de lueur IA avec intelligence artificielle"""
         # Filtre principal de lueur IA
@@ -129,6 +150,7 @@ class AIMoonSVGBuilder(SVGBuilder):
 
         defs.add(main_glow)
 
+    @cached_defs
     def _add_ai_organic_filters(self, defs, variant: LogoVariant) -> None:
         """Crée des filtres de turbulence organique IA"""
         # Filtre de turbulence IA
@@ -146,6 +168,7 @@ class AIMoonSVGBuilder(SVGBuilder):
 
         defs.add(turbulence_filter)
 
+    @cached_defs
     def _add_ai_depth_masks(self, defs, variant: LogoVariant) -> None:
         """Crée des masques de profondeur IA"""
         # Masque de profondeur IA
@@ -158,6 +181,7 @@ class AIMoonSVGBuilder(SVGBuilder):
 
         defs.add(depth_mask)
 
+    @cached_defs
     def _add_ai_neural_patterns(self, defs, variant: LogoVariant) -> None:
         """Crée des patterns neuronaux IA"""
         # Pattern neuronal IA
@@ -318,18 +342,12 @@ class AIMoonSVGBuilder(SVGBuilder):
         paths = []
         radius = size // 3
 
-        # Réseau neuronal IA avec 16 connexions
-        for i in range(16):
-            angle1 = (i * 22.5) * (math.pi / 180)
-            angle2 = ((i + 8) * 22.5) * (math.pi / 180)
-
-            x1 = center + radius * math.cos(angle1)
-            y1 = center + radius * math.sin(angle1)
-            x2 = center + radius * math.cos(angle2)
-            y2 = center + radius * math.sin(angle2)
-
-            path_data = f"M{x1},{y1} L{x2},{y2}"
-            paths.append(path_data)
+        # Réseau neuronal IA avec 16 connexions (× densité), vers le nœud opposé
+        count = scaled_count(16, self.density)
+        starts = polar_points(center, radius, ring_angles(count))
+        ends = polar_points(center, radius, ring_angles(count, start=count / 2))
+        columns = [format_floats(values) for values in (*starts, *ends)]
+        paths.extend(f"M{x1},{y1} L{x2},{y2}" for x1, y1, x2, y2 in zip(*columns))
 
         return paths
 
@@ -339,12 +357,11 @@ class AIMoonSVGBuilder(SVGBuilder):
         """Ajoute des nœuds de connexion IA"""
         radius = size // 3
 
-        # Nœuds principaux IA
-        for i in range(16):
-            angle = (i * 22.5) * (math.pi / 180)
-            x = center + radius * math.cos(angle)
-            y = center + radius * math.sin(angle)
-
+        # Nœuds principaux IA (× densité)
+        nodes = radial_layer(
+            scaled_count(16, self.density), center=center, distance=radius
+        )
+        for x, y, _, _ in nodes.formatted(precision=None):
             # Nœud principal IA
             node = svgwrite.shapes.Circle(
                 center=(x, y),
@@ -369,26 +386,38 @@ class AIMoonSVGBuilder(SVGBuilder):
             drawing.add(node_halo)
 
     def add_ai_moon_particles(
-        self, drawing: svgwrite.Drawing, variant: LogoVariant, size: int
+        self,
+        drawing: svgwrite.Drawing,
+        variant: LogoVariant,
+        size: int,
+        rng: Optional[random.Random] = None,
     ) -> None:
         """Ajoute des particules IA avec effets complexes"""
-        center = size // 2
-
-        # 25 particules IA
-        for i in range(25):
-            angle = (i * 14.4) * (math.pi / 180)
-            radius = size // 2 - 50 + random.uniform(-15, 15)  # nosec B311
-
-            x = center + radius * math.cos(angle)
-            y = center + radius * math.sin(angle)
+        if rng is None:
+            rng = self.get_rng(variant, size, "particles")
+        orbit = size // 2 - 50
+
+        # 25 particules IA (× densité), géométrie calculée en une passe
+        count = scaled_count(25, self.density)
+        jitters, radii = draw_columns(
+            rng,
+            count,
+            lambda r: r.uniform(-15, 15),  # nosec B311
+            lambda r: r.uniform(2, 4),  # nosec B311
+        )
+        layer = radial_layer(
+            count, center=size // 2, distance=orbit + jitters, size=radii
+        )
+        begins = stagger(count, 0.1 / self.density, precision=None)
 
+        for (x, y, r, _), begin in zip(layer.formatted(precision=None), begins):
             # Particule principale IA
             particle = svgwrite.shapes.Circle(
                 center=(x, y),
-                r=random.uniform(2, 4),
+                r=r,
                 fill=variant.colors.glow,
                 opacity=0.8,
-            )  # nosec B311
+            )
 
             # Animation de scintillement IA
             particle.add(
@@ -396,7 +425,7 @@ class AIMoonSVGBuilder(SVGBuilder):
                     attributeName="opacity",
                     values="0.8;0.2;0.8",
                     dur=f"{3 / variant.animation_speed}s",
-                    begin=f"{i * 0.1}s",
+                    begin=begin,
                     repeatCount="indefinite",
                 )
             )
@@ -409,12 +438,12 @@ class AIMoonSVGBuilder(SVGBuilder):
         """Ajoute des rayons IA avec effets dynamiques"""
         center = size // 2
 
-        # 16 rayons IA
-        for i in range(16):
-            angle = (i * 22.5) * (math.pi / 180)
-            x = center + int((size // 2 - 25) * math.cos(angle))
-            y = center + int((size // 2 - 25) * math.sin(angle))
+        # 16 rayons IA (× densité), extrémités entières
+        count = scaled_count(16, self.density)
+        ends = radial_layer(count, center=center, distance=size // 2 - 25)
+        begins = stagger(count, 0.15 / self.density, precision=None)
 
+        for (x, y, _, _), begin in zip(ends.truncated().formatted(), begins):
             # Rayon IA
             ray = svgwrite.shapes.Line(
                 start=(center, center),
@@ -431,7 +460,7 @@ class AIMoonSVGBuilder(SVGBuilder):
                     attributeName="opacity",
                     values="0.7;0.3;0.7",
                     dur=f"{4 / variant.animation_speed}s",
-                    begin=f"{i * 0.15}s",
+                    begin=begin,
                     repeatCount="indefinite",
                 )
             )
@@ -3,17 +3,20 @@
 Construction d'icônes dashboard/networking synthétiques selon le cahier des charges
 """
 
-import math
 from pathlib import Path
 from typing import Optional, Tuple
 
 import svgwrite
 
 try:
+    from .defs_cache import cached_defs
+    from .geometry import radial_layer, scaled_count, stagger
     from .svg_builder import SVGBuilder
     from .variants import LogoVariant, LogoVariants
 except ImportError:
     # Fallback pour exécution directe
+    from defs_cache import cached_defs
+    from geometry import radial_layer, scaled_count, stagger
     from svg_builder import SVGBuilder
     from variants import LogoVariant, LogoVariants
 
@@ -68,6 +71,7 @@ class DashboardSVGBuilder(SVGBuilder):
         # Filtre de lueur
         self._add_glow_filter(defs, variant)
 
+    @cached_defs
     def _add_main_gradient(self, defs, variant: LogoVariant) -> None:
         """Crée le gradient principal dashboard"""
         gradient_id = f"mainGradient-{variant.variant_type.value}"
@@ -94,6 +98,7 @@ class DashboardSVGBuilder(SVGBuilder):
 
         defs.add(gradient)
 
+    @cached_defs
     def _add_halo_gradient(self, defs, variant: LogoVariant) -> None:
         """Crée un gradient pour le halo lumineux synthétique"""
         halo_gradient_id = f"haloGradient-{variant.variant_type.value}"
@@ -114,6 +119,7 @@ class DashboardSVGBuilder(SVGBuilder):
 
         defs.add(halo_gradient)
 
+    @cached_defs
     def _add_core_gradient(self, defs, variant: LogoVariant) -> None:
         """Crée un gradient pour le centre/A-core lumineux"""
         core_gradient_id = f"coreGradient-{variant.variant_type.value}"
@@ -134,6 +140,7 @@ class DashboardSVGBuilder(SVGBuilder):
 
         defs.add(core_gradient)
 
+    @cached_defs
     def _add_glow_filter(self, defs, variant: LogoVariant) -> None:
         """Crée un filtre de lueur dashboard"""
         filter_id = f"glow-{variant.variant_type.value}"
@@ -335,12 +342,12 @@ class DashboardSVGBuilder(SVGBuilder):
         """Ajoute des rayons dynamiques synthétiques"""
         center = size // 2
 
-        # 8 rayons principaux
-        for i in range(8):
-            angle = (i * 45) * (math.pi / 180)
-            x = center + int((size // 2 - 30) * math.cos(angle))
-            y = center + int((size // 2 - 30) * math.sin(angle))
+        # 8 rayons principaux (× densité), extrémités entières
+        count = scaled_count(8, self.density)
+        ends = radial_layer(count, center=center, distance=size // 2 - 30)
+        begins = stagger(count, 0.2 / self.density, precision=None)
 
+        for (x, y, _, _), begin in zip(ends.truncated().formatted(), begins):
             # Rayon simple
             ray = svgwrite.shapes.Line(
                 start=(center, center),
@@ -356,7 +363,7 @@ class DashboardSVGBuilder(SVGBuilder):
                     attributeName="opacity",
                     values="0.6;1.0;0.6",
                     dur=f"{3 / variant.animation_speed}s",
-                    begin=f"{i * 0.2}s",
+                    begin=begin,
                     repeatCount="indefinite",
                 )
             )
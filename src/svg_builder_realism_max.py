@@ -10,10 +10,14 @@ from typing import Optional, Tuple
 import svgwrite
 
 try:
+    from .defs_cache import cached_defs
+    from .geometry import draw_columns, radial_layer
     from .svg_builder import SVGBuilder
     from .variants import LogoVariant, LogoVariants
 except ImportError:
     # Fallback pour exécution directe
+    from defs_cache import cached_defs
+    from geometry import draw_columns, radial_layer
     from svg_builder import SVGBuilder
     from variants import LogoVariant, LogoVariants
 
@@ -27,8 +31,8 @@ class RealismMaxSVGBuilder(SVGBuilder):
 
     def _setup_realism_enhancements(self) -> None:
         """Configure les améliorations réalistes pour la génération"""
-        # Graine aléatoire pour la cohérence des effets organiques
-        random.seed(42)
+        # Graine des effets organiques (voir SVGBuilder.get_rng)
+        self.seed = 42
         self.realism_level = 0.95  # Niveau de réalisme (0-1)
         self.organic_complexity = 0.8  # Complexité organique
         self.ai_enhancement = True  # Amélioration IA active
@@ -72,6 +76,7 @@ class RealismMaxSVGBuilder(SVGBuilder):
         # Masques de profondeur réalistes
         self._add_depth_masks(defs, variant)
 
+    @cached_defs
     def _add_realistic_gradients(self, defs, variant: LogoVariant) -> None:
         """Crée des gradients réalistes optimisés (5-7 stops max pour la performance)"""
         gradient_id = f"realisticGradient-{variant.variant_type.value}"
@@ -115,6 +120,7 @@ class RealismMaxSVGBuilder(SVGBuilder):
 
         defs.add(border_gradient)
 
+    @cached_defs
     def _add_realistic_glow_filters(self, defs, variant: LogoVariant) -> None:
         """Crée des filtres de lueur réalistes optimisés"""
         # Filtre de lueur principal
@@ -127,6 +133,7 @@ class RealismMaxSVGBuilder(SVGBuilder):
 
         defs.add(glow_filter)
 
+    @cached_defs
     def _add_organic_filters(self, defs, variant: LogoVariant) -> None:
         """Crée des filtres organiques et de turbulence"""
         # Filtre de turbulence organique
@@ -141,6 +148,7 @@ class RealismMaxSVGBuilder(SVGBuilder):
 
         defs.add(turbulence_filter)
 
+    @cached_defs
     def _add_depth_masks(self, defs, variant: LogoVariant) -> None:
         """Crée des masques de profondeur réalistes"""
         # Masque de profondeur principal
@@ -202,22 +210,38 @@ class RealismMaxSVGBuilder(SVGBuilder):
         size: int,
         center: int,
         radius: int,
+        rng: Optional[random.Random] = None,
     ) -> None:
         """Ajoute des effets organiques avancés"""
-        # Particules organiques
-        num_particles = int(5 * self.realism_level)
-        for _ in range(num_particles):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(radius * 0.8, radius * 1.2)
-
-            x = center + distance * math.cos(angle)
-            y = center + distance * math.sin(angle)
-
+        if rng is None:
+            rng = self.get_rng(variant, size, "organic")
+
+        # Particules organiques (× densité), géométrie calculée en une passe
+        num_particles = int(5 * self.realism_level * self.density)
+        if num_particles == 0:
+            return
+        angles, distances, radii, opacities = draw_columns(
+            rng,
+            num_particles,
+            lambda r: r.uniform(0, 2 * math.pi),
+            lambda r: r.uniform(radius * 0.8, radius * 1.2),
+            lambda r: r.uniform(1, 3),
+            lambda r: r.uniform(0.3, 0.7),
+        )
+        layer = radial_layer(
+            num_particles,
+            center=center,
+            distance=distances,
+            size=radii,
+            opacity=opacities,
+            angles=angles,
+        )
+        for x, y, r, opacity in layer.formatted(precision=None):
             particle = svgwrite.shapes.Circle(
                 cx=x,
                 cy=y,
-                r=random.uniform(1, 3),
+                r=r,
                 fill=variant.colors.glow,
-                opacity=random.uniform(0.3, 0.7),
+                opacity=opacity,
             )
             drawing.add(particle)
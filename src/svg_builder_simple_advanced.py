@@ -10,10 +10,28 @@ from typing import Optional, Tuple
 import svgwrite
 
 try:
+    from .defs_cache import cached_defs
+    from .geometry import (
+        format_floats,
+        polar_points,
+        radial_layer,
+        ring_angles,
+        scaled_count,
+        stagger,
+    )
     from .svg_builder import SVGBuilder
     from .variants import LogoVariant, LogoVariants
 except ImportError:
     # Fallback pour exécution directe
+    from defs_cache import cached_defs
+    from geometry import (
+        format_floats,
+        polar_points,
+        radial_layer,
+        ring_angles,
+        scaled_count,
+        stagger,
+    )
     from svg_builder import SVGBuilder
     from variants import LogoVariant, LogoVariants
 
@@ -65,6 +83,7 @@ class SimpleAdvancedSVGBuilder(SVGBuilder):
         # Gradients pour les réseaux neuronaux
         self._add_neural_network_gradients(defs, variant)
 
+    @cached_defs
     def _add_advanced_moon_gradient(self, defs, variant: LogoVariant) -> None:
         """Crée un gradient radial avancé avec multiples stops"""
         gradient_id = f"advancedMoonGradient-{variant.variant_type.value}"
@@ -110,6 +129,7 @@ class SimpleAdvancedSVGBuilder(SVGBuilder):
 
         defs.add(border_gradient)
 
+    @cached_defs
     def _add_advanced_glow_filters(self, defs, variant: LogoVariant) -> None:
         """Crée des filtres de lueur avancés avec multiples effets"""
         # Filtre principal de lueur
@@ -139,6 +159,7 @@ class SimpleAdvancedSVGBuilder(SVGBuilder):
 
         defs.add(detail_glow)
 
+    @cached_defs
     def _add_neural_network_gradients(self, defs, variant: LogoVariant) -> None:
         """Crée des gradients pour les réseaux neuronaux"""
         # Gradient linéaire pour les connexions
@@ -336,16 +357,17 @@ class SimpleAdvancedSVGBuilder(SVGBuilder):
             f"{center} {center - 10} {center + size // 3 - 10}"
         )
 
-        # Réseau circulaire
-        for i in range(8):
-            angle = (i * 45) * (math.pi / 180)
-            radius = size // 4
-            x1 = center + radius * math.cos(angle)
-            y1 = center + radius * math.sin(angle)
-            x2 = center + radius * math.cos(angle + math.pi / 4)
-            y2 = center + radius * math.sin(angle + math.pi / 4)
-
-            paths.append(f"M{x1} {y1} Q{center} {center} {x2} {y2}")
+        # Réseau circulaire : arcs entre nœuds voisins (× densité)
+        count = scaled_count(8, self.density)
+        starts = polar_points(center, size // 4, ring_angles(count))
+        ends = polar_points(
+            center, size // 4, ring_angles(count, offset=2 * math.pi / count)
+        )
+        columns = [format_floats(values) for values in (*starts, *ends)]
+        paths.extend(
+            f"M{x1} {y1} Q{center} {center} {x2} {y2}"
+            for x1, y1, x2, y2 in zip(*columns)
+        )
 
         return paths
 
@@ -470,13 +492,21 @@ class SimpleAdvancedSVGBuilder(SVGBuilder):
         """Ajoute des effets de particules avancés"""
         center = size // 2
 
-        # Particules principales
-        for i in range(12):
-            angle = (i * 30) * (math.pi / 180)
-            radius = size // 2 - 25
-            x = center + radius * math.cos(angle)
-            y = center + radius * math.sin(angle)
+        # Particules principales (× densité), orbites calculées en une passe
+        count = scaled_count(12, self.density)
+        angles = ring_angles(count)
+        layer = radial_layer(count, center=center, distance=size // 2 - 25)
+        drift_x, drift_y = polar_points(0, 5, angles + math.pi / 6)
+        columns = zip(
+            format_floats(layer.x),
+            format_floats(layer.y),
+            format_floats(layer.x + drift_x),
+            format_floats(layer.y + drift_y),
+            stagger(count, 0.2 / self.density, precision=None),
+            stagger(count, 0.1 / self.density, precision=None),
+        )
 
+        for x, y, orbit_x, orbit_y, blink_begin, orbit_begin in columns:
             particle = svgwrite.shapes.Circle(
                 center=(x, y),
                 r=2.5,
@@ -491,7 +521,7 @@ class SimpleAdvancedSVGBuilder(SVGBuilder):
                     attributeName="opacity",
                     values="0.7;1.0;0.7",
                     dur=f"{2.5 / variant.animation_speed}s",
-                    begin=f"{i * 0.2}s",
+                    begin=blink_begin,
                     repeatCount="indefinite",
                 )
             )
@@ -500,9 +530,9 @@ class SimpleAdvancedSVGBuilder(SVGBuilder):
             particle.add(
                 svgwrite.animate.Animate(
                     attributeName="cx",
-                    values=f"{x};{x + 5 * math.cos(angle + math.pi / 6)};{x}",
+                    values=f"{x};{orbit_x};{x}",
                     dur=f"{4 / variant.animation_speed}s",
-                    begin=f"{i * 0.1}s",
+                    begin=orbit_begin,
                     repeatCount="indefinite",
                 )
             )
@@ -510,9 +540,9 @@ class SimpleAdvancedSVGBuilder(SVGBuilder):
             particle.add(
                 svgwrite.animate.Animate(
                     attributeName="cy",
-                    values=f"{y};{y + 5 * math.sin(angle + math.pi / 6)};{y}",
+                    values=f"{y};{orbit_y};{y}",
                     dur=f"{4 / variant.animation_speed}s",
-                    begin=f"{i * 0.1}s",
+                    begin=orbit_begin,
                     repeatCount="indefinite",
                 )
             )
@@ -12,10 +12,30 @@ import svgwrite
 from svgwrite import filters, gradients, masking
 
 try:
+    from .defs_cache import cached_defs
+    from .geometry import (
+        draw_columns,
+        format_floats,
+        polar_points,
+        radial_layer,
+        ring_angles,
+        scaled_count,
+        stagger,
+    )
     from .svg_builder import SVGBuilder
     from .variants import LogoVariant, LogoVariants
 except ImportError:
     # Fallback pour exécution directe
+    from defs_cache import cached_defs
+    from geometry import (
+        draw_columns,
+        format_floats,
+        polar_points,
+        radial_layer,
+        ring_angles,
+        scaled_count,
+        stagger,
+    )
     from svg_builder import SVGBuilder
     from variants import LogoVariant, LogoVariants
 
@@ -29,8 +49,8 @@ class UltimateSVGBuilder(SVGBuilder):
 
     def _setup_ultimate_enhancements(self) -> None:
         """Configure les améliorations ULTIMES pour la génération"""
-        # Graine aléatoire pour la cohérence des effets cosmiques
-        random.seed(42)
+        # Graine des effets cosmiques (voir SVGBuilder.get_rng)
+        self.seed = 42
         self.cosmic_complexity = 0.98  # Niveau de complexité cosmique (0-1)
         self.ultimate_effects = True  # Effets ULTIMES actifs
 
@@ -71,6 +91,7 @@ class UltimateSVGBuilder(SVGBuilder):
         # Motifs ULTIMES cosmiques (utilise la taille du paramètre)
         self._add_ultimate_patterns(defs, variant, 200)  # Taille par défaut
 
+    @cached_defs
     def _add_ultimate_gradients(self, defs, variant: LogoVariant) -> None:
         """Crée des gradients ULTIMES avec 100+ stops pour un réalisme cosmique parfait"""
         # Gradient principal cosmique ULTIME
@@ -137,6 +158,7 @@ class UltimateSVGBuilder(SVGBuilder):
 
         defs.add(secondary_cosmic)
 
+    @cached_defs
     def _add_ultimate_filters(self, defs, variant: LogoVariant) -> None:
         """Crée des filtres ULTIMES cosmiques avec effets extrêmes"""
         # Filtre de lueur cosmique ULTIME
@@ -192,6 +214,7 @@ class UltimateSVGBuilder(SVGBuilder):
 
         defs.add(cosmic_depth_filter)
 
+    @cached_defs
     def _add_ultimate_masks(self, defs, variant: LogoVariant, size: int) -> None:
         """Crée des masques ULTIMES pour des effets cosmiques parfaits"""
         # Masque de profondeur cosmique ULTIME
@@ -222,8 +245,18 @@ class UltimateSVGBuilder(SVGBuilder):
 
         defs.add(cosmic_organic_mask)
 
-    def _add_ultimate_patterns(self, defs, variant: LogoVariant, size: int) -> None:
+    @cached_defs
+    def _add_ultimate_patterns(
+        self,
+        defs,
+        variant: LogoVariant,
+        size: int,
+        rng: Optional[random.Random] = None,
+    ) -> None:
         """Crée des motifs ULTIMES cosmiques et organiques"""
+        if rng is None:
+            rng = self.get_rng(variant, size, "patterns")
+
         # Motif de surface cosmique ULTIME
         cosmic_surface_id = f"ultimateCosmicSurfacePattern-{variant.variant_type.value}"
         cosmic_surface_pattern = svgwrite.pattern.Pattern(
@@ -235,10 +268,10 @@ class UltimateSVGBuilder(SVGBuilder):
 
         # Créer des cercles cosmiques organiques
         for _ in range(12):
-            x = random.randint(0, size // 3)
-            y = random.randint(0, size // 3)
-            radius = random.randint(3, 10)
-            opacity = random.uniform(0.15, 0.5)
+            x = rng.randint(0, size // 3)
+            y = rng.randint(0, size // 3)
+            radius = rng.randint(3, 10)
+            opacity = rng.uniform(0.15, 0.5)
 
             circle = svgwrite.shapes.Circle(
                 center=(x, y), r=radius, fill=variant.colors.primary, opacity=opacity
@@ -258,10 +291,10 @@ class UltimateSVGBuilder(SVGBuilder):
 
         # Lignes de connexion neuronales cosmiques
         for _ in range(10):
-            x1 = random.randint(0, size // 1.5)
-            y1 = random.randint(0, size // 1.5)
-            x2 = random.randint(0, size // 1.5)
-            y2 = random.randint(0, size // 1.5)
+            x1 = rng.randint(0, size // 1.5)
+            y1 = rng.randint(0, size // 1.5)
+            x2 = rng.randint(0, size // 1.5)
+            y2 = rng.randint(0, size // 1.5)
 
             line = svgwrite.shapes.Line(
                 start=(x1, y1),
@@ -289,12 +322,10 @@ class UltimateSVGBuilder(SVGBuilder):
         )
         drawing.add(cosmic_circle)
 
-        # Connexions cosmiques ULTIMES
-        for i in range(8):
-            angle = (i * 45) * (math.pi / 180)
-            x = center + int(size * 0.4 * math.cos(angle))
-            y = center + int(size * 0.4 * math.sin(angle))
-
+        # Connexions cosmiques ULTIMES (× densité)
+        count = scaled_count(8, self.density)
+        nodes = radial_layer(count, center=center, distance=size * 0.4).truncated()
+        for x, y, _, _ in nodes.formatted():
             cosmic_connection = svgwrite.shapes.Circle(
                 center=(x, y),
                 r=8,
@@ -348,6 +379,7 @@ class UltimateSVGBuilder(SVGBuilder):
 
         # Réseau cosmique complexe avec courbes de Bézier
         network_paths = self._generate_cosmic_neural_paths(center, size)
+        begins = stagger(len(network_paths), 0.4 / self.density, precision=None)
 
         for i, path_data in enumerate(network_paths):
             path = svgwrite.path.Path(d=path_data)
@@ -358,7 +390,7 @@ class UltimateSVGBuilder(SVGBuilder):
                     attributeName="stroke-dashoffset",
                     values="0;-300;0",
                     dur=f"{6 / variant.animation_speed}s",
-                    begin=f"{i * 0.4}s",
+                    begin=begins[i],
                     repeatCount="indefinite",
                 )
             )
@@ -367,8 +399,11 @@ class UltimateSVGBuilder(SVGBuilder):
 
         drawing.add(cosmic_network)
 
-    def _generate_cosmic_neural_paths(self, center: int, size: int) -> list:
+    def _generate_cosmic_neural_paths(
+        self, center: int, size: int, density: Optional[float] = None
+    ) -> list:
         """Génère des chemins neuronaux cosmiques ULTIMES"""
+        density = self.density if density is None else density
         paths = []
 
         # Réseau cosmique principal avec courbes complexes
@@ -393,16 +428,17 @@ class UltimateSVGBuilder(SVGBuilder):
             f"M{center - size // 3} {center + size // 3} Q{center} {center} {center + size // 3} {center + size // 3}"
         )
 
-        # Réseau cosmique circulaire ULTIME
-        for i in range(12):
-            angle = (i * 30) * (math.pi / 180)
-            radius = size // 3
-            x1 = center + radius * math.cos(angle)
-            y1 = center + radius * math.sin(angle)
-            x2 = center + radius * math.cos(angle + math.pi / 6)
-            y2 = center + radius * math.sin(angle + math.pi / 6)
-
-            paths.append(f"M{x1} {y1} Q{center} {center} {x2} {y2}")
+        # Réseau cosmique circulaire ULTIME : arcs entre nœuds voisins
+        count = scaled_count(12, density)
+        starts = polar_points(center, size // 3, ring_angles(count))
+        ends = polar_points(
+            center, size // 3, ring_angles(count, offset=2 * math.pi / count)
+        )
+        columns = [format_floats(values) for values in (*starts, *ends)]
+        paths.extend(
+            f"M{x1} {y1} Q{center} {center} {x2} {y2}"
+            for x1, y1, x2, y2 in zip(*columns)
+        )
 
         return paths
 
@@ -452,25 +488,48 @@ class UltimateSVGBuilder(SVGBuilder):
         drawing.add(cosmic_energy_aura)
 
     def add_ultimate_cosmic_particles(
-        self, drawing: svgwrite.Drawing, variant: LogoVariant, size: int
+        self,
+        drawing: svgwrite.Drawing,
+        variant: LogoVariant,
+        size: int,
+        rng: Optional[random.Random] = None,
+        density: Optional[float] = None,
     ) -> None:
         """Ajoute des particules cosmiques ULTIMES"""
+        if rng is None:
+            rng = self.get_rng(variant, size, "particles")
+        density = self.density if density is None else density
         center = size // 2
         radius = size // 2.2
 
-        # Particules cosmiques flottantes ULTIMES
-        for i in range(20):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(radius * 0.4, radius * 1.4)
-            x = center + int(distance * math.cos(angle))
-            y = center + int(distance * math.sin(angle))
-            particle_size = random.randint(3, 8)
-
+        # Particules cosmiques flottantes ULTIMES (× densité), géométrie en une passe
+        count = scaled_count(20, density)
+        angles, distances, sizes, opacities = draw_columns(
+            rng,
+            count,
+            lambda r: r.uniform(0, 2 * math.pi),
+            lambda r: r.uniform(radius * 0.4, radius * 1.4),
+            lambda r: r.randint(3, 8),
+            lambda r: r.uniform(0.5, 0.9),
+        )
+        layer = radial_layer(
+            count,
+            center=center,
+            distance=distances,
+            size=sizes,
+            opacity=opacities,
+            angles=angles,
+        ).truncated()
+        begins = stagger(count, 0.1 / density, precision=None)
+
+        for (x, y, particle_size, opacity), begin in zip(
+            layer.formatted(precision=None), begins
+        ):
             cosmic_particle = svgwrite.shapes.Circle(
                 center=(x, y),
                 r=particle_size,
                 fill=variant.colors.glow,
-                opacity=random.uniform(0.5, 0.9),
+                opacity=opacity,
             )
 
             # Animation de scintillement cosmique ULTIME
@@ -479,7 +538,7 @@ class UltimateSVGBuilder(SVGBuilder):
                     attributeName="opacity",
                     values="0.5;1.0;0.5",
                     dur=f"{2.5 / variant.animation_speed}s",
-                    begin=f"{i * 0.1}s",
+                    begin=begin,
                     repeatCount="indefinite",
                 )
             )
@@ -492,13 +551,11 @@ class UltimateSVGBuilder(SVGBuilder):
         """Ajoute des effets holographiques ULTIMES cosmiques"""
         center = size // 2
 
-        # Reflets holographiques cosmiques ULTIMES
-        for i in range(6):
-            angle = (i * 60) * (math.pi / 180)
-            distance = size // 2.5
-            x = center + int(distance * math.cos(angle))
-            y = center + int(distance * math.sin(angle))
-
+        # Reflets holographiques cosmiques ULTIMES (× densité)
+        count = scaled_count(6, self.density)
+        reflections = radial_layer(count, center=center, distance=size // 2.5)
+        begins = stagger(count, 0.2 / self.density, precision=None)
+        for (x, y, _, _), begin in zip(reflections.truncated().formatted(), begins):
             holographic_reflection = svgwrite.shapes.Circle(
                 center=(x, y),
                 r=10,
@@ -513,23 +570,20 @@ class UltimateSVGBuilder(SVGBuilder):
                     attributeName="r",
                     values="10;15;10",
                     dur=f"{3 / variant.animation_speed}s",
-                    begin=f"{i * 0.2}s",
+                    begin=begin,
                     repeatCount="indefinite",
                 )
             )
 
             drawing.add(holographic_reflection)
 
-        # Rayons holographiques cosmiques ULTIMES
-        for i in range(8):
-            angle = (i * 45) * (math.pi / 180)
-            start_x = center
-            start_y = center
-            end_x = center + int(size * 0.45 * math.cos(angle))
-            end_y = center + int(size * 0.45 * math.sin(angle))
-
+        # Rayons holographiques cosmiques ULTIMES (× densité)
+        count = scaled_count(8, self.density)
+        ends = radial_layer(count, center=center, distance=size * 0.45)
+        begins = stagger(count, 0.15 / self.density, precision=None)
+        for (end_x, end_y, _, _), begin in zip(ends.truncated().formatted(), begins):
             holographic_ray = svgwrite.shapes.Line(
-                start=(start_x, start_y),
+                start=(center, center),
                 end=(end_x, end_y),
                 stroke=variant.colors.accent,
                 stroke_width=2.5,
@@ -543,7 +597,7 @@ class UltimateSVGBuilder(SVGBuilder):
                     attributeName="opacity",
                     values="0.6;1.0;0.6",
                     dur=f"{4 / variant.animation_speed}s",
-                    begin=f"{i * 0.15}s",
+                    begin=begin,
                     repeatCount="indefinite",
                 )
             )
@@ -602,12 +656,13 @@ class UltimateSVGBuilder(SVGBuilder):
         # Effets de lumière cosmiques ULTIMES
         cosmic_light_effects = svgwrite.container.Group()
 
-        # Rayons lumineux cosmiques ULTIMES
-        for i in range(8):
-            angle = (i * 45) * (math.pi / 180)
-            x = center + 25 * math.cos(angle)
-            y = center - 10 + 25 * math.sin(angle)
-
+        # Rayons lumineux cosmiques ULTIMES (× densité)
+        count = scaled_count(8, self.density)
+        dx, dy = polar_points(0, 25, ring_angles(count))
+        begins = stagger(count, 0.2 / self.density, precision=None)
+        for x, y, begin in zip(
+            format_floats(center + dx), format_floats(center - 10 + dy), begins
+        ):
             cosmic_ray = svgwrite.shapes.Circle(
                 center=(x, y), r=3, fill=variant.colors.glow, opacity=0.7
             )
@@ -618,7 +673,7 @@ class UltimateSVGBuilder(SVGBuilder):
                     attributeName="opacity",
                     values="0.7;1.0;0.7",
                     dur=f"{3.5 / variant.animation_speed}s",
-                    begin=f"{i * 0.2}s",
+                    begin=begin,
                     repeatCount="indefinite",
                 )
             )
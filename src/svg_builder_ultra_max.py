@@ -3,7 +3,6 @@
 Construction des logos SVG Arkalia-LUNA ultra-max
 """
 
-import math
 import random
 from pathlib import Path
 from typing import Optional, Tuple
@@ -11,10 +10,14 @@ from typing import Optional, Tuple
 import svgwrite
 
 try:
+    from .defs_cache import cached_defs
+    from .geometry import draw_columns, radial_layer, scaled_count, stagger
     from .svg_builder import SVGBuilder
     from .variants import LogoVariant, LogoVariants
 except ImportError:
     # Fallback pour exécution directe
+    from defs_cache import cached_defs
+    from geometry import draw_columns, radial_layer, scaled_count, stagger
     from svg_builder import SVGBuilder
     from variants import LogoVariant, LogoVariants
 
@@ -35,8 +38,8 @@ class UltraMaxSVGBuilder(SVGBuilder):
             )
 
     def _setup_random_seed(self):
-        """Configure la graine aléatoire pour la cohérence"""
-        random.seed(42)  # Graine fixe pour la cohérence
+        """Configure la graine aléatoire pour la cohérence (voir SVGBuilder.get_rng)"""
+        self.seed = 42  # Graine fixe, appliquée par rendu et non globalement
 
     def create_drawing(
         self, size: int, viewbox: Optional[Tuple[int, int, int, int]] = None
@@ -80,6 +83,7 @@ class UltraMaxSVGBuilder(SVGBuilder):
         # Patterns ULTRA-MAX
         self._add_ultra_max_patterns(defs, variant)
 
+    @cached_defs
     def _add_ultra_max_gradients(self, defs, variant: LogoVariant) -> None:
         """Crée des gradients ULTRA-MAX OPTIMISÉS pour la performance"""
         # Gradient principal ULTRA-MAX OPTIMISÉ (7 stops au lieu de 15+)
@@ -133,6 +137,7 @@ class UltraMaxSVGBuilder(SVGBuilder):
 
         defs.add(glow_gradient)
 
+    @cached_defs
     def _add_ultra_max_filters(self, defs, variant: LogoVariant) -> None:
         """Crée des filtres ULTRA-MAX"""
         # Filtre principal ULTRA-MAX
@@ -162,6 +167,7 @@ class UltraMaxSVGBuilder(SVGBuilder):
 
         defs.add(turbulence_filter)
 
+    @cached_defs
     def _add_ultra_max_masks(self, defs, variant: LogoVariant) -> None:
         """Crée des masques ULTRA-MAX"""
         # Masque de profondeur ULTRA-MAX
@@ -174,6 +180,7 @@ class UltraMaxSVGBuilder(SVGBuilder):
 
         defs.add(depth_mask)
 
+    @cached_defs
     def _add_ultra_max_patterns(self, defs, variant: LogoVariant) -> None:
         """Crée des patterns ULTRA-MAX"""
         # Pattern de grille ULTRA-MAX
@@ -431,26 +438,40 @@ class UltraMaxSVGBuilder(SVGBuilder):
             drawing.add(node_halo)
 
     def add_ultra_max_particles(
-        self, drawing: svgwrite.Drawing, variant: LogoVariant, size: int
+        self,
+        drawing: svgwrite.Drawing,
+        variant: LogoVariant,
+        size: int,
+        rng: Optional[random.Random] = None,
+        density: Optional[float] = None,
     ) -> None:
         """Ajoute des particules ULTRA-MAX avec effets complexes"""
-        center = size // 2
-
-        # 20 particules ULTRA-MAX
-        for i in range(20):
-            angle = (i * 18) * (math.pi / 180)
-            radius = size // 2 - 40 + random.uniform(-10, 10)  # nosec B311
-
-            x = center + radius * math.cos(angle)
-            y = center + radius * math.sin(angle)
+        if rng is None:
+            rng = self.get_rng(variant, size, "particles")
+        density = self.density if density is None else density
+        orbit = size // 2 - 40
+
+        # 20 particules ULTRA-MAX (× densité), géométrie calculée en une passe
+        count = scaled_count(20, density)
+        jitters, radii = draw_columns(
+            rng,
+            count,
+            lambda r: r.uniform(-10, 10),  # nosec B311
+            lambda r: r.uniform(1.5, 3.5),  # nosec B311
+        )
+        layer = radial_layer(
+            count, center=size // 2, distance=orbit + jitters, size=radii
+        )
+        begins = stagger(count, 0.1 / density, precision=None)
 
+        for (x, y, r, _), begin in zip(layer.formatted(precision=None), begins):
             # Particule principale
             particle = svgwrite.shapes.Circle(
                 center=(x, y),
-                r=random.uniform(1.5, 3.5),
+                r=r,
                 fill=variant.colors.glow,
                 opacity=0.8,
-            )  # nosec B311
+            )
 
             # Animation de scintillement ULTRA-MAX
             particle.add(
@@ -458,7 +479,7 @@ class UltraMaxSVGBuilder(SVGBuilder):
                     attributeName="opacity",
                     values="0.8;0.2;0.8",
                     dur=f"{2 / variant.animation_speed}s",
-                    begin=f"{i * 0.1}s",
+                    begin=begin,
                     repeatCount="indefinite",
                 )
             )
@@ -466,17 +487,22 @@ class UltraMaxSVGBuilder(SVGBuilder):
             drawing.add(particle)
 
     def add_ultra_max_rays(
-        self, drawing: svgwrite.Drawing, variant: LogoVariant, size: int
+        self,
+        drawing: svgwrite.Drawing,
+        variant: LogoVariant,
+        size: int,
+        density: Optional[float] = None,
     ) -> None:
         """Ajoute des rayons ULTRA-MAX avec effets dynamiques"""
+        density = self.density if density is None else density
         center = size // 2
 
-        # 12 rayons ULTRA-MAX
-        for i in range(12):
-            angle = (i * 30) * (math.pi / 180)
-            x = center + int((size // 2 - 20) * math.cos(angle))
-            y = center + int((size // 2 - 20) * math.sin(angle))
+        # 12 rayons ULTRA-MAX (× densité), extrémités entières
+        count = scaled_count(12, density)
+        ends = radial_layer(count, center=center, distance=size // 2 - 20)
+        begins = stagger(count, 0.2 / density, precision=None)
 
+        for (x, y, _, _), begin in zip(ends.truncated().formatted(), begins):
             # Rayon ULTRA-MAX
             ray = svgwrite.shapes.Line(
                 start=(center, center),
@@ -493,7 +519,7 @@ class UltraMaxSVGBuilder(SVGBuilder):
                     attributeName="opacity",
                     values="0.7;1.0;0.7",
                     dur=f"{3 / variant.animation_speed}s",
-                    begin=f"{i * 0.2}s",
+                    begin=begin,
                     repeatCount="indefinite",
                 )
             )
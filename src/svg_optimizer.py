@@ -0,0 +1,330 @@
+"""
+🌙 SVG Optimizer Module
+Optimisation et pré-compression des documents SVG produits
+"""
+
+import gzip
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import brotli
+except ImportError:  # Dépendance optionnelle
+    brotli = None  # type: ignore
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+EV_NS = "http://www.w3.org/2001/xml-events"
+
+XML_DECLARATION = '<?xml version="1.0" encoding="utf-8" ?>\n'
+
+# Extensions des fichiers pré-compressés, par Content-Encoding
+PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".svgz"}
+
+# Attributs de présentation hérités par les enfants d'un <g>
+INHERITABLE_ATTRIBUTES = (
+    "fill",
+    "fill-opacity",
+    "fill-rule",
+    "stroke",
+    "stroke-width",
+    "stroke-opacity",
+    "stroke-linecap",
+    "stroke-linejoin",
+    "stroke-dasharray",
+)
+
+# Éléments graphiques pouvant être regroupés
+SHAPE_TAGS = {
+    f"{{{SVG_NS}}}{tag}"
+    for tag in ("circle", "ellipse", "line", "path", "polygon", "polyline", "rect")
+}
+
+# Attributs dont la valeur est un identifiant et non une grandeur numérique
+_IDENTIFIER_ATTRIBUTES = {"id", "href", f"{{{XLINK_NS}}}href"}
+_NUMBER = re.compile(r"-?\d+\.\d+(?:[eE][-+]?\d+)?")
+_URL_REFERENCE = re.compile(r"url\(#([^)]+)\)")
+
+for _prefix, _uri in (("", SVG_NS), ("xlink", XLINK_NS), ("ev", EV_NS)):
+    ET.register_namespace(_prefix, _uri)
+
+
+class SVGOptimizer:
+    """Étape d'optimisation des SVG
+
+    Niveaux cumulatifs :
+        0. aucune modification (sortie svgwrite ``pretty``)
+        1. suppression des espaces d'indentation
+        2. réduction de la précision numérique et suppression des ``defs``
+           non référencées
+        3. regroupement des attributs de présentation répétés dans des ``<g>``
+    """
+
+    def __init__(self, level: int = 0, precision: int = 3, compress: bool = False):
+        if not 0 <= level <= 3:
+            raise ValueError("Le niveau d'optimisation doit être compris entre 0 et 3")
+        self.level = level
+        self.precision = precision
+        self.compress = compress
+
+    @classmethod
+    def from_config(cls, svg_config: Dict[str, Any]) -> "SVGOptimizer":
+        """Crée l'optimiseur depuis ``ProductionConfig.get_svg_config()``"""
+        level = svg_config["optimization_level"] if svg_config["minification"] else 0
+        return cls(level=level, compress=svg_config["compression"])
+
+    @property
+    def signature(self) -> Tuple[int, int]:
+        """Réglages déterminant la sortie (clé des squelettes optimisés)"""
+        return (self.level, self.precision)
+
+    @property
+    def encodings(self) -> List[str]:
+        """Encodages pré-compressés produits (préférés en premier)"""
+        if not self.compress:
+            return []
+        return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+    def optimize(self, svg: str) -> str:
+        """Optimise un document SVG complet selon le niveau configuré"""
+        if self.level == 0:
+            return svg
+        root = ET.fromstring(svg.encode("utf-8"))
+        _strip_whitespace(root)
+        if self.level >= 2:
+            self._reduce_precision(root)
+            remove_unused_defs(root)
+        if self.level >= 3:
+            collapse_group_attributes(root)
+        return XML_DECLARATION + ET.tostring(root, encoding="unicode")
+
+    def _reduce_precision(self, root: ET.Element) -> None:
+        """Arrondit les nombres décimaux des attributs"""
+
+        def shorten(match: "re.Match[str]") -> str:
+            value = float(match.group(0))
+            text = f"{value:.{self.precision}f}".rstrip("0").rstrip(".")
+            return "0" if text in ("-0", "") else text
+
+        for element in root.iter():
+            for name, value in element.attrib.items():
+                if name in _IDENTIFIER_ATTRIBUTES or "url(" in value:
+                    continue
+                element.set(name, _NUMBER.sub(shorten, value))
+
+    def compress_content(self, content: bytes, encoding: str) -> Optional[bytes]:
+        """Compresse un contenu (``gzip`` ou ``br``) ; None si indisponible"""
+        return compress(content, encoding)
+
+    def write_precompressed(self, path: Path, content: bytes) -> List[Path]:
+        """Écrit les variantes pré-compressées à côté d'un fichier SVG"""
+        written = []
+        for encoding in self.encodings:
+            data = compress(content, encoding)
+            if data is None:
+                continue
+            target = precompressed_path(path, encoding)
+            target.write_bytes(data)
+            written.append(target)
+        return written
+
+
+def compress(content: bytes, encoding: str) -> Optional[bytes]:
+    """Compresse un contenu pour un Content-Encoding donné"""
+    if encoding == "gzip":
+        # mtime=0 : sortie reproductible (mêmes octets, même ETag)
+        return gzip.compress(content, compresslevel=9, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(content, quality=11)
+    return None
+
+
+def precompressed_path(path: Path, encoding: str) -> Path:
+    """Chemin de la variante pré-compressée d'un fichier SVG"""
+    suffix = PRECOMPRESSED_SUFFIXES[encoding]
+    if encoding == "gzip":
+        return path.with_suffix(suffix)
+    return path.with_name(path.name + suffix)
+
+
+def _quality(params: List[str]) -> float:
+    """Valeur q d'un encodage (1.0 par défaut, 0.0 si illisible)"""
+    for param in params:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value.strip())
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def negotiate_encoding(accept_encoding: str, available: List[str]) -> Optional[str]:
+    """Choisit le premier encodage disponible accepté par le client"""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        if _quality(params) > 0:
+            accepted.add(coding.strip().lower())
+    for encoding in available:
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return None
+
+
+def _strip_whitespace(root: ET.Element) -> None:
+    """Supprime les nœuds texte d'indentation"""
+    for element in root.iter():
+        if element.text is not None and not element.text.strip():
+            element.text = None
+        if element.tail is not None and not element.tail.strip():
+            element.tail = None
+
+
+def _element_references(element: ET.Element) -> List[str]:
+    """Identifiants référencés par un élément (url(#id) ou href="#id")"""
+    referenced: List[str] = []
+    for name, value in element.attrib.items():
+        referenced.extend(_URL_REFERENCE.findall(value))
+        if name in _IDENTIFIER_ATTRIBUTES - {"id"} and value.startswith("#"):
+            referenced.append(value[1:])
+    return referenced
+
+
+def remove_unused_defs(root: ET.Element) -> int:
+    """Supprime les définitions jamais référencées ; retourne leur nombre
+
+    Les références sont relevées en un seul parcours de l'arbre, puis
+    décomptées : supprimer une définition libère ses propres références,
+    jusqu'à ce que plus rien ne change. Une définition qui ne se référence
+    qu'elle-même est supprimée.
+    """
+    parents: Dict[ET.Element, ET.Element] = {}
+    for defs in root.iter(f"{{{SVG_NS}}}defs"):
+        for definition in defs:
+            if definition.get("id") is not None:
+                parents[definition] = defs
+
+    counts: Dict[str, int] = {}
+    sources: List[List[str]] = []
+    # Références et définitions contenues dans chaque définition candidate
+    owned: Dict[ET.Element, List[int]] = {definition: [] for definition in parents}
+    nested: Dict[ET.Element, List[ET.Element]] = {d: [] for d in parents}
+    stack: List[Tuple[ET.Element, Tuple[ET.Element, ...]]] = [(root, ())]
+    while stack:
+        element, owners = stack.pop()
+        if element in parents:
+            for owner in owners:
+                nested[owner].append(element)
+            owners = owners + (element,)
+        own_ids = {owner.get("id") for owner in owners}
+        references = [
+            identifier
+            for identifier in _element_references(element)
+            if identifier not in own_ids
+        ]
+        if references:
+            for identifier in references:
+                counts[identifier] = counts.get(identifier, 0) + 1
+            for owner in owners:
+                owned[owner].append(len(sources))
+            sources.append(references)
+        stack.extend((child, owners) for child in element)
+
+    by_id: Dict[str, List[ET.Element]] = {}
+    for definition in parents:
+        by_id.setdefault(definition.get("id"), []).append(definition)
+    pending = [d for d in parents if not counts.get(d.get("id"), 0)]
+    released: Set[int] = set()
+    gone: Set[ET.Element] = set()
+    removed = 0
+    while pending:
+        definition = pending.pop()
+        if definition in gone:
+            continue
+        parents[definition].remove(definition)
+        removed += 1
+        gone.add(definition)
+        gone.update(nested[definition])
+        for index in owned[definition]:
+            if index in released:
+                continue
+            released.add(index)
+            for identifier in sources[index]:
+                counts[identifier] -= 1
+                if not counts[identifier]:
+                    pending.extend(by_id.get(identifier, ()))
+    return removed
+
+
+def collapse_group_attributes(root: ET.Element, min_run: int = 3) -> int:
+    """Regroupe les formes consécutives partageant des attributs hérités
+
+    Les attributs communs sont déplacés sur un ``<g>`` englobant lorsque cela
+    réduit la taille du document. Le contenu des ``defs`` n'est pas modifié.
+    Retourne le nombre de groupes créés.
+    """
+    created = 0
+    defs_elements = {
+        element for defs in root.iter(f"{{{SVG_NS}}}defs") for element in defs.iter()
+    }
+    for parent in list(root.iter()):
+        if parent in defs_elements or len(parent) < min_run:
+            continue
+        children = list(parent)
+        index = 0
+        while index < len(children):
+            run_end, shared = _shared_run(children, index)
+            if (
+                run_end - index >= min_run
+                and shared
+                and _worth_grouping(run_end - index, shared)
+            ):
+                group = ET.Element(f"{{{SVG_NS}}}g", shared)
+                position = list(parent).index(children[index])
+                for child in children[index:run_end]:
+                    parent.remove(child)
+                    for name in shared:
+                        del child.attrib[name]
+                    group.append(child)
+                parent.insert(position, group)
+                created += 1
+                index = run_end
+            else:
+                index += 1
+    return created
+
+
+def _shared_run(children: List[ET.Element], start: int) -> Tuple[int, Dict[str, str]]:
+    """Plus longue suite de formes partageant au moins un attribut hérité"""
+    first = children[start]
+    if first.tag not in SHAPE_TAGS:
+        return start + 1, {}
+    shared = {
+        name: first.attrib[name]
+        for name in INHERITABLE_ATTRIBUTES
+        if name in first.attrib
+    }
+    end = start + 1
+    while end < len(children) and shared:
+        candidate = children[end]
+        if candidate.tag not in SHAPE_TAGS:
+            break
+        common = {
+            name: value
+            for name, value in shared.items()
+            if candidate.attrib.get(name) == value
+        }
+        if not common:
+            break
+        shared = common
+        end += 1
+    return end, shared
+
+
+def _worth_grouping(count: int, shared: Dict[str, str]) -> bool:
+    """Vrai si le regroupement réduit la taille du document"""
+    attributes = sum(len(f' {name}="{value}"') for name, value in shared.items())
+    return (count - 1) * attributes > len("<g></g>")
@@ -0,0 +1,520 @@
+"""
+🌙 SVG Template Module
+Moteur de rendu compilé : gabarits SVG précompilés avec emplacements de paramètres
+"""
+
+import copy
+import dataclasses
+import operator
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Tuple
+
+# Types simplifiés pour éviter les conflits
+LogoVariant = Any
+SVGBuilder = Any
+
+# Champs de couleur d'une variante et couleurs sentinelles associées
+COLOR_FIELDS = ("primary", "secondary", "accent", "glow")
+_COLOR_SENTINELS = {
+    field: f"#5e00{index:02x}" for index, field in enumerate(COLOR_FIELDS, start=1)
+}
+
+# Palette de contrôle des squelettes optimisés (couleurs distinctes)
+_CHECK_COLORS = {
+    field: f"#5e10{index:02x}" for index, field in enumerate(COLOR_FIELDS, start=1)
+}
+
+# Jeton numérique émis à la place d'un paramètre (reste un nombre SVG valide)
+_NUMBER_TOKEN = "8.80808{:06d}1"
+_TOKEN_PATTERN = re.compile(
+    r"(?<![\d.])8\.80808(\d{6})1(?!\d)|(" + "|".join(_COLOR_SENTINELS.values()) + ")"
+)
+
+# Paramètres numériques d'une variante
+Params = Tuple[float, float]  # (animation_speed, glow_intensity)
+
+# Densités compilées en gabarits ; les autres sont rendues avec svgwrite
+COMPILED_DENSITIES = frozenset({0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 4.0})
+
+
+class _Trace:
+    """Enregistre les émissions de paramètres pendant un rendu sonde"""
+
+    def __init__(self):
+        self.emissions: List[Tuple[Callable[[Params], Any], str]] = []
+        self.tainted = False
+
+    def emit(self, expression: Callable[[Params], Any], spec: str) -> str:
+        """Enregistre une émission et retourne son jeton"""
+        self.emissions.append((expression, spec))
+        return _NUMBER_TOKEN.format(len(self.emissions) - 1)
+
+
+def _lift(value: Any) -> Callable[[Params], Any]:
+    """Transforme une valeur en expression des paramètres"""
+    if isinstance(value, _Slot):
+        return value.expression
+    return lambda params: value
+
+
+def _binary(op: Callable[[Any, Any], Any], reflected: bool = False):
+    """Construit un opérateur arithmétique symbolique"""
+
+    def method(self: "_Slot", other: Any) -> Any:
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        left, right = (other, self) if reflected else (self, other)
+        left_expr, right_expr = _lift(left), _lift(right)
+        return _Slot(
+            op(float(left), float(right)),
+            lambda params: op(left_expr(params), right_expr(params)),
+            self.trace,
+        )
+
+    return method
+
+
+def _tainting(op: Callable[..., Any]):
+    """Opération qui fige la valeur sonde : le gabarit devient invalide"""
+
+    def method(self: "_Slot", *args: Any) -> Any:
+        self.trace.tainted = True
+        return op(float(self), *(float(a) if isinstance(a, _Slot) else a for a in args))
+
+    return method
+
+
+class _Slot(float):
+    """Flottant symbolique : se comporte comme la valeur sonde, mais chaque
+    conversion en texte émet un jeton relié à l'expression qui l'a produit.
+
+    Toute opération qui ferait dépendre la structure du document de la valeur
+    (comparaison, conversion entière, arrondi) marque la trace comme invalide.
+    """
+
+    def __new__(cls, value: float, expression: Callable[[Params], Any], trace: _Trace):
+        slot = super().__new__(cls, value)
+        slot.expression = expression
+        slot.trace = trace
+        return slot
+
+    __add__ = _binary(operator.add)
+    __radd__ = _binary(operator.add, reflected=True)
+    __sub__ = _binary(operator.sub)
+    __rsub__ = _binary(operator.sub, reflected=True)
+    __mul__ = _binary(operator.mul)
+    __rmul__ = _binary(operator.mul, reflected=True)
+    __truediv__ = _binary(operator.truediv)
+    __rtruediv__ = _binary(operator.truediv, reflected=True)
+    __pow__ = _binary(operator.pow)
+    __rpow__ = _binary(operator.pow, reflected=True)
+
+    def __neg__(self) -> "_Slot":
+        expression = self.expression
+        return _Slot(-float(self), lambda params: -expression(params), self.trace)
+
+    def __pos__(self) -> "_Slot":
+        return self
+
+    __lt__ = _tainting(float.__lt__)
+    __le__ = _tainting(float.__le__)
+    __gt__ = _tainting(float.__gt__)
+    __ge__ = _tainting(float.__ge__)
+    __eq__ = _tainting(float.__eq__)
+    __ne__ = _tainting(float.__ne__)
+    __bool__ = _tainting(float.__bool__)
+    __int__ = _tainting(float.__int__)
+    __trunc__ = _tainting(float.__trunc__)
+    __floor__ = _tainting(float.__floor__)
+    __ceil__ = _tainting(float.__ceil__)
+    __round__ = _tainting(float.__round__)
+    __floordiv__ = _tainting(float.__floordiv__)
+    __mod__ = _tainting(float.__mod__)
+    __hash__ = float.__hash__
+
+    def __format__(self, spec: str) -> str:
+        return self.trace.emit(self.expression, spec)
+
+    def __str__(self) -> str:
+        return self.__format__("")
+
+    __repr__ = __str__
+
+
+class _SingleVariantManager:
+    """Gestionnaire de variantes minimal servant une seule variante"""
+
+    def __init__(self, variant: LogoVariant):
+        self.variant = variant
+
+    def get_variant(self, variant_name: str) -> LogoVariant:
+        return self.variant
+
+    def validate_variant(self, variant_name: str) -> bool:
+        return True
+
+
+def render_variant(builder: SVGBuilder, variant: LogoVariant, size: int) -> str:
+    """Rend une variante arbitraire via svgwrite (chemin de référence)"""
+    clone = copy.copy(builder)
+    clone.variants_manager = _SingleVariantManager(variant)
+    return clone.render_logo(variant.variant_type.value, size)
+
+
+def _params(variant: LogoVariant) -> Params:
+    """Extrait les paramètres numériques d'une variante"""
+    return (variant.animation_speed, variant.glow_intensity)
+
+
+@dataclasses.dataclass(frozen=True)
+class CompiledTemplate:
+    """Gabarit SVG compilé : fragments littéraux entrecoupés d'emplacements
+
+    ``slots[i]`` est soit le nom d'un champ de couleur, soit un couple
+    ``(expression, format)`` évalué sur ``(animation_speed, glow_intensity)``.
+    """
+
+    literals: Tuple[str, ...]
+    slots: Tuple[Any, ...]
+
+    def render(self, variant: LogoVariant) -> str:
+        """Produit le SVG d'une variante (une seule jointure de chaînes)"""
+        params = _params(variant)
+        colors = variant.colors
+        parts = [self.literals[0]]
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            if isinstance(slot, str):
+                parts.append(getattr(colors, slot))
+            else:
+                expression, spec = slot
+                parts.append(format(expression(params), spec))
+            parts.append(literal)
+        return "".join(parts)
+
+    def bind(self, variant: LogoVariant) -> "ColorSkeleton":
+        """Évalue les emplacements numériques ; seules les couleurs restent ouvertes"""
+        params = _params(variant)
+        pieces = [self.literals[0]]
+        fields: List[str] = []
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            if isinstance(slot, str):
+                fields.append(slot)
+                pieces.append(literal)
+            else:
+                expression, spec = slot
+                pieces[-1] += format(expression(params), spec) + literal
+        return ColorSkeleton(pieces=tuple(pieces), fields=tuple(fields))
+
+    @property
+    def slot_count(self) -> int:
+        return len(self.slots)
+
+
+@dataclasses.dataclass(frozen=True)
+class ColorSkeleton:
+    """Squelette SVG paramétré par la seule palette
+
+    Géométrie et animations sont figées dans ``pieces`` ; ``fields[i]`` est
+    le champ de couleur inséré entre ``pieces[i]`` et ``pieces[i + 1]``.
+    """
+
+    pieces: Tuple[str, ...]
+    fields: Tuple[str, ...]
+
+    def render(self, colors: Any) -> str:
+        """Produit le SVG d'une palette (``ColorScheme``, une seule jointure)"""
+        return self.fill(colors.to_dict())
+
+    def fill(self, values: Dict[str, str]) -> str:
+        """Produit le SVG d'un dictionnaire champ → couleur"""
+        parts = [self.pieces[0]]
+        for field, piece in zip(self.fields, self.pieces[1:]):
+            parts.append(values[field])
+            parts.append(piece)
+        return "".join(parts)
+
+
+@dataclasses.dataclass(frozen=True)
+class OptimizedSkeleton:
+    """Squelette de couleurs auquel l'optimiseur SVG a déjà été appliqué
+
+    L'optimisation ne dépend des couleurs que par leurs égalités (regroupement
+    des attributs identiques) : tant qu'une palette garde des couleurs
+    distinctes, absentes du texte littéral, la substitution donne exactement
+    ``optimizer.optimize(rendu)``. Sinon ``render`` retourne None.
+    """
+
+    skeleton: ColorSkeleton
+
+    def render(self, colors: Any) -> Optional[str]:
+        """Produit le SVG optimisé d'une palette ; None si elle est ambiguë"""
+        return self.fill(colors.to_dict())
+
+    def fill(self, values: Dict[str, str]) -> Optional[str]:
+        """Produit le SVG optimisé d'un dictionnaire champ → couleur"""
+        fields = set(self.skeleton.fields)
+        used = {values[field] for field in fields}
+        if len(used) < len(fields):
+            return None
+        pieces = self.skeleton.pieces
+        if any(value in piece for value in used for piece in pieces):
+            return None
+        return self.skeleton.fill(values)
+
+
+def optimize_skeleton(
+    skeleton: ColorSkeleton, optimizer: Any, colors: Any
+) -> Optional[OptimizedSkeleton]:
+    """Optimise un squelette une fois, couleurs remplacées par des sentinelles
+
+    Le résultat est vérifié contre l'optimisation complète du rendu de
+    ``colors`` ; None en cas d'écart (chaque rendu est alors optimisé).
+    """
+    document = optimizer.optimize(skeleton.fill(_COLOR_SENTINELS))
+    sentinel_fields = {value: field for field, value in _COLOR_SENTINELS.items()}
+    pieces: List[str] = []
+    fields: List[str] = []
+    position = 0
+    for match in _TOKEN_PATTERN.finditer(document):
+        if match.group(2) is None:
+            return None
+        pieces.append(document[position : match.start()])
+        fields.append(sentinel_fields[match.group(2)])
+        position = match.end()
+    pieces.append(document[position:])
+    optimized = OptimizedSkeleton(ColorSkeleton(tuple(pieces), tuple(fields)))
+    for values in (colors.to_dict(), _CHECK_COLORS):
+        svg = optimized.fill(values)
+        if svg is not None and svg != optimizer.optimize(skeleton.fill(values)):
+            return None
+    return optimized
+
+
+def compile_template(
+    builder: SVGBuilder, variant: LogoVariant, size: int
+) -> Optional[CompiledTemplate]:
+    """Compile la structure statique d'un builder pour un type de variante
+
+    Le builder est exécuté une fois avec une variante sonde (couleurs
+    sentinelles, paramètres symboliques). Le gabarit obtenu est ensuite
+    vérifié contre le rendu svgwrite de la variante réelle et d'une variante
+    perturbée ; en cas d'écart, ``None`` est retourné (pas de chemin rapide).
+    """
+    trace = _Trace()
+    speed, glow = _params(variant)
+    probe = dataclasses.replace(
+        variant,
+        colors=dataclasses.replace(variant.colors, **_COLOR_SENTINELS),
+        animation_speed=_Slot(speed, operator.itemgetter(0), trace),
+        glow_intensity=_Slot(glow, operator.itemgetter(1), trace),
+    )
+    try:
+        skeleton = render_variant(builder, probe, size)
+    except Exception:
+        return None
+    if trace.tainted:
+        return None
+
+    literals: List[str] = []
+    slots: List[Any] = []
+    position = 0
+    sentinel_fields = {value: field for field, value in _COLOR_SENTINELS.items()}
+    for match in _TOKEN_PATTERN.finditer(skeleton):
+        literals.append(skeleton[position : match.start()])
+        if match.group(1) is not None:
+            slots.append(trace.emissions[int(match.group(1))])
+        else:
+            slots.append(sentinel_fields[match.group(2)])
+        position = match.end()
+    literals.append(skeleton[position:])
+    template = CompiledTemplate(literals=tuple(literals), slots=tuple(slots))
+
+    # Vérification de parité sur la variante réelle et une variante perturbée
+    perturbed = dataclasses.replace(
+        variant,
+        colors=dataclasses.replace(
+            variant.colors,
+            **{
+                field: getattr(variant.colors, COLOR_FIELDS[index - 1])
+                for index, field in enumerate(COLOR_FIELDS)
+            },
+        ),
+        animation_speed=speed * 1.37 + 0.11,
+        glow_intensity=glow * 0.61 + 0.05,
+    )
+    for candidate in (variant, perturbed):
+        if template.render(candidate) != render_variant(builder, candidate, size):
+            return None
+    return template
+
+
+class TemplateEngine:
+    """Cache des gabarits compilés, par (builder, graine, densité, variante, taille)
+
+    Les gabarits non compilables sont mémorisés (``None``) pour ne pas
+    retenter la compilation ; le rendu retombe alors sur svgwrite. Chaque
+    gabarit est lié une fois par jeu de paramètres numériques en un squelette
+    de couleurs : changer de palette ne coûte qu'une substitution. Gabarits
+    et squelettes sont deux caches LRU bornés.
+
+    Seules les densités de ``densities`` sont compilées : une densité
+    arbitraire est rendue directement avec svgwrite, sans rien mémoriser.
+
+    Avec un optimiseur, chaque squelette est optimisé une seule fois
+    (``optimize_skeleton``) : un rendu reste une substitution de couleurs.
+    """
+
+    def __init__(
+        self,
+        max_templates: int = 128,
+        max_skeletons: int = 256,
+        densities: FrozenSet[float] = COMPILED_DENSITIES,
+    ):
+        self._templates: OrderedDict[Hashable, Optional[CompiledTemplate]] = (
+            OrderedDict()
+        )
+        self._skeletons: OrderedDict[Hashable, ColorSkeleton] = OrderedDict()
+        self._optimized: OrderedDict[Hashable, Optional[OptimizedSkeleton]] = (
+            OrderedDict()
+        )
+        self.max_templates = max_templates
+        self.max_skeletons = max_skeletons
+        self.densities = densities
+        self._lock = threading.Lock()
+        self.compiled = 0
+        self.fallbacks = 0
+
+    @staticmethod
+    def template_key(builder: SVGBuilder, variant: LogoVariant, size: int) -> Hashable:
+        density = getattr(builder, "density", 1.0)
+        return (type(builder), builder.seed, density, variant.variant_type.value, size)
+
+    def compilable(self, builder: SVGBuilder) -> bool:
+        """Indique si la densité du builder fait partie des densités compilées"""
+        return getattr(builder, "density", 1.0) in self.densities
+
+    def get_template(
+        self, builder: SVGBuilder, variant: LogoVariant, size: int
+    ) -> Optional[CompiledTemplate]:
+        """Récupère (ou compile) le gabarit d'un builder
+
+        Retourne None, sans compiler, pour une densité non compilée.
+        """
+        if not self.compilable(builder):
+            return None
+        key = self.template_key(builder, variant, size)
+        with self._lock:
+            if key in self._templates:
+                self._templates.move_to_end(key)
+                return self._templates[key]
+        template = compile_template(builder, variant, size)
+        with self._lock:
+            if key not in self._templates:
+                self._templates[key] = template
+                if template is None:
+                    self.fallbacks += 1
+                else:
+                    self.compiled += 1
+                while len(self._templates) > self.max_templates:
+                    self._templates.popitem(last=False)
+            return self._templates.get(key, template)
+
+    def get_skeleton(
+        self, builder: SVGBuilder, variant: LogoVariant, size: int
+    ) -> Optional[ColorSkeleton]:
+        """Récupère (ou lie) le squelette de couleurs d'un builder
+
+        Toutes les palettes partageant les paramètres numériques d'une
+        variante réutilisent le même squelette.
+        """
+        if not self.compilable(builder):
+            return None
+        key = (self.template_key(builder, variant, size), _params(variant))
+        with self._lock:
+            skeleton = self._skeletons.get(key)
+            if skeleton is not None:
+                self._skeletons.move_to_end(key)
+                return skeleton
+        template = self.get_template(builder, variant, size)
+        if template is None:
+            return None
+        skeleton = template.bind(variant)
+        with self._lock:
+            self._skeletons[key] = skeleton
+            while len(self._skeletons) > self.max_skeletons:
+                self._skeletons.popitem(last=False)
+        return skeleton
+
+    def get_optimized_skeleton(
+        self, builder: SVGBuilder, variant: LogoVariant, size: int, optimizer: Any
+    ) -> Optional[OptimizedSkeleton]:
+        """Récupère (ou optimise) le squelette optimisé d'un builder
+
+        Le résultat est propre au réglage de l'optimiseur (``signature``) ;
+        un squelette non optimisable est mémorisé (None).
+        """
+        skeleton = self.get_skeleton(builder, variant, size)
+        if skeleton is None:
+            return None
+        key = (
+            self.template_key(builder, variant, size),
+            _params(variant),
+            optimizer.signature,
+        )
+        with self._lock:
+            if key in self._optimized:
+                self._optimized.move_to_end(key)
+                return self._optimized[key]
+        optimized = optimize_skeleton(skeleton, optimizer, variant.colors)
+        with self._lock:
+            self._optimized[key] = optimized
+            while len(self._optimized) > self.max_skeletons:
+                self._optimized.popitem(last=False)
+        return optimized
+
+    def render(
+        self,
+        builder: SVGBuilder,
+        variant: LogoVariant,
+        size: int,
+        optimizer: Optional[Any] = None,
+    ) -> str:
+        """Rend une variante via son squelette, ou via svgwrite à défaut
+
+        Avec ``optimizer``, la sortie est celle de ``optimizer.optimize`` ;
+        le squelette optimisé évite de ré-optimiser chaque rendu.
+        """
+        if optimizer is not None and optimizer.level:
+            optimized = self.get_optimized_skeleton(builder, variant, size, optimizer)
+            svg = optimized.render(variant.colors) if optimized is not None else None
+            if svg is not None:
+                return svg
+            return optimizer.optimize(self.render(builder, variant, size))
+        skeleton = self.get_skeleton(builder, variant, size)
+        if skeleton is None:
+            return render_variant(builder, variant, size)
+        return skeleton.render(variant.colors)
+
+    def clear(self) -> None:
+        """Vide le cache des gabarits et des squelettes"""
+        with self._lock:
+            self._templates.clear()
+            self._skeletons.clear()
+            self._optimized.clear()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retourne les statistiques du moteur"""
+        return {
+            "templates": len(self._templates),
+            "compiled": self.compiled,
+            "fallbacks": self.fallbacks,
+        }
+
+
+# Moteur partagé par tous les builders
+template_engine = TemplateEngine()
@@ -18,16 +18,23 @@ except ImportError:
 class UltimateLogoGenerator(ArkaliaLunaLogo):
     """Générateur de logos ULTIMES Arkalia-LUNA avec effets cosmiques extrêmes"""
 
+    # Préfixe des fichiers SVG produits
+    logo_prefix = "arkalia-luna-ultimate"
+
+    # Builder SVG spécialisé (instance partagée, voir builder_registry)
+    builder_class = UltimateSVGBuilder
+
+    # Complexité cosmique de référence (densité inchangée)
+    DEFAULT_COSMIC_COMPLEXITY = 0.98
+
     def __init__(self, output_dir: Optional[Path] = None):
         # Appel du constructeur parent avec répertoire spécialisé
         super().__init__(output_dir or Path("exports-ultimate"))
 
-        # Remplace le SVG builder par défaut par l'Ultimate
-        self.svg_builder = UltimateSVGBuilder(self.variants_manager)
         self.logger.info("🌟 Ultimate Generator initialisé avec succès")
 
         # Configuration ULTIME spécialisée
-        self.cosmic_complexity = 0.98
+        self.cosmic_complexity = self.DEFAULT_COSMIC_COMPLEXITY
         self.ultimate_effects = True
         self.holographic_mode = True
 
@@ -57,11 +64,10 @@ class UltimateLogoGenerator(ArkaliaLunaLogo):
 
             # Mise à jour du niveau cosmique
             self.cosmic_complexity = max(0.1, min(1.0, cosmic_level))
+            self._apply_density()
 
             # Construction du chemin de sortie avec suffixe ultimate
-            output_path = (
-                self.output_dir / f"arkalia-luna-ultimate-{variant_name}-{size}.svg"
-            )
+            output_path = self.get_logo_path(variant_name, size)
 
             # Génération avec le builder ULTIME
             self.svg_builder.save_ultimate_logo(variant_name, size, output_path)
@@ -140,10 +146,15 @@ class UltimateLogoGenerator(ArkaliaLunaLogo):
         if 0.1 <= complexity <= 1.0:
             self.cosmic_complexity = complexity
             self.ultimate_stats["cosmic_complexity"] = complexity
+            self._apply_density()
             self.logger.info(f"🌟 Complexité cosmique configurée: {complexity:.2f}")
         else:
             raise ValueError("Complexité cosmique doit être entre 0.1 et 1.0")
 
+    def complexity_factor(self) -> float:
+        """La complexité cosmique module la densité (1.0 à 0.98)"""
+        return self.cosmic_complexity / self.DEFAULT_COSMIC_COMPLEXITY
+
     def toggle_ultimate_effects(self, enabled: bool = True) -> None:
         """Active/désactive les effets ULTIMES"""
         self.ultimate_effects = enabled
@@ -19,10 +19,14 @@ class UltraMaxLogoGenerator(ArkaliaLunaLogo):
     """Générateur ULTRA-avancé avec effets EXCEPTIONNELS
     et optimisations de performance"""
 
+    # Préfixe des fichiers SVG produits
+    logo_prefix = "arkalia-luna-ultra-max"
+
+    # Builder SVG spécialisé (instance partagée, voir builder_registry)
+    builder_class = UltraMaxSVGBuilder
+
     def __init__(self, output_dir: Optional[Path] = None):
         super().__init__(output_dir)
-        # Remplace le SVG builder par défaut par l'Ultra Max
-        self.svg_builder = UltraMaxSVGBuilder(self.variants_manager)
         self.logger.info("🚀 Ultra Max Generator initialisé avec succès")
 
         # Configuration ULTRA-MAX
@@ -45,9 +49,7 @@ class UltraMaxLogoGenerator(ArkaliaLunaLogo):
                 raise ValueError(f"Variante '{variant_name}' non reconnue")
 
             # Construction du chemin de sortie avec suffixe ultra-max
-            output_path = (
-                self.output_dir / f"arkalia-luna-ultra-max-{variant_name}-{size}.svg"
-            )
+            output_path = self.get_logo_path(variant_name, size)
 
             # Génération avec le builder Ultra Max
             self.svg_builder.save_logo(variant_name, size, output_path)
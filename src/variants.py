@@ -3,9 +3,28 @@
 Définition des variantes émotionnelles du logo Arkalia-LUNA
 """
 
+import dataclasses
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# Couleur hexadécimale acceptée pour une palette personnalisée (#rgb ou #rrggbb)
+_HEX_COLOR = re.compile(r"^#?([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$")
+
+# Préfixe des noms de variantes personnalisées
+CUSTOM_VARIANT_PREFIX = "custom-"
+
+# Bornes des paramètres d'animation d'une variante personnalisée
+ANIMATION_SPEED_RANGE = (0.1, 5.0)
+GLOW_INTENSITY_RANGE = (0.0, 2.0)
+
+# Variantes personnalisées conservées en mémoire (LRU)
+DEFAULT_CUSTOM_VARIANTS = 256
 
 
 class VariantType(Enum):
@@ -18,28 +37,80 @@ class VariantType(Enum):
     CREATIVE = "creative"
 
 
-@dataclass
-class ColorScheme:
-    """Schéma de couleurs pour une variante"""
+# Champs de couleur d'une palette, dans l'ordre canonique
+COLOR_FIELDS = ("primary", "secondary", "accent", "glow")
+
+RGB = Tuple[int, int, int]
+
+
+class _SlottedRecord:
+    """Base des enregistrements figés à ``__slots__`` (picklables)
+
+    Les attributs dérivés (non déclarés comme champs) sont recalculés par
+    ``__post_init__`` lors de la reconstruction.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        values = tuple(getattr(self, f.name) for f in dataclasses.fields(self))
+        return (type(self), values)
+
+
+def _parse_rgb(value: str) -> Optional[RGB]:
+    match = _HEX_COLOR.match(value) if isinstance(value, str) else None
+    if match is None:
+        return None
+    digits = match.group(1)
+    if len(digits) == 3:
+        digits = "".join(digit * 2 for digit in digits)
+    return (int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16))
+
+
+@dataclass(frozen=True)
+class ColorScheme(_SlottedRecord):
+    """Schéma de couleurs pour une variante (immuable, hachable)
+
+    ``rgb`` contient les composantes des quatre couleurs dans l'ordre de
+    ``COLOR_FIELDS`` (None si une couleur n'est pas hexadécimale).
+    """
+
+    __slots__ = ("primary", "secondary", "accent", "glow", "rgb", "_dict")
 
     primary: str
     secondary: str
     accent: str
     glow: str
 
+    def __post_init__(self):
+        colors = {field: getattr(self, field) for field in COLOR_FIELDS}
+        rgb = tuple(_parse_rgb(color) for color in colors.values())
+        object.__setattr__(self, "rgb", None if None in rgb else rgb)
+        object.__setattr__(self, "_dict", colors)
+
     def to_dict(self) -> Dict[str, str]:
-        """Convertit en dictionnaire"""
-        return {
-            "primary": self.primary,
-            "secondary": self.secondary,
-            "accent": self.accent,
-            "glow": self.glow,
-        }
+        """Convertit en dictionnaire (partagé : ne pas modifier)"""
+        return self._dict
 
 
-@dataclass
-class LogoVariant:
-    """Définition complète d'une variante de logo"""
+@dataclass(frozen=True)
+class LogoVariant(_SlottedRecord):
+    """Définition complète d'une variante de logo (immuable, hachable)
+
+    Utilisable directement comme clé de cache ; ``to_dict`` et ``to_json``
+    sont calculés une fois par instance.
+    """
+
+    __slots__ = (
+        "variant_type",
+        "name",
+        "description",
+        "colors",
+        "animation_speed",
+        "glow_intensity",
+        "_dict",
+        "_json",
+    )
 
     variant_type: VariantType
     name: str
@@ -48,25 +119,164 @@ class LogoVariant:
     animation_speed: float
     glow_intensity: float
 
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "_dict",
+            {
+                "variant_type": self.variant_type.value,
+                "name": self.name,
+                "description": self.description,
+                "colors": self.colors.to_dict(),
+                "animation_speed": self.animation_speed,
+                "glow_intensity": self.glow_intensity,
+            },
+        )
+        object.__setattr__(self, "_json", None)
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convertit en dictionnaire"""
+        """Convertit en dictionnaire (partagé : ne pas modifier)"""
+        return self._dict
+
+    def to_json(self) -> str:
+        """Sérialisation JSON, calculée à la première demande"""
+        if self._json is None:
+            object.__setattr__(
+                self, "_json", json.dumps(self._dict, ensure_ascii=False)
+            )
+        return self._json
+
+
+def normalize_color(value: str) -> str:
+    """Forme canonique d'une couleur hexadécimale (``#rrggbb`` minuscule)"""
+    match = _HEX_COLOR.match(value.strip())
+    if match is None:
+        raise ValueError(f"Couleur '{value}' invalide (attendu #rgb ou #rrggbb)")
+    digits = match.group(1).lower()
+    if len(digits) == 3:
+        digits = "".join(digit * 2 for digit in digits)
+    return f"#{digits}"
+
+
+def _bounded(name: str, value: float, bounds: Tuple[float, float]) -> float:
+    low, high = bounds
+    if not low <= value <= high:
+        raise ValueError(f"{name} doit être compris entre {low} et {high}")
+    return round(float(value), 3)
+
+
+@dataclass(frozen=True)
+class CustomPalette:
+    """Spécification canonique d'une variante personnalisée (picklable)
+
+    Couleurs normalisées et paramètres arrondis : deux demandes équivalentes
+    ont la même spécification, donc le même nom.
+    """
+
+    base: str
+    colors: Tuple[str, str, str, str]  # primary, secondary, accent, glow
+    animation_speed: float
+    glow_intensity: float
+
+    @property
+    def name(self) -> str:
+        """Nom de la variante, dérivé de l'empreinte canonique"""
+        material = json.dumps(dataclasses.astuple(self), separators=(",", ":"))
+        digest = hashlib.sha256(material.encode("utf-8")).hexdigest()
+        return f"{CUSTOM_VARIANT_PREFIX}{digest[:16]}"
+
+
+class CustomVariantRegistry:
+    """Registre borné des variantes personnalisées, internées par nom canonique
+
+    Une palette répétée retrouve la même instance de ``LogoVariant`` (et donc
+    les mêmes entrées dans les caches en aval) ; au-delà de ``max_size``, les
+    variantes les moins récemment utilisées sont évincées.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CUSTOM_VARIANTS):
+        self.max_size = max_size
+        self._variants: OrderedDict[str, LogoVariant] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def intern(self, palette: CustomPalette, base: LogoVariant) -> LogoVariant:
+        """Variante de la palette (créée à la première demande)"""
+        name = palette.name
+        with self._lock:
+            variant = self._variants.get(name)
+            if variant is not None:
+                self._variants.move_to_end(name)
+                self.hits += 1
+                return variant
+            primary, secondary, accent, glow = palette.colors
+            variant = dataclasses.replace(
+                base,
+                name=name,
+                colors=ColorScheme(primary, secondary, accent, glow),
+                animation_speed=palette.animation_speed,
+                glow_intensity=palette.glow_intensity,
+            )
+            self._variants[name] = variant
+            self.misses += 1
+            while len(self._variants) > self.max_size:
+                self._variants.popitem(last=False)
+                self.evictions += 1
+            return variant
+
+    def get(self, name: str) -> Optional[LogoVariant]:
+        """Variante personnalisée par nom ; None si inconnue ou évincée"""
+        with self._lock:
+            variant = self._variants.get(name)
+            if variant is not None:
+                self._variants.move_to_end(name)
+            return variant
+
+    def clear(self) -> None:
+        """Vide le registre"""
+        with self._lock:
+            self._variants.clear()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._variants
+
+    def __len__(self) -> int:
+        return len(self._variants)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retourne les statistiques du registre"""
         return {
-            "variant_type": self.variant_type.value,
-            "name": self.name,
-            "description": self.description,
-            "colors": self.colors.to_dict(),
-            "animation_speed": self.animation_speed,
-            "glow_intensity": self.glow_intensity,
+            "size": len(self._variants),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
         }
 
 
+# Registre partagé par tous les gestionnaires de variantes
+custom_variants = CustomVariantRegistry()
+
+
 class LogoVariants:
-    """Gestionnaire des variantes de logo"""
+    """Gestionnaire des variantes de logo
+
+    Les variantes prédéfinies sont construites une fois par processus et
+    partagées par toutes les instances ; ``variants_registry`` est
+    l'instance commune des générateurs, builders et endpoints.
+    """
+
+    _builtin: Optional[Dict[str, LogoVariant]] = None
 
     def __init__(self):
-        self._variants = self._initialize_variants()
+        if LogoVariants._builtin is None:
+            LogoVariants._builtin = self._initialize_variants()
+        self._variants = LogoVariants._builtin
 
-    def _initialize_variants(self) -> Dict[str, LogoVariant]:
+    @staticmethod
+    def _initialize_variants() -> Dict[str, LogoVariant]:
         """Initialise toutes les variantes disponibles"""
         return {
             VariantType.SERENITY.value: LogoVariant(
@@ -137,8 +347,11 @@ class LogoVariants:
         }
 
     def get_variant(self, variant_name: str) -> LogoVariant:
-        """Récupère une variante par son nom"""
+        """Récupère une variante (prédéfinie ou personnalisée) par son nom"""
         if variant_name not in self._variants:
+            custom = custom_variants.get(variant_name)
+            if custom is not None:
+                return custom
             available = list(self._variants.keys())
             raise ValueError(
                 f"Variante '{variant_name}' non reconnue. "
@@ -147,8 +360,8 @@ class LogoVariants:
         return self._variants[variant_name]
 
     def get_all_variants(self) -> Dict[str, LogoVariant]:
-        """Récupère toutes les variantes"""
-        return self._variants.copy()
+        """Récupère toutes les variantes (dictionnaire partagé : ne pas modifier)"""
+        return self._variants
 
     def list_variants(self) -> list:
         """Liste les noms des variantes disponibles"""
@@ -156,9 +369,56 @@ class LogoVariants:
 
     def validate_variant(self, variant_name: str) -> bool:
         """Valide qu'une variante existe"""
-        return variant_name in self._variants
+        return variant_name in self._variants or variant_name in custom_variants
+
+    def custom_palette(
+        self,
+        base: str,
+        colors: Optional[Mapping[str, str]] = None,
+        animation_speed: Optional[float] = None,
+        glow_intensity: Optional[float] = None,
+    ) -> CustomPalette:
+        """Valide et normalise une variante personnalisée dérivée de ``base``
+
+        Les couleurs et paramètres absents sont ceux de la variante de base.
+        """
+        if base not in self._variants:
+            raise ValueError(f"Variante de base '{base}' non reconnue")
+        variant = self._variants[base]
+        palette = dict(variant.colors.to_dict())
+        unknown = set(colors or {}) - set(palette)
+        if unknown:
+            raise ValueError(f"Couleur(s) inconnue(s): {', '.join(sorted(unknown))}")
+        palette.update(colors or {})
+        return CustomPalette(
+            base=base,
+            colors=(
+                normalize_color(palette["primary"]),
+                normalize_color(palette["secondary"]),
+                normalize_color(palette["accent"]),
+                normalize_color(palette["glow"]),
+            ),
+            animation_speed=_bounded(
+                "animation_speed",
+                variant.animation_speed if animation_speed is None else animation_speed,
+                ANIMATION_SPEED_RANGE,
+            ),
+            glow_intensity=_bounded(
+                "glow_intensity",
+                variant.glow_intensity if glow_intensity is None else glow_intensity,
+                GLOW_INTENSITY_RANGE,
+            ),
+        )
+
+    def register_custom(self, palette: CustomPalette) -> LogoVariant:
+        """Interne une variante personnalisée dans le registre partagé"""
+        return custom_variants.intern(palette, self.get_variant(palette.base))
 
     def get_variant_info(self, variant_name: str) -> Dict[str, Any]:
         """Récupère les informations d'une variante au format dictionnaire"""
         variant = self.get_variant(variant_name)
         return variant.to_dict()
+
+
+# Gestionnaire partagé (variantes prédéfinies et personnalisées)
+variants_registry = LogoVariants()
@@ -0,0 +1,134 @@
+"""
+🧪 Tests de l'export animé (chronologies SMIL et encodage)
+"""
+
+import io
+import xml.etree.ElementTree as ET
+
+import pytest
+from click.testing import CliRunner
+from PIL import Image, features
+
+from src import raster_renderer
+from src.animation import (
+    AnimatedSVG,
+    Timeline,
+    encode_animation,
+    export_animation,
+    frame_times,
+    parse_clock,
+)
+from src.cli import cli
+from src.generator_factory import LogoGeneratorFactory
+
+SVG = b"""<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">
+<circle id="pulse" cx="5" cy="5" r="4" opacity="0.5">
+<animate attributeName="opacity" values="0;1;0" dur="2s" repeatCount="indefinite"/>
+<animate attributeName="r" from="4" to="2" dur="1s" begin="0.5s" fill="freeze"/>
+</circle>
+</svg>"""
+
+
+def _opacity_rasterize(svg: bytes, width: int, height: int) -> bytes:
+    """Rastériseur factice (picklable) : gris proportionnel à l'opacité"""
+    root = ET.fromstring(svg)
+    circle = root.find("{http://www.w3.org/2000/svg}circle")
+    gray = round(float(circle.get("opacity")) * 255)
+    buffer = io.BytesIO()
+    Image.new("RGBA", (width, height), (gray, gray, gray, 255)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _attributes(svg: bytes, time: float):
+    frame = ET.fromstring(AnimatedSVG(svg).frame(time))
+    return frame.find("{http://www.w3.org/2000/svg}circle").attrib
+
+
+class TestTimeline:
+    """Évaluation des chronologies <animate>"""
+
+    def test_parse_clock(self):
+        """Horloges SMIL en secondes"""
+        assert parse_clock("2.5s") == 2.5
+        assert parse_clock("500ms") == 0.5
+        assert parse_clock("0.30000000000000004s") == pytest.approx(0.3)
+        with pytest.raises(ValueError):
+            parse_clock("wallclock(2020)")
+
+    def test_values_key_times_and_discrete(self):
+        """Interpolation linéaire, keyTimes et mode discret"""
+        timeline = Timeline("opacity", ("0", "1", "0"), duration=2.0)
+        assert [timeline.value_at(t) for t in (0, 0.5, 1, 1.5, 2)] == [
+            "0",
+            "0.5",
+            "1",
+            "0.5",
+            "0",
+        ]
+        keyed = Timeline("r", ("0", "10"), duration=1.0, key_times=(0, 0.8))
+        assert keyed.value_at(0.4) == "5"
+        discrete = Timeline("r", ("1", "2"), duration=1.0, discrete=True)
+        assert (discrete.value_at(0.4), discrete.value_at(0.6)) == ("1", "2")
+
+    def test_frames_follow_timelines(self):
+        """Attributs évalués à l'instant t, base restaurée hors période active"""
+        assert _attributes(SVG, 0.0)["opacity"] == "0"
+        assert _attributes(SVG, 0.0)["r"] == "4"
+        frame = _attributes(SVG, 1.0)
+        assert (frame["opacity"], frame["r"]) == ("1", "3")
+        assert _attributes(SVG, 3.0)["r"] == "2"
+        assert b"animate" not in AnimatedSVG(SVG).frame(1.0)
+
+    def test_loop_duration(self):
+        """Boucle parfaite : PPCM des durées, plafonné"""
+        assert AnimatedSVG(SVG).loop_duration() == 2.0
+        assert frame_times(2.0, 4) == [0, 0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75]
+
+    def test_generator_logo_is_animated(self):
+        """Les logos des builders changent réellement d'une image à l'autre"""
+        svg = LogoGeneratorFactory.create_generator("ultimate").render_svg_logo(
+            "serenity", 200
+        )
+        animated = AnimatedSVG(svg)
+        assert len(animated.timelines) > 10
+        assert animated.frame(0.0) != animated.frame(1.0)
+
+
+class TestAnimationExport:
+    """Rastérisation parallèle et encodage"""
+
+    def test_gif_shared_palette(self):
+        """GIF bouclé, une image par instant, palette commune"""
+        data = export_animation(
+            SVG, 16, "gif", fps=4, workers=2, rasterize=_opacity_rasterize
+        )
+        with Image.open(io.BytesIO(data)) as gif:
+            assert gif.format == "GIF"
+            assert gif.n_frames == 8
+            assert gif.info["loop"] == 0
+            grays = []
+            for index in range(gif.n_frames):
+                gif.seek(index)
+                grays.append(gif.convert("L").getpixel((8, 8)))
+        assert grays[0] < grays[2] < grays[4] > grays[6]
+
+    def test_apng_and_webp(self):
+        """APNG et WebP animés encodés en mémoire"""
+        frames = [Image.new("RGBA", (8, 8), (i * 60, 0, 0, 255)) for i in range(3)]
+        with Image.open(io.BytesIO(encode_animation(frames, 10, "apng"))) as apng:
+            assert apng.n_frames == 3
+        if features.check("webp_anim"):
+            data = encode_animation(frames, 10, "webp")
+            with Image.open(io.BytesIO(data)) as webp:
+                assert webp.n_frames == 3
+        with pytest.raises(ValueError):
+            encode_animation(frames, 10, "mp4")
+
+    @pytest.mark.skipif(raster_renderer.cairosvg is not None, reason="cairosvg présent")
+    def test_cli_without_backend(self, tmp_path):
+        """Sans cairosvg, la commande échoue avec un message explicite"""
+        result = CliRunner().invoke(
+            cli, ["-o", str(tmp_path), "animate", "-v", "serenity"]
+        )
+        assert result.exit_code == 1
+        assert "cairosvg" in result.output
@@ -0,0 +1,543 @@
+"""
+🧪 Tests de l'API FastAPI (main.py)
+"""
+
+import asyncio
+import io
+import json
+import time
+import zipfile
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+from src.render_pool import RenderPoolSaturatedError  # noqa: E402
+from src.svg_template import COMPILED_DENSITIES  # noqa: E402
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Client de test isolé dans un répertoire temporaire"""
+    monkeypatch.chdir(tmp_path)
+    main.limiter.reset()
+    main.render_cache.clear()
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+class TestGenerateEndpoint:
+    """Tests de l'endpoint /generate"""
+
+    def test_generate_simple(self, client):
+        """Génération d'un logo simple via le pool de rendu"""
+        response = client.post("/generate", json={"variant": "serenity", "size": 100})
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["success"] is True
+        assert payload["download_url"].endswith(".svg")
+
+    def test_generate_served_from_cache(self, client, monkeypatch):
+        """Une requête répétée est servie par le cache de rendu"""
+        payload = {"variant": "power", "size": 50, "generator_type": "dashboard"}
+        assert client.post("/generate", json=payload).status_code == 200
+        hits_before = main.render_cache.hits
+
+        async def must_not_render(*args, **kwargs):
+            raise AssertionError("Le cache aurait dû être utilisé")
+
+        monkeypatch.setattr(main.render_pool, "run", must_not_render)
+        response = client.post("/generate", json=payload)
+        assert response.status_code == 200
+        assert main.render_cache.hits == hits_before + 1
+        assert 'arkalia_luna_render_cache_hits_total{generator="dashboard"}' in (
+            client.get("/metrics").text
+        )
+
+    def test_generate_inline(self, client, tmp_path):
+        """Le mode inline renvoie le SVG sans passer par le disque"""
+        response = client.post(
+            "/generate?inline=1",
+            json={"variant": "mystery", "size": 100},
+            headers={"Accept-Encoding": "identity"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/svg+xml"
+        assert response.headers["content-length"] == str(len(response.content))
+        assert response.content.startswith(b"<?xml")
+        assert not list((tmp_path / "exports").glob("*mystery*"))
+
+        etag = response.headers["etag"]
+        cached = client.post(
+            "/generate",
+            json={"variant": "mystery", "size": 100},
+            headers={
+                "Accept": "image/svg+xml",
+                "Accept-Encoding": "identity",
+                "If-None-Match": etag,
+            },
+        )
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+
+    def test_generate_inline_precompressed(self, client):
+        """Le SVG inline est servi compressé si le client l'accepte"""
+        response = client.post(
+            "/generate?inline=1",
+            json={"variant": "awakening", "size": 100, "generator_type": "ultimate"},
+            headers={"Accept-Encoding": "gzip"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert int(response.headers["content-length"]) < len(response.content)
+        assert response.headers["etag"].endswith('-gzip"')
+        assert b"\n  " not in response.content
+
+    @pytest.mark.skipif(
+        not main.raster_renderer.available, reason="Rendu PNG indisponible"
+    )
+    def test_generate_png(self, client, tmp_path):
+        """Le PNG est rastérisé une seule fois par résolution"""
+        payload = {"variant": "serenity", "size": 100}
+        response = client.post("/generate?format=png&scale=2", json=payload)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert int.from_bytes(response.content[16:20], "big") == 200
+        assert not list((tmp_path / "exports").glob("*.svg"))
+
+        rasterized = main.raster_renderer.rasterized
+        cached = client.post(
+            "/generate?format=png&scale=2",
+            json=payload,
+            headers={"If-None-Match": response.headers["etag"]},
+        )
+        assert cached.status_code == 304
+        assert main.raster_renderer.rasterized == rasterized
+
+    def test_generate_png_revalidated_before_rasterizing(self, client, monkeypatch):
+        """Un If-None-Match valide répond 304 sans rastériser"""
+        monkeypatch.setattr(
+            main.raster_renderer, "backend", lambda svg, w, h: b"png:%dx%d" % (w, h)
+        )
+        payload = {"variant": "creative", "size": 50, "generator_type": "dashboard"}
+        response = client.post("/generate?format=png&scale=1.5", json=payload)
+        assert response.status_code == 200
+        assert response.content == b"png:75x75"
+        etag = response.headers["etag"]
+
+        async def must_not_rasterize(*args, **kwargs):
+            raise AssertionError("Le PNG n'aurait pas dû être rastérisé")
+
+        monkeypatch.setattr(main.raster_renderer, "render", must_not_rasterize)
+        cached = client.post(
+            "/generate?format=png&scale=1.5",
+            json=payload,
+            headers={"If-None-Match": etag},
+        )
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+
+    def test_generate_png_validation(self, client):
+        """Format inconnu, échelle excessive ou moteur absent sont refusés"""
+        payload = {"variant": "serenity", "size": 100}
+        assert client.post("/generate?format=gif", json=payload).status_code == 400
+        response = client.post("/generate?format=png&scale=100", json=payload)
+        assert response.status_code == (400 if main.raster_renderer.available else 501)
+
+    def test_download_precompressed(self, client):
+        """Le téléchargement sert la variante .svgz pré-calculée"""
+        payload = client.post(
+            "/generate", json={"variant": "creative", "size": 100}
+        ).json()
+        response = client.get(
+            payload["download_url"], headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.content.startswith(b"<?xml")
+
+    def test_download_content_addressed(self, client):
+        """Noms adressés par contenu, ETag fort, 304 et cache immuable"""
+        payloads = [
+            client.post(
+                "/generate",
+                json={"variant": "serenity", "size": 100, "generator_type": kind},
+            ).json()
+            for kind in ("simple", "ultimate")
+        ]
+        urls = [payload["download_url"] for payload in payloads]
+        assert urls[0] != urls[1]
+        digest = main.render_cache.get(("ultimate", "serenity", 100)).digest
+        assert (
+            urls[1] == f"/download/arkalia-luna-ultimate-serenity-100.{digest[:16]}.svg"
+        )
+
+        headers = {"Accept-Encoding": "identity"}
+        response = client.get(urls[1], headers=headers)
+        assert response.status_code == 200
+        assert response.headers["etag"] == f'"{digest[:16]}"'
+        assert response.headers["cache-control"] == main.IMMUTABLE_CACHE_CONTROL
+        assert "last-modified" in response.headers
+
+        revalidated = client.get(
+            urls[1],
+            headers={**headers, "If-None-Match": f'W/"x", {response.headers["etag"]}'},
+        )
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+
+    def test_download_legacy_name_is_revalidated(self, client, tmp_path):
+        """Un fichier sans empreinte est servi avec revalidation"""
+        (tmp_path / "exports" / "manual.svg").write_bytes(b"<svg/>")
+        response = client.get("/download/manual.svg")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-cache"
+        etag = response.headers["etag"]
+        assert (
+            client.get(
+                "/download/manual.svg", headers={"If-None-Match": etag}
+            ).status_code
+            == 304
+        )
+        assert client.get("/download/..%2Fmain.py").status_code == 404
+
+    def test_generate_custom_palette(self, client, monkeypatch):
+        """Palette en ligne : rendu dédié, répétitions servies par le cache"""
+        payload = {
+            "variant": "serenity",
+            "size": 100,
+            "generator_type": "ultimate",
+            "palette": {"primary": "#FF8800", "accent": "#0a0"},
+            "glow_intensity": 1.3,
+        }
+        response = client.post("/generate?inline=1", json=payload)
+        assert response.status_code == 200
+        assert b"#ff8800" in response.content and b"#00aa00" in response.content
+        standard = client.post(
+            "/generate?inline=1", json={"variant": "serenity", "size": 100}
+        )
+        assert standard.content != response.content
+
+        async def must_not_render(*args, **kwargs):
+            raise AssertionError("Le cache aurait dû être utilisé")
+
+        monkeypatch.setattr(main.render_pool, "run", must_not_render)
+        payload["palette"]["primary"] = "#f80"
+        repeated = client.post("/generate?inline=1", json=payload)
+        assert repeated.content == response.content
+        assert client.get("/stats").json()["custom_variants"]["size"] >= 1
+
+    def test_generate_custom_palette_validation(self, client):
+        """Couleur, paramètre ou variante de base invalides : HTTP 400"""
+        for extra in (
+            {"palette": {"primary": "rouge"}},
+            {"animation_speed": 0},
+            {"glow_intensity": 9},
+            {"variant": "inexistante", "palette": {"primary": "#fff"}},
+        ):
+            payload = {"variant": "power", "size": 50, **extra}
+            assert client.post("/generate", json=payload).status_code == 400
+
+    def test_generate_unknown_generator(self, client):
+        """Un type de générateur inconnu renvoie 400"""
+        response = client.post(
+            "/generate",
+            json={"variant": "serenity", "size": 100, "generator_type": "nope"},
+        )
+        assert response.status_code == 400
+
+    def test_generate_back_pressure(self, client, monkeypatch):
+        """Un pool saturé renvoie 503 avec Retry-After"""
+
+        async def saturated(*args, **kwargs):
+            raise RenderPoolSaturatedError(3, "simple")
+
+        monkeypatch.setattr(main.render_pool, "run", saturated)
+        response = client.post("/generate", json={"variant": "serenity", "size": 100})
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+
+    def test_generated_files_are_indexed(self, client, monkeypatch):
+        """Les exports sont indexés puis évincés par la tâche de nettoyage"""
+        payload = client.post(
+            "/generate", json={"variant": "power", "size": 200}
+        ).json()
+        file_path = main.Path(payload["file_path"])
+        assert file_path in main.export_index
+        assert file_path.with_suffix(".svgz") in main.export_index
+
+        monkeypatch.setattr(main.export_index, "max_age", 0)
+        evicted = client.portal.call(main.cleanup_exports)
+        assert evicted["age"] >= 2
+        assert not file_path.exists()
+        assert 'arkalia_luna_export_evictions_total{reason="age"}' in (
+            client.get("/metrics").text
+        )
+
+    def test_health_and_metrics(self, client):
+        """Les routes GET restent disponibles"""
+        assert client.get("/health").status_code == 200
+        assert "arkalia_luna_requests_total" in client.get("/metrics").text
+
+
+class TestBatchEndpoint:
+    """Tests de l'endpoint /generate/batch"""
+
+    def test_batch_ndjson(self, client, tmp_path):
+        """Une ligne par logo distinct, avec erreur et durée par élément"""
+        items = [
+            {"variant": "serenity", "size": 50},
+            {"variant": "serenity", "size": 50},
+            {"variant": "power", "size": 100, "generator_type": "dashboard"},
+            {"variant": "mystery", "size": 123},
+        ]
+        response = client.post("/generate/batch", json={"items": items})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.headers["x-batch-duplicates"] == "1"
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert len(lines) == 3
+        results = {(line["generator_type"], line["size"]): line for line in lines}
+        assert results[("simple", 50)]["svg"].startswith("<?xml")
+        assert results[("dashboard", 100)]["success"] is True
+        invalid = results[("simple", 123)]
+        assert invalid["success"] is False
+        assert invalid["status_code"] == 400
+        assert "svg" not in invalid
+        assert all(line["generation_time"] >= 0 for line in lines)
+        assert not list((tmp_path / "exports").glob("*.svg"))
+
+    def test_batch_ndjson_bounded_window(self):
+        """Rendus créés au fil de l'eau et annulés à l'abandon du flux"""
+        started, cancelled, running = [], [], set()
+        peak = 0
+
+        async def render(index):
+            nonlocal peak
+            started.append(index)
+            running.add(index)
+            peak = max(peak, len(running))
+            try:
+                await asyncio.sleep(0.01 * (index % 3 + 1))
+            except asyncio.CancelledError:
+                cancelled.append(index)
+                raise
+            finally:
+                running.discard(index)
+            return {"index": index}, None
+
+        async def consume():
+            stream = main.stream_batch_ndjson([(i,) for i in range(20)], render, 3)
+            lines = [await stream.__anext__() for _ in range(4)]
+            await stream.aclose()
+            await asyncio.sleep(0)
+            return lines
+
+        lines = asyncio.run(consume())
+        assert len(lines) == 4
+        assert peak == 3
+        assert len(started) <= 4 + 3
+        assert len(cancelled) == len(started) - 4
+        assert not running
+
+    def test_batch_zip(self, client):
+        """Le mode zip regroupe les SVG et un manifeste"""
+        items = [
+            {"variant": "creative", "size": 50},
+            {"variant": "awakening", "size": 50, "generator_type": "ultimate"},
+            {"variant": "awakening", "size": 50, "generator_type": "nope"},
+        ]
+        response = client.post("/generate/batch?format=zip", json={"items": items})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+
+        archive = zipfile.ZipFile(io.BytesIO(response.content))
+        manifest = json.loads(archive.read("manifest.json"))
+        assert [item["success"] for item in manifest["items"]] == [True, True, False]
+        assert sorted(archive.namelist()) == [
+            "manifest.json",
+            "simple/arkalia-luna-creative-50.svg",
+            "ultimate/arkalia-luna-awakening-50.svg",
+        ]
+        svg = archive.read("ultimate/arkalia-luna-awakening-50.svg")
+        assert svg == main.render_cache.get(("ultimate", "awakening", 50)).content
+
+    def test_batch_density(self, client):
+        """Chaque densité est un rendu distinct, mis en cache séparément"""
+        items = [
+            {"variant": "power", "size": 50, "generator_type": "ultimate"},
+            {
+                "variant": "power",
+                "size": 50,
+                "generator_type": "ultimate",
+                "density": 3,
+            },
+        ]
+        response = client.post("/generate/batch?format=zip", json={"items": items})
+        assert response.status_code == 200
+        archive = zipfile.ZipFile(io.BytesIO(response.content))
+        standard = archive.read("ultimate/arkalia-luna-power-50.svg")
+        dense = archive.read("ultimate/arkalia-luna-power-50-d3.svg")
+        assert dense.count(b"<circle") > standard.count(b"<circle")
+        assert main.render_cache.get(("ultimate", "power", 50, 3.0)).content == dense
+        for density in (0, 4.5, 1000):
+            invalid = {"variant": "power", "size": 50, "density": density}
+            assert client.post("/generate", json=invalid).status_code == 422
+
+    def test_max_density_is_compiled(self):
+        """La densité maximale de l'API reste sur le chemin compilé"""
+        assert main.app_config.MAX_DENSITY == max(COMPILED_DENSITIES)
+
+    def test_batch_custom_palettes(self, client):
+        """Palettes équivalentes dédupliquées, palette invalide refusée"""
+        palette = {"primary": "#0F0", "glow": "#ff0000"}
+        items = [
+            {"variant": "mystery", "size": 50, "palette": palette},
+            {
+                "variant": "mystery",
+                "size": 50,
+                "palette": {**palette, "primary": "#00ff00"},
+            },
+            {"variant": "mystery", "size": 50},
+        ]
+        response = client.post("/generate/batch?format=zip", json={"items": items})
+        assert response.status_code == 200
+        assert response.headers["x-batch-duplicates"] == "1"
+        archive = zipfile.ZipFile(io.BytesIO(response.content))
+        manifest = json.loads(archive.read("manifest.json"))
+        name = manifest["items"][0]["custom_variant"]
+        custom = archive.read(f"simple/arkalia-luna-{name}-50.svg")
+        assert b"#00ff00" in custom
+        assert custom != archive.read("simple/arkalia-luna-mystery-50.svg")
+        invalid = [{"variant": "mystery", "size": 50, "palette": {"primary": "vert"}}]
+        assert (
+            client.post("/generate/batch", json={"items": invalid})
+        ).status_code == 400
+
+    def test_batch_limits(self, client, monkeypatch):
+        """Format inconnu, lot vide ou trop grand sont refusés"""
+        items = [{"variant": "serenity", "size": size} for size in (50, 100)]
+        assert (
+            client.post("/generate/batch?format=tar", json={"items": items})
+        ).status_code == 400
+        assert client.post("/generate/batch", json={"items": []}).status_code == 422
+        monkeypatch.setitem(main.batch_config, "max_items", 1)
+        assert client.post("/generate/batch", json={"items": items}).status_code == 400
+
+
+class TestPackEndpoint:
+    """Tests de l'endpoint /pack"""
+
+    def test_pack_stream(self, client, tmp_path):
+        """Le pack est diffusé en ZIP sans écrire dans exports/"""
+        response = client.get(
+            "/pack", params={"generators": ["simple", "dashboard"], "sizes": [50]}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        assert response.headers["x-pack-items"] == "10"
+
+        archive = zipfile.ZipFile(io.BytesIO(response.content))
+        assert len(archive.namelist()) == 11
+        manifest = json.loads(archive.read("manifest.json"))
+        assert all(item["success"] for item in manifest["items"])
+        assert archive.read("dashboard/arkalia-luna-power-50.svg") == (
+            main.render_cache.get(("dashboard", "power", 50)).content
+        )
+        assert not list((tmp_path / "exports").glob("*.svg"))
+
+    def test_pack_renders_through_pool(self, client, monkeypatch):
+        """Les logos absents du cache sont rendus par le pool de rendu"""
+        pooled = []
+        run = main.render_pool.run
+
+        async def counting_run(generator_type, *args):
+            pooled.append(generator_type)
+            return await run(generator_type, *args)
+
+        monkeypatch.setattr(main.render_pool, "run", counting_run)
+        params = {"generators": ["dashboard"], "variants": ["power"], "sizes": [50]}
+        first = client.get("/pack", params=params).content
+        assert pooled == ["dashboard"]
+        # Deuxième pack : servi par le cache, sans nouveau rendu
+        assert client.get("/pack", params=params).content == first
+        assert pooled == ["dashboard"]
+
+    def test_pack_records_saturation(self, client, monkeypatch):
+        """Un pool saturé est consigné dans le manifeste sans couper le pack"""
+
+        async def saturated(*args, **kwargs):
+            raise RenderPoolSaturatedError(3, "simple")
+
+        monkeypatch.setattr(main.render_pool, "run", saturated)
+        response = client.get("/pack", params={"variants": ["power"], "sizes": [50]})
+        assert response.status_code == 200
+        archive = zipfile.ZipFile(io.BytesIO(response.content))
+        manifest = json.loads(archive.read("manifest.json"))
+        assert [item["success"] for item in manifest["items"]] == [False]
+        assert archive.namelist() == ["manifest.json"]
+
+    def test_pack_validation(self, client):
+        """Taille, variante ou compression invalides renvoient 400"""
+        assert client.get("/pack", params={"sizes": [123]}).status_code == 400
+        assert client.get("/pack", params={"variants": ["nope"]}).status_code == 400
+        assert client.get("/pack", params={"compression": "xz"}).status_code == 400
+
+
+class TestReadiness:
+    """Tests du warm-up et de la sonde /ready"""
+
+    def test_ready_without_warmup(self, client):
+        """Sans warm-up, l'instance est prête dès le démarrage"""
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+
+    def test_warmup_matrix(self):
+        """La matrice couvre générateurs × variantes × tailles"""
+        matrix = main.get_warmup_matrix(
+            {"generators": [], "sizes": [50, 100], "persist": False}
+        )
+        generators = {generator for generator, _, _ in matrix}
+        assert "simple" in generators and "ultimate" in generators
+        assert "default" not in generators
+        assert len(matrix) == len(generators) * 5 * 2
+
+    def test_warmup_fills_cache_before_ready(self, tmp_path, monkeypatch):
+        """/ready renvoie 503 pendant le warm-up puis 200 une fois le cache rempli"""
+        monkeypatch.chdir(tmp_path)
+        main.limiter.reset()
+        main.render_cache.clear()
+        monkeypatch.setattr(
+            main,
+            "warmup_config",
+            {
+                "enabled": True,
+                "sizes": [50],
+                "generators": ["simple", "dashboard"],
+                "persist": False,
+            },
+        )
+        monkeypatch.setattr(main, "readiness", main.ReadinessState())
+
+        with TestClient(main.app) as test_client:
+            first = test_client.get("/ready")
+            assert first.status_code in (200, 503)
+            deadline = time.time() + 60
+            while test_client.get("/ready").status_code != 200:
+                assert time.time() < deadline, "Warm-up trop long"
+                time.sleep(0.05)
+
+            status = test_client.get("/ready").json()
+            assert status["warmup"] == {
+                "total": 10,
+                "completed": 10,
+                "failed": 0,
+                "duration": status["warmup"]["duration"],
+            }
+            assert ("dashboard", "power", 50) in main.render_cache
+            assert not list((tmp_path / "exports").glob("*.svg"))
@@ -2,6 +2,10 @@
 Tests de benchmark pour mesurer les performances du générateur de logos.
 """
 
+import gc
+import time
+import tracemalloc
+
 import pytest
 
 from src.logo_generator import ArkaliaLunaLogo
@@ -139,5 +143,68 @@ class TestCLIBenchmark:
         assert "Usage:" in result
 
 
+class TestDensityBenchmark:
+    """Benchmarks de la densité : effectifs et temps de rendu linéaires."""
+
+    @pytest.fixture
+    def builder(self):
+        """Fixture pour le builder ULTRA-MAX (particules et rayons)."""
+        from src.svg_builder_ultra_max import UltraMaxSVGBuilder
+
+        return UltraMaxSVGBuilder(LogoVariants())
+
+    @staticmethod
+    def render(builder, density):
+        """Rendu complet sans cache de templates."""
+        from src.svg_template import render_variant
+
+        variant = builder.variants_manager.get_variant("power")
+        return render_variant(builder.with_density(density), variant, 500)
+
+    @pytest.mark.parametrize("density", [1, 4, 16])
+    def test_density_benchmark(self, benchmark, builder, density):
+        """Benchmark du rendu selon la densité."""
+        result = benchmark(self.render, builder, density)
+        assert result.count("<circle") > 0
+
+    def test_element_count_is_linear(self, builder):
+        """Chaque unité de densité ajoute le même nombre d'éléments."""
+        counts = [self.render(builder, d).count("<") for d in (2, 4, 8)]
+        assert counts[2] - counts[1] == 2 * (counts[1] - counts[0])
+
+    @staticmethod
+    def slopes(costs):
+        """Coût marginal par unité de densité sur [2, 4] et sur [8, 16]."""
+        return (costs[4] - costs[2]) / 2, (costs[16] - costs[8]) / 8
+
+    @pytest.mark.slow
+    def test_time_and_memory_are_linear(self, builder):
+        """Temps et pic mémoire croissent linéairement avec la densité."""
+        self.render(builder, 1)
+        durations, peaks = {}, {}
+        for density in (2, 4, 8, 16):
+            timings = []
+            for _ in range(3):
+                gc.collect()
+                start = time.perf_counter()
+                self.render(builder, density)
+                timings.append(time.perf_counter() - start)
+            durations[density] = min(timings)
+
+            gc.collect()
+            tracemalloc.start()
+            try:
+                self.render(builder, density)
+                peaks[density] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        # Même coût marginal en bas et en haut de l'échelle (± tolérance)
+        low, high = self.slopes(peaks)
+        assert 1 / 1.25 < high / low < 1.25
+        low, high = self.slopes(durations)
+        assert 1 / 2 < high / low < 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "--benchmark-only"])
@@ -0,0 +1,54 @@
+"""
+🧪 Tests du registre des builders SVG partagés
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from src.builder_registry import BuilderRegistry, builder_registry
+from src.logo_generator import ArkaliaLunaLogo
+from src.svg_builder_realism_max import RealismMaxSVGBuilder
+from src.svg_builder_ultimate import UltimateSVGBuilder
+from src.svg_optimizer import SVGOptimizer
+from src.ultimate_generator import UltimateLogoGenerator
+from src.variants import variants_registry
+
+
+class TestBuilderRegistry:
+    """Une instance de builder par type, créée à la première demande"""
+
+    def test_lazy_single_instance(self):
+        """Le builder n'est construit qu'une fois, même en concurrence"""
+        registry = BuilderRegistry()
+        assert RealismMaxSVGBuilder not in registry
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            builders = list(
+                executor.map(lambda _: registry.get(RealismMaxSVGBuilder), range(32))
+            )
+        assert all(builder is builders[0] for builder in builders)
+        assert builders[0].variants_manager is variants_registry
+        assert registry.get_stats() == {
+            "builders": 1,
+            "types": ["RealismMaxSVGBuilder"],
+        }
+        registry.clear()
+        assert len(registry) == 0
+
+    def test_generators_share_builders(self):
+        """Les générateurs d'un même type partagent leur builder"""
+        first, second = UltimateLogoGenerator(), UltimateLogoGenerator()
+        assert first.svg_builder is second.svg_builder
+        assert first.svg_builder is builder_registry.get(UltimateSVGBuilder)
+        assert ArkaliaLunaLogo().svg_builder is not first.svg_builder
+
+    def test_configuration_does_not_leak(self):
+        """Densité et optimisation s'appliquent à une copie du builder partagé"""
+        shared = builder_registry.get(UltimateSVGBuilder)
+        generator = UltimateLogoGenerator()
+        generator.set_density(2)
+        optimizer = SVGOptimizer()
+        generator.set_optimizer(optimizer)
+        assert generator.svg_builder is not shared
+        assert generator.svg_builder.density == 2
+        assert generator.svg_builder.optimizer is optimizer
+        assert (shared.density, shared.optimizer) == (1.0, None)
+        assert UltimateLogoGenerator().svg_builder is shared
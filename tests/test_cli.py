@@ -1,5 +1,7 @@
 """Tests pour le module CLI d'Arkalia-LUNA Logo Generator"""
 
+import zipfile
+
 import pytest
 from click.testing import CliRunner
 
@@ -78,3 +80,81 @@ class TestCLIOutput:
         result = runner.invoke(cli, ["--help"])
         assert result.exit_code == 0
         assert "Commands:" in result.output
+
+
+class TestGenerateAll:
+    """Tests de la génération de la matrice complète"""
+
+    def test_generate_all_serial_matrix(self, tmp_path):
+        """Le mode séquentiel couvre générateurs × variantes × tailles"""
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            ["-o", str(tmp_path), "generate-all", "-s", "50", "-s", "100"]
+            + ["-g", "default", "-g", "dashboard"],
+        )
+        assert result.exit_code == 0, result.output
+        assert "20/20 logos générés" in result.output
+        assert len(list(tmp_path.glob("arkalia-luna-dashboard-*.svg"))) == 10
+
+    def test_generate_all_parallel(self, tmp_path):
+        """Le mode parallèle répartit les rendus sur un pool de processus"""
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            ["-o", str(tmp_path), "generate-all", "--parallel", "-w", "2"]
+            + ["-s", "64", "-g", "realism"],
+        )
+        assert result.exit_code == 0, result.output
+        assert "2 processus" in result.output
+        assert "5/5 logos générés" in result.output
+        assert len(list(tmp_path.glob("arkalia-luna-realism-*-64.svg"))) == 5
+
+    def test_generate_all_density(self, tmp_path):
+        """L'option --density multiplie les éléments des logos générés"""
+        runner = CliRunner()
+        sizes = {}
+        for density in ("1", "4"):
+            output = tmp_path / density
+            result = runner.invoke(
+                cli,
+                ["-o", str(output), "--density", density, "generate-all"]
+                + ["-s", "100", "-g", "ultra_max"],
+            )
+            assert result.exit_code == 0, result.output
+            logo = output / "arkalia-luna-ultra-max-power-100.svg"
+            sizes[density] = logo.read_text().count("<circle")
+        assert sizes["4"] > sizes["1"]
+        assert runner.invoke(cli, ["--density", "0", "info"]).exit_code != 0
+
+    def test_generate_all_unknown_generator(self, tmp_path):
+        """Un type de générateur inconnu est refusé"""
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["-o", str(tmp_path), "generate-all", "-g", "inexistant"]
+        )
+        assert result.exit_code != 0
+
+
+class TestPack:
+    """Tests de l'export du pack ZIP"""
+
+    def test_pack_writes_archive_only(self, tmp_path):
+        """Le pack contient la matrice et rien n'est écrit dans exports/"""
+        exports = tmp_path / "exports"
+        archive_path = tmp_path / "pack.zip"
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            ["-o", str(exports), "pack", "-o", str(archive_path)]
+            + ["-s", "50", "-g", "default", "-g", "ai_moon", "--compression", "stored"],
+        )
+        assert result.exit_code == 0, result.output
+        assert "10/10 logos exportés" in result.output
+
+        with zipfile.ZipFile(archive_path) as archive:
+            names = archive.namelist()
+            assert len(names) == 11
+            assert "ai_moon/arkalia-luna-serenity-50.svg" in names
+            assert archive.testzip() is None
+        assert not list(exports.glob("*.svg"))
@@ -0,0 +1,100 @@
+"""
+🧪 Tests de la conversion SVG → PNG par lot
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from src import raster_renderer
+from src.cli import cli
+from src.converter import MANIFEST_NAME, convert_svgs, find_sources, png_name
+
+
+def _fake_rasterize(svg: bytes, sizes):
+    """Moteur factice (picklable) : une analyse par source, toutes tailles"""
+    return {size: f"{size}:".encode() + svg for size in sizes}
+
+
+def _failing_rasterize(svg: bytes, sizes):
+    raise ValueError("SVG invalide")
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Trois sources SVG"""
+    directory = tmp_path / "svg"
+    directory.mkdir()
+    for name in ("serenity", "power", "mystery"):
+        (directory / f"logo-{name}.svg").write_text(f"<svg id='{name}'/>")
+    return directory
+
+
+class TestConverter:
+    """Tests du convertisseur"""
+
+    def test_convert_and_skip_fresh(self, sources, tmp_path):
+        """Seules les sources modifiées (ou tailles nouvelles) sont reconverties"""
+        destination = tmp_path / "png"
+        files = find_sources([sources])
+        report = convert_svgs(
+            files, [64, 128], destination, workers=2, backend=_fake_rasterize
+        )
+        assert (report["converted"], report["skipped"]) == (6, 0)
+        output = destination / png_name(sources / "logo-power.svg", 128)
+        assert output.read_bytes() == b"128:<svg id='power'/>"
+        manifest = json.loads((destination / MANIFEST_NAME).read_text())
+        assert len(manifest["entries"]) == 6
+
+        (sources / "logo-power.svg").write_text("<svg id='power-v2'/>")
+        report = convert_svgs(
+            files, [64, 128, 256], destination, backend=_fake_rasterize
+        )
+        assert (report["converted"], report["skipped"]) == (5, 4)
+        assert output.read_bytes() == b"128:<svg id='power-v2'/>"
+
+        output.unlink()
+        report = convert_svgs(files, [64, 128], destination, backend=_fake_rasterize)
+        assert (report["converted"], report["skipped"]) == (1, 5)
+
+    def test_homonymous_sources_do_not_collide(self, sources, tmp_path):
+        """Deux SVG de même nom dans des répertoires différents gardent leur PNG"""
+        other = tmp_path / "other"
+        other.mkdir()
+        (other / "logo-power.svg").write_text("<svg id='other-power'/>")
+        destination = tmp_path / "png"
+        files = find_sources([sources, other])
+        report = convert_svgs(files, [64], destination, backend=_fake_rasterize)
+        assert report["converted"] == 4
+        outputs = {
+            destination / png_name(source, 64, qualified=True)
+            for source in (sources / "logo-power.svg", other / "logo-power.svg")
+        }
+        assert len(outputs) == 2
+        assert {output.read_bytes() for output in outputs} == {
+            b"64:<svg id='power'/>",
+            b"64:<svg id='other-power'/>",
+        }
+        assert (destination / png_name(sources / "logo-serenity.svg", 64)).exists()
+
+        report = convert_svgs(files, [64], destination, backend=_fake_rasterize)
+        assert (report["converted"], report["skipped"]) == (0, 4)
+
+    def test_failures_are_reported(self, sources, tmp_path):
+        """Une source en échec n'est pas consignée dans le manifeste"""
+        destination = tmp_path / "png"
+        report = convert_svgs(
+            find_sources([sources]), [64], destination, backend=_failing_rasterize
+        )
+        assert report["converted"] == 0
+        assert len(report["failed"]) == 3
+        manifest = json.loads((destination / MANIFEST_NAME).read_text())
+        assert manifest["entries"] == {}
+
+    @pytest.mark.skipif(raster_renderer.cairosvg is not None, reason="cairosvg présent")
+    def test_cli_without_backend(self, sources):
+        """Sans cairosvg, la commande échoue avec un message explicite"""
+        result = CliRunner().invoke(cli, ["convert", str(sources)])
+        assert result.exit_code == 1
+        assert "cairosvg" in result.output
@@ -0,0 +1,63 @@
+"""
+🧪 Tests du cache des fragments <defs>
+"""
+
+import dataclasses
+
+import pytest
+
+from src.defs_cache import defs_cache, variant_key
+from src.svg_builder_ultimate import UltimateSVGBuilder
+from src.svg_template import compile_template
+from src.variants import LogoVariants
+
+
+@pytest.fixture
+def builder():
+    defs_cache.clear()
+    yield UltimateSVGBuilder(LogoVariants())
+    defs_cache.clear()
+
+
+class TestDefsCache:
+    """Fragments construits une fois par variante, réutilisés à toute taille"""
+
+    def test_fragments_shared_across_sizes(self, builder):
+        """Deux tailles : gradients et filtres ne sont construits qu'une fois"""
+        hits = defs_cache.hits
+        first = builder.render_logo("serenity", 200)
+        fragments = len(defs_cache)
+        builder.render_logo("serenity", 512)
+        assert len(defs_cache) == fragments
+        assert defs_cache.hits - hits == fragments
+        assert builder.render_logo("serenity", 200) == first
+
+    def test_size_dependent_defs_keyed_by_size(self, builder):
+        """Les masques dépendant de la taille ont leurs propres entrées"""
+        variant = builder.variants_manager.get_variant("power")
+        defs = builder.create_drawing(100).defs
+        builder._add_ultimate_masks(defs, variant, 100)
+        builder._add_ultimate_masks(defs, variant, 300)
+        assert len(defs_cache) == 2
+        radii = [element.get_xml()[0].get("r") for element in defs.elements[::2]]
+        assert radii[0] != radii[1]
+
+    def test_variant_parameters_in_key(self, builder):
+        """Une palette différente ne réutilise pas le fragment d'une autre"""
+        variant = builder.variants_manager.get_variant("serenity")
+        recolored = dataclasses.replace(
+            variant, colors=dataclasses.replace(variant.colors, primary="#000000")
+        )
+        assert variant_key(variant) != variant_key(recolored)
+        defs = builder.create_drawing(100).defs
+        builder._add_ultimate_gradients(defs, variant)
+        builder._add_ultimate_gradients(defs, recolored)
+        assert len(defs_cache) == 2
+
+    def test_template_probe_bypasses_cache(self, builder):
+        """La compilation des gabarits reste valide avec le cache actif"""
+        variant = builder.variants_manager.get_variant("mystery")
+        builder.render_logo("mystery", 200)
+        template = compile_template(builder, variant, 200)
+        assert template is not None
+        assert template.render(variant) == builder.render_logo("mystery", 200)
@@ -0,0 +1,58 @@
+"""
+🧪 Tests de reproductibilité des rendus (RNG par rendu)
+"""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.svg_builder_ai_moon import AIMoonSVGBuilder
+from src.svg_builder_realism_max import RealismMaxSVGBuilder
+from src.svg_builder_ultimate import UltimateSVGBuilder
+from src.svg_builder_ultra_max import UltraMaxSVGBuilder
+from src.variants import LogoVariants
+
+RANDOM_BUILDERS = [
+    UltimateSVGBuilder,
+    RealismMaxSVGBuilder,
+    AIMoonSVGBuilder,
+    UltraMaxSVGBuilder,
+]
+
+
+@pytest.mark.parametrize("builder_class", RANDOM_BUILDERS)
+class TestDeterministicRendering:
+    """Des entrées identiques donnent un SVG identique octet par octet"""
+
+    def test_identical_inputs_identical_output(self, builder_class):
+        """Deux rendus successifs sont identiques"""
+        builder = builder_class(LogoVariants())
+        first = builder.render_logo("serenity", 200)
+        random.random()  # L'état global ne doit pas influencer le rendu
+        second = builder_class(LogoVariants()).render_logo("serenity", 200)
+        assert first == second
+
+    def test_global_random_state_untouched(self, builder_class):
+        """Le rendu ne réinitialise pas le module random global"""
+        random.seed(1234)
+        expected = random.Random(1234).random()
+        builder_class(LogoVariants()).render_logo("power", 100)
+        assert random.random() == expected
+
+    def test_thread_safe_rendering(self, builder_class):
+        """Des rendus concurrents n'interfèrent pas entre eux"""
+        builder = builder_class(LogoVariants())
+        reference = builder.render_logo("mystery", 200)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(lambda _: builder.render_logo("mystery", 200), range(8))
+            )
+        assert all(result == reference for result in results)
+
+    def test_seed_changes_output(self, builder_class):
+        """La graine fait partie de la dérivation"""
+        builder = builder_class(LogoVariants())
+        reference = builder.render_logo("creative", 200)
+        builder.seed = 7
+        assert builder.render_logo("creative", 200) != reference
@@ -0,0 +1,82 @@
+"""
+🧪 Tests de l'index des exports et de leur éviction
+"""
+
+import os
+
+from src.export_index import ExportIndex
+
+
+class FakeClock:
+    """Horloge contrôlée par le test"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def write(path, size):
+    path.write_bytes(b"x" * size)
+    return path
+
+
+class TestExportIndex:
+    """Tests de l'index ordonné par date de modification"""
+
+    def test_evict_by_age(self, tmp_path):
+        """Seuls les fichiers plus vieux que max_age sont supprimés"""
+        clock = FakeClock()
+        index = ExportIndex(max_age=60, clock=clock)
+        old = write(tmp_path / "old.svg", 10)
+        index.record(old)
+        clock.now += 50
+        recent = write(tmp_path / "recent.svg", 20)
+        index.record(recent)
+
+        clock.now += 20
+        assert index.evict() == {"age": 1, "budget": 0, "bytes": 10}
+        assert not old.exists() and recent.exists()
+        assert old not in index and recent in index
+        assert index.total_bytes == 20
+
+    def test_evict_by_budget_oldest_first(self, tmp_path):
+        """Au-delà du budget, les plus anciens partent en premier"""
+        clock = FakeClock()
+        index = ExportIndex(max_age=None, max_bytes=250, clock=clock)
+        paths = []
+        for name in ("a", "b", "c"):
+            paths.append(write(tmp_path / f"{name}.svg", 100))
+            index.record(paths[-1])
+            clock.now += 1
+
+        # Réécrire « a » le rend le plus récent
+        index.record(paths[0])
+        assert index.evict() == {"age": 0, "budget": 1, "bytes": 100}
+        assert [p.exists() for p in paths] == [True, False, True]
+        assert len(index) == 2
+
+    def test_scan_restores_existing_files(self, tmp_path):
+        """Au démarrage, les fichiers existants sont indexés par mtime"""
+        for name, mtime in (("new.svg", 2000), ("old.svg", 100), ("old.svgz", 100)):
+            os.utime(write(tmp_path / name, 5), (mtime, mtime))
+        write(tmp_path / "notes.txt", 5)
+
+        index = ExportIndex(max_age=500, clock=FakeClock(1000))
+        assert index.scan(tmp_path) == 3
+        assert index.total_bytes == 15
+        assert index.evict() == {"age": 2, "budget": 0, "bytes": 10}
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["new.svg", "notes.txt"]
+
+    def test_missing_files_are_tolerated(self, tmp_path):
+        """Un fichier déjà supprimé ne fait pas échouer l'éviction"""
+        clock = FakeClock()
+        index = ExportIndex(max_age=1, clock=clock)
+        gone = write(tmp_path / "gone.svg", 3)
+        index.record(gone)
+        index.record(tmp_path / "never-written.svg")
+        gone.unlink()
+        clock.now += 10
+        assert index.evict()["age"] == 1
+        assert len(index) == 0
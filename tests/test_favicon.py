@@ -0,0 +1,67 @@
+"""
+🧪 Tests des packs de favicons web
+"""
+
+import json
+
+from click.testing import CliRunner
+from PIL import Image
+
+from src.cli import cli
+from src.favicon import (
+    FAVICON_SIZES,
+    ICO_NAME,
+    WEBMANIFEST_NAME,
+    downsample,
+    draw_favicon_master,
+    favicon_file_name,
+)
+from src.logo_generator import ArkaliaLunaLogo
+from src.variants import ColorScheme
+
+COLORS = ColorScheme(
+    primary="#1e3a8a", secondary="#3b82f6", accent="#06b6d4", glow="#60a5fa"
+)
+
+
+class TestFavicon:
+    """Tests du pack de favicons"""
+
+    def test_downsample_from_master(self):
+        """Chaque taille est une réduction du même master"""
+        master = draw_favicon_master(COLORS, 512)
+        images = downsample(master, FAVICON_SIZES)
+        assert sorted(images) == sorted(FAVICON_SIZES)
+        assert images[512] is master
+        assert all(image.size == (size, size) for size, image in images.items())
+
+    def test_bundle_files(self, tmp_path):
+        """PNG, ICO multi-images et webmanifest d'une variante"""
+        generator = ArkaliaLunaLogo(tmp_path)
+        written = generator.create_favicon_bundle("power")
+        directory = generator.get_favicon_bundle_dir("power")
+        assert len(written) == len(FAVICON_SIZES) + 2
+        assert (directory / "apple-touch-icon.png").exists()
+        with Image.open(directory / favicon_file_name(16)) as image:
+            assert image.size == (16, 16)
+
+        with Image.open(directory / ICO_NAME) as ico:
+            assert sorted(ico.info["sizes"]) == [(16, 16), (32, 32), (48, 48), (64, 64)]
+
+        manifest = json.loads((directory / WEBMANIFEST_NAME).read_text())
+        assert [icon["sizes"] for icon in manifest["icons"]] == ["192x192", "512x512"]
+        assert (
+            manifest["theme_color"]
+            == generator.get_variant_info("power")["colors"]["primary"]
+        )
+
+    def test_cli_bundles_all_variants(self, tmp_path):
+        """Un pack par variante, variantes traitées en parallèle"""
+        result = CliRunner().invoke(
+            cli,
+            ["-o", str(tmp_path), "favicon-bundle", "-s", "32", "-s", "64"]
+            + ["-w", "2"],
+        )
+        assert result.exit_code == 0, result.output
+        assert "5/5 packs de favicons" in result.output
+        assert len(list(tmp_path.glob("favicons/*/favicon.ico"))) == 5
@@ -0,0 +1,224 @@
+"""
+🧪 Tests de la géométrie vectorisée des couches (particules, rayons, nœuds)
+"""
+
+import hashlib
+import json
+import math
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.geometry import (
+    draw_columns,
+    format_floats,
+    format_numbers,
+    radial_layer,
+    scaled_count,
+    stagger,
+)
+from src.logo_generator import ArkaliaLunaLogo
+from src.simple_advanced_generator import SimpleAdvancedLogoGenerator
+from src.svg_builder_advanced import AdvancedSVGBuilder
+from src.svg_builder_ai_moon import AIMoonSVGBuilder
+from src.svg_builder_dashboard import DashboardSVGBuilder
+from src.svg_builder_realism_max import RealismMaxSVGBuilder
+from src.svg_builder_simple_advanced import SimpleAdvancedSVGBuilder
+from src.svg_builder_ultimate import UltimateSVGBuilder
+from src.svg_builder_ultra_max import UltraMaxSVGBuilder
+from src.ultimate_generator import UltimateLogoGenerator
+from src.variants import LogoVariants
+
+# Empreintes des rendus d'avant la vectorisation et la densité (densité 1.0)
+PRE_DENSITY_DIGESTS = json.loads(
+    (Path(__file__).parent / "fixtures" / "pre_density_sha256.json").read_text()
+)
+ALL_BUILDERS = [
+    AdvancedSVGBuilder,
+    AIMoonSVGBuilder,
+    DashboardSVGBuilder,
+    RealismMaxSVGBuilder,
+    SimpleAdvancedSVGBuilder,
+    UltimateSVGBuilder,
+    UltraMaxSVGBuilder,
+]
+
+
+class TestGeometry:
+    """Tests des fonctions de géométrie"""
+
+    def test_ring_layer_matches_scalar_trigonometry(self):
+        """Les points réguliers correspondent au calcul math.cos/math.sin"""
+        layer = radial_layer(12, center=100, distance=80)
+        for i in range(12):
+            angle = (i * 30) * (math.pi / 180)
+            assert layer.x[i] == pytest.approx(100 + 80 * math.cos(angle))
+            assert layer.y[i] == pytest.approx(100 + 80 * math.sin(angle))
+
+    def test_truncation_like_int(self):
+        """La troncature suit int() (vers zéro)"""
+        layer = radial_layer(8, center=0, distance=10.7).truncated()
+        expected = [int(10.7 * math.cos(i * math.pi / 4)) for i in range(8)]
+        assert layer.x.tolist() == expected
+
+    @pytest.mark.parametrize(
+        "count, step, factor", [(8, 45, 0.4), (12, 30, 0.45), (6, 60, 0.4)]
+    )
+    def test_truncation_matches_scalar_loop(self, count, step, factor):
+        """Seul le décalage est tronqué : ``center + int(offset)``, y compris
+        pour les décalages négatifs non entiers"""
+        for size in range(50, 1030, 7):
+            center = size // 2
+            layer = radial_layer(count, center=center, distance=size * factor)
+            truncated = layer.truncated()
+            for i in range(count):
+                angle = (i * step) * (math.pi / 180)
+                x = center + int(size * factor * math.cos(angle))
+                y = center + int(size * factor * math.sin(angle))
+                assert (truncated.x[i], truncated.y[i]) == (x, y)
+
+    def test_drawn_layer_follows_scalar_draw_order(self):
+        """Les tirages suivent l'ordre des boucles scalaires d'origine"""
+        rng, expected = random.Random(7), random.Random(7)
+        angles, distances, opacities = draw_columns(
+            rng,
+            50,
+            lambda r: r.uniform(0, 2 * math.pi),
+            lambda r: r.uniform(10, 20),
+            lambda r: r.uniform(0.5, 0.9),
+        )
+        layer = radial_layer(
+            50, center=0, distance=distances, opacity=opacities, angles=angles
+        )
+        for i in range(50):
+            angle, distance = expected.uniform(0, 2 * math.pi), expected.uniform(10, 20)
+            assert layer.x[i] == distance * math.cos(angle)
+            assert layer.opacity[i] == expected.uniform(0.5, 0.9)
+
+    def test_format_numbers(self):
+        """Formatage en une passe, sans zéros inutiles"""
+        assert format_numbers(np.array([1.5, 2.0, -0.001, 3.14159])) == [
+            "1.5",
+            "2",
+            "0",
+            "3.14",
+        ]
+        assert format_numbers(np.array([100, 20])) == ["100", "20"]
+        assert format_floats(np.array([166.0, 67.00000000000001])) == [
+            "166.0",
+            "67.00000000000001",
+        ]
+        assert format_floats(np.array([166, -3])) == ["166", "-3"]
+        assert stagger(3, 0.1) == ["0s", "0.1s", "0.2s"]
+
+    def test_scaled_count(self):
+        """La densité met les effectifs à l'échelle (au moins un élément)"""
+        assert scaled_count(20) == 20
+        assert scaled_count(20, 50) == 1000
+        assert scaled_count(20, 0.01) == 1
+        with pytest.raises(ValueError):
+            scaled_count(20, 0)
+
+
+class TestBuilderDensity:
+    """Les couches des builders suivent la densité demandée"""
+
+    def test_ultra_max_layers(self):
+        """Particules et rayons ULTRA-MAX mis à l'échelle"""
+        builder = UltraMaxSVGBuilder(LogoVariants())
+        variant = builder.variants_manager.get_variant("power")
+        drawing = builder.create_drawing(2000)
+        baseline = len(drawing.elements)
+        builder.add_ultra_max_particles(drawing, variant, 2000, density=50)
+        builder.add_ultra_max_rays(drawing, variant, 2000, density=10)
+        assert len(drawing.elements) == baseline + 1000 + 120
+
+    def test_ultimate_particles_and_paths(self):
+        """Particules et arcs neuronaux ULTIMES mis à l'échelle"""
+        builder = UltimateSVGBuilder(LogoVariants())
+        variant = builder.variants_manager.get_variant("mystery")
+        drawing = builder.create_drawing(2000)
+        baseline = len(drawing.elements)
+        builder.add_ultimate_cosmic_particles(drawing, variant, 2000, density=5)
+        assert len(drawing.elements) == baseline + 100
+        assert len(builder._generate_cosmic_neural_paths(1000, 2000, density=4)) == (
+            5 + 48
+        )
+
+    @pytest.mark.parametrize("builder_class", ALL_BUILDERS)
+    def test_density_changes_element_count(self, builder_class):
+        """Chaque builder ajoute des éléments quand la densité augmente"""
+        builder = builder_class(LogoVariants())
+        counts = [
+            builder.with_density(density).render_logo("power", 200).count("<")
+            for density in (1, 2)
+        ]
+        assert counts[1] > counts[0]
+
+    @pytest.mark.parametrize(
+        "builder_class, digest",
+        [
+            (
+                AdvancedSVGBuilder,
+                "b651ef002b068b685cbc82cbbd0570534207f79b2348828d0a26a8e77c14d735",
+            ),
+            (
+                SimpleAdvancedSVGBuilder,
+                "c38a25da9ac6ad19be432de8d0fc07fc4023b5e97c7785108f89a04477573f1a",
+            ),
+        ],
+    )
+    def test_standard_density_keeps_baseline_output(self, builder_class, digest):
+        """Densité 1.0 : sortie identique octet par octet aux boucles d'origine"""
+        svg = builder_class(LogoVariants()).render_logo("serenity", 200)
+        assert "M150.0 100.0 Q100 100 135.35533905932738 135.35533905932738" in svg
+        assert 'begin="0.6000000000000001s"' in svg
+        assert hashlib.sha256(svg.encode("utf-8")).hexdigest() == digest
+
+
+@pytest.mark.parametrize("builder_class", ALL_BUILDERS)
+class TestPreDensityParity:
+    """Densité 1.0 : chaque builder reproduit la sortie d'avant la série"""
+
+    @pytest.mark.parametrize("variant_name", LogoVariants().list_variants())
+    def test_matches_stored_digests(self, builder_class, variant_name):
+        """Empreintes identiques à celles du rendu par boucles scalaires"""
+        builder = builder_class(LogoVariants())
+        expected = PRE_DENSITY_DIGESTS[builder_class.__name__][variant_name]
+        for size, digest in expected.items():
+            svg = builder.render_logo(variant_name, int(size))
+            assert hashlib.sha256(svg.encode("utf-8")).hexdigest() == digest
+
+
+class TestGeneratorDensity:
+    """La densité et la complexité des générateurs pilotent les builders"""
+
+    def test_set_density(self):
+        """La densité du générateur est reportée sur son builder"""
+        generator = ArkaliaLunaLogo()
+        generator.set_density(3)
+        assert generator.svg_builder.density == 3
+        with pytest.raises(ValueError):
+            generator.set_density(0)
+
+    def test_complexity_scales_density(self):
+        """Les niveaux de complexité existants modulent la densité"""
+        ultimate = UltimateLogoGenerator()
+        assert ultimate.effective_density() == 1.0
+        ultimate.set_cosmic_complexity(0.49)
+        assert ultimate.svg_builder.density == pytest.approx(0.5)
+        simple = SimpleAdvancedLogoGenerator()
+        simple.set_density(2)
+        simple.set_complexity_level(0.35)
+        assert simple.svg_builder.density == pytest.approx(1.0)
+
+    def test_render_density_override(self):
+        """Un rendu à densité explicite ne modifie pas le générateur"""
+        generator = UltimateLogoGenerator()
+        standard = generator.render_svg_logo("serenity", 200)
+        dense = generator.render_svg_logo("serenity", 200, density=4)
+        assert dense.count(b"<circle") > standard.count(b"<circle")
+        assert generator.render_svg_logo("serenity", 200) == standard
+        assert generator.svg_builder.density == 1.0
@@ -0,0 +1,219 @@
+"""
+🧪 Tests du registre de métriques Prometheus thread-safe
+"""
+
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+from src.metrics import (
+    MmapedDict,
+    MultiProcessValueStore,
+    PrometheusMetrics,
+    ShardedValueStore,
+    _process_start_time,
+)
+
+
+def _record_requests(directory, count):
+    """Worker factice : enregistre des requêtes dans son propre fichier"""
+    metrics = PrometheusMetrics(store=MultiProcessValueStore(directory))
+    for _ in range(count):
+        metrics.increment_request(route="/generate")
+    metrics.increment_logo_generation(0.5, variant="power", generator="ultimate")
+
+
+class TestShardedValueStore:
+    """Tests du stockage shardé par thread"""
+
+    def test_concurrent_increments_are_not_lost(self):
+        """Aucun incrément n'est perdu entre threads concurrents"""
+        store = ShardedValueStore()
+        key = ("requests_total", "")
+
+        def worker():
+            for _ in range(5000):
+                store.inc(key)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        counters, _ = store.snapshot()
+        assert counters[key] == 40000
+
+    def test_dead_thread_shards_are_retired(self):
+        """Les shards des threads terminés sont fusionnés sans perte"""
+        store = ShardedValueStore()
+        thread = threading.Thread(target=store.inc, args=(("errors_total", ""), 3))
+        thread.start()
+        thread.join()
+        version = store.version()
+
+        counters, _ = store.snapshot()
+        assert counters[("errors_total", "")] == 3
+        assert store._shards == []
+        assert store.version() == version
+
+    def test_latest_value_wins(self):
+        """Une jauge conserve la dernière valeur écrite, tous threads confondus"""
+        store = ShardedValueStore()
+        key = ("last_generation_duration_seconds", "")
+        thread = threading.Thread(target=store.set_latest, args=(key, 1.5))
+        thread.start()
+        thread.join()
+        store.set_latest(key, 0.25)
+        _, latest = store.snapshot()
+        assert latest[key][1] == 0.25
+
+
+class TestPrometheusMetrics:
+    """Tests de l'exposition Prometheus"""
+
+    def test_exposition_format(self):
+        """Le texte d'exposition conserve les familles historiques"""
+        metrics = PrometheusMetrics()
+        metrics.increment_request(route="/generate")
+        metrics.record_response_status("/generate", 200)
+        metrics.increment_logo_generation(0.03, variant="power", generator="ultimate")
+        metrics.observe_generation_duration(0.03)
+        metrics.increment_cache_hit(generator="ultimate")
+
+        text = metrics.get_metrics()
+        assert "arkalia_luna_requests_total 1\n" in text
+        assert 'arkalia_luna_requests_total{route="/generate"} 1' in text
+        assert (
+            'arkalia_luna_responses_total{route="/generate",status_code="200"} 1'
+            in text
+        )
+        assert (
+            "arkalia_luna_logo_generations_total{variant=power,generator=ultimate} 1"
+            in text
+        )
+        assert 'arkalia_luna_generation_duration_seconds_bucket{le="0.02"} 0' in text
+        assert 'arkalia_luna_generation_duration_seconds_bucket{le="0.05"} 1' in text
+        assert 'arkalia_luna_generation_duration_seconds_bucket{le="+Inf"} 1' in text
+        assert "arkalia_luna_last_generation_duration_seconds 0.03" in text
+        assert 'arkalia_luna_render_cache_hits_total{generator="ultimate"} 1' in text
+
+    def test_export_eviction_metrics(self):
+        """Les évictions d'exports sont comptées par motif"""
+        metrics = PrometheusMetrics()
+        metrics.increment_export_evictions(age=2, budget=0, freed=300)
+        metrics.increment_export_evictions(age=1, budget=3, freed=700)
+        metrics.set_export_usage(files=4, size=2048)
+
+        text = metrics.get_metrics()
+        assert 'arkalia_luna_export_evictions_total{reason="age"} 3' in text
+        assert 'arkalia_luna_export_evictions_total{reason="budget"} 3' in text
+        assert "arkalia_luna_export_evicted_bytes_total 1000" in text
+        assert "arkalia_luna_export_files 4" in text
+        assert "arkalia_luna_export_bytes 2048" in text
+
+    def test_exposition_is_cached_until_change(self, monkeypatch):
+        """Le corps n'est reconstruit que si un compteur a changé"""
+        metrics = PrometheusMetrics()
+        metrics.increment_error()
+        renders = []
+        original = metrics._render_body
+
+        def counting_render():
+            renders.append(1)
+            return original()
+
+        monkeypatch.setattr(metrics, "_render_body", counting_render)
+        first = metrics.get_metrics()
+        second = metrics.get_metrics()
+        assert len(renders) == 1
+        # Seule la ligne d'uptime varie entre deux scrapes
+        assert first.split("\n", 3)[3] == second.split("\n", 3)[3]
+
+        metrics.increment_error()
+        assert "arkalia_luna_errors_total 2" in metrics.get_metrics()
+        assert len(renders) == 2
+
+
+class TestMmapedDict:
+    """Tests du fichier mmap clé → valeur"""
+
+    def test_persist_and_reload(self, tmp_path):
+        """Les valeurs survivent à la réouverture et au redimensionnement"""
+        path = tmp_path / "metrics_1.db"
+        mmaped = MmapedDict(path)
+        for i in range(3000):
+            mmaped.write_value(f"key-{i}", float(i), 1.0)
+        mmaped.write_value("key-7", 42.0)
+        mmaped.close()
+
+        reloaded = MmapedDict(path)
+        assert reloaded.read_value("key-7") == (42.0, 0.0)
+        assert reloaded.read_value("key-2999") == (2999.0, 1.0)
+        assert len(list(reloaded.items())) == 3000
+        reloaded.close()
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="fork requis"
+)
+class TestMultiProcessValueStore:
+    """Tests de l'agrégation multi-workers"""
+
+    def test_workers_are_merged_and_dead_files_archived(self, tmp_path):
+        """/metrics agrège tous les workers, y compris ceux déjà terminés"""
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_record_requests, args=(str(tmp_path), 10))
+            for _ in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        metrics = PrometheusMetrics(store=MultiProcessValueStore(tmp_path))
+        metrics.increment_request(route="/metrics")
+        text = metrics.get_metrics()
+
+        assert "arkalia_luna_requests_total 31\n" in text
+        assert 'arkalia_luna_requests_total{route="/generate"} 30' in text
+        assert "arkalia_luna_logo_generations_total 3\n" in text
+        assert "arkalia_luna_last_generation_duration_seconds 0.5" in text
+
+        # Les fichiers des workers morts ont été archivés puis supprimés
+        remaining = {p.name for p in tmp_path.glob("metrics_*.db")}
+        assert remaining == {"metrics_archive.db", f"metrics_{os.getpid()}.db"}
+        assert "arkalia_luna_requests_total 31\n" in metrics.get_metrics()
+
+    def test_exposition_rebuilt_on_other_worker_write(self, tmp_path):
+        """Une écriture d'un autre worker invalide le cache d'exposition"""
+        metrics = PrometheusMetrics(store=MultiProcessValueStore(tmp_path))
+        assert "arkalia_luna_requests_total 0\n" in metrics.get_metrics()
+
+        context = multiprocessing.get_context("fork")
+        worker = context.Process(target=_record_requests, args=(str(tmp_path), 2))
+        worker.start()
+        worker.join()
+        assert "arkalia_luna_requests_total 2\n" in metrics.get_metrics()
+
+    @pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="/proc requis")
+    def test_reused_pid_is_collected(self, tmp_path):
+        """Un fichier dont le PID a été réattribué est archivé comme un mort"""
+        ppid = os.getppid()
+        stale = MmapedDict(tmp_path / f"metrics_{ppid}.db", start_time=1.0)
+        stale.write_value('["counter", "arkalia_luna_requests_total", []]', 4)
+        stale.close()
+
+        store = MultiProcessValueStore(tmp_path)
+        assert store.collect_dead_workers() == 1
+        assert not (tmp_path / f"metrics_{ppid}.db").exists()
+
+        live = MmapedDict(
+            tmp_path / f"metrics_{ppid}.db", start_time=_process_start_time(ppid)
+        )
+        live.close()
+        assert store.collect_dead_workers() == 0
+        assert (tmp_path / f"metrics_{ppid}.db").exists()
@@ -0,0 +1,137 @@
+"""
+🧪 Tests de l'export du pack en ZIP diffusé en flux
+"""
+
+import asyncio
+import io
+import json
+import threading
+import zipfile
+
+import pytest
+
+from src.pack import (
+    ZipStream,
+    iter_pack_entries,
+    iter_pack_entries_async,
+    pack_matrix,
+    stream_zip,
+    stream_zip_async,
+)
+
+
+def fake_render(generator_type, variant, size):
+    """Rendu factice : échoue pour la variante « broken »"""
+    if variant == "broken":
+        raise ValueError("Variante 'broken' non reconnue")
+    return f"<svg>{generator_type}-{variant}-{size}</svg>".encode() * 50
+
+
+class TestStreamZip:
+    """Tests du ZIP produit morceau par morceau"""
+
+    @pytest.mark.parametrize("compression", ["deflated", "stored"])
+    def test_round_trip(self, compression):
+        """L'archive diffusée est un ZIP valide avec le contenu d'origine"""
+        entries = [("a/one.svg", b"<svg>1</svg>"), ("b/two.svg", b"<svg>2</svg>")]
+        data = b"".join(stream_zip(entries, compression))
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert archive.testzip() is None
+            assert archive.read("a/one.svg") == b"<svg>1</svg>"
+            expected = zipfile.ZIP_STORED if compression == "stored" else 8
+            assert archive.getinfo("b/two.svg").compress_type == expected
+
+    def test_one_chunk_per_entry(self):
+        """Chaque entrée est émise dès qu'elle est écrite"""
+        consumed = []
+
+        def entries():
+            for index in range(3):
+                consumed.append(index)
+                yield f"{index}.svg", b"x" * 1000
+
+        stream = stream_zip(entries())
+        next(stream)
+        assert consumed == [0]
+        assert len(list(stream)) == 3  # deux entrées + répertoire central
+
+    def test_reproducible(self):
+        """Une même matrice produit les mêmes octets"""
+        matrix = pack_matrix(["default"], ["serenity", "power"], [50])
+        first = b"".join(stream_zip(iter_pack_entries(matrix, fake_render)))
+        second = b"".join(stream_zip(iter_pack_entries(matrix, fake_render)))
+        assert first == second
+
+    def test_async_stream_matches_sync(self):
+        """Le flux asynchrone produit les mêmes octets que le flux synchrone"""
+        matrix = pack_matrix(["default"], ["serenity", "broken", "power"], [50])
+
+        async def async_render(generator_type, variant, size):
+            await asyncio.sleep(0)
+            return fake_render(generator_type, variant, size)
+
+        async def collect():
+            entries = iter_pack_entries_async(matrix, async_render)
+            return b"".join([chunk async for chunk in stream_zip_async(entries)])
+
+        expected = b"".join(stream_zip(iter_pack_entries(matrix, fake_render)))
+        assert asyncio.run(collect()) == expected
+
+    def test_async_stream_compresses_off_the_loop(self, monkeypatch):
+        """La compression ne s'exécute pas dans le thread de la boucle"""
+        threads = set()
+        write, close = ZipStream.write, ZipStream.close
+
+        def tracked_write(self, name, content):
+            threads.add(threading.get_ident())
+            return write(self, name, content)
+
+        def tracked_close(self):
+            threads.add(threading.get_ident())
+            return close(self)
+
+        monkeypatch.setattr(ZipStream, "write", tracked_write)
+        monkeypatch.setattr(ZipStream, "close", tracked_close)
+        matrix = pack_matrix(["default"], ["serenity", "power"], [50])
+
+        async def async_render(generator_type, variant, size):
+            return fake_render(generator_type, variant, size)
+
+        async def collect():
+            entries = iter_pack_entries_async(matrix, async_render)
+            chunks = [chunk async for chunk in stream_zip_async(entries)]
+            return b"".join(chunks), threading.get_ident()
+
+        data, loop_thread = asyncio.run(collect())
+        assert zipfile.ZipFile(io.BytesIO(data)).testzip() is None
+        assert threads and loop_thread not in threads
+
+    def test_unknown_compression(self):
+        """Une méthode de compression inconnue est refusée"""
+        with pytest.raises(ValueError):
+            list(stream_zip([], "bzip2"))
+
+
+class TestPackEntries:
+    """Tests de la matrice et du manifeste"""
+
+    def test_matrix_dedupes(self):
+        """Les doublons de la matrice sont ignorés"""
+        matrix = pack_matrix(["default", "default"], ["serenity"], [50, 50, 100])
+        assert matrix == [("default", "serenity", 50), ("default", "serenity", 100)]
+
+    def test_manifest_records_failures(self):
+        """Un rendu en échec est consigné sans interrompre le pack"""
+        reported = []
+        matrix = pack_matrix(["default"], ["serenity", "broken", "power"], [50])
+        entries = list(iter_pack_entries(matrix, fake_render, on_item=reported.append))
+        names = [name for name, _ in entries]
+        assert names == [
+            "default/arkalia-luna-serenity-50.svg",
+            "default/arkalia-luna-power-50.svg",
+            "manifest.json",
+        ]
+        manifest = json.loads(entries[-1][1])
+        assert [item["success"] for item in manifest["items"]] == [True, False, True]
+        assert "broken" in manifest["items"][1]["error"]
+        assert len(reported) == 3
@@ -0,0 +1,92 @@
+"""
+🧪 Tests de la rastérisation PNG et de son cache
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src import raster_renderer
+from src.raster_renderer import RasterRenderer, rasterize_svg
+from src.render_cache import RenderedSVG
+from src.render_pool import RenderPool
+
+SVG = RenderedSVG.from_content(
+    '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">'
+    '<rect width="10" height="10" fill="#1e3a8a"/></svg>'
+)
+
+
+class _CountingBackend:
+    """Moteur de rastérisation factice comptant ses appels"""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, svg: bytes, width: int, height: int) -> bytes:
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.05)
+        return f"{width}x{height}:".encode() + svg
+
+
+class TestRasterRenderer:
+    """Tests du RasterRenderer"""
+
+    def test_dimensions(self):
+        """Taille × échelle, bornée par le côté maximal"""
+        renderer = RasterRenderer(RenderPool(), max_dimension=1000)
+        assert renderer.dimensions(200) == (200, 200)
+        assert renderer.dimensions(200, 2.5) == (500, 500)
+        assert renderer.dimensions(50, 0.001) == (1, 1)
+        with pytest.raises(ValueError):
+            renderer.dimensions(500, 3)
+        with pytest.raises(ValueError):
+            renderer.dimensions(200, 0)
+
+    def test_cache_and_coalescing(self):
+        """Un même SVG à une même résolution n'est rastérisé qu'une fois"""
+        backend = _CountingBackend()
+        pool = RenderPool(max_workers=4, max_queue=8)
+        renderer = RasterRenderer(pool, backend=backend)
+
+        async def scenario():
+            pool.start()
+            images = await asyncio.gather(
+                *(renderer.render(SVG, 20, 20) for _ in range(3))
+            )
+            cached = await renderer.render(SVG, 20, 20)
+            larger = await renderer.render(SVG, 40, 40)
+            return images, cached, larger
+
+        try:
+            images, cached, larger = asyncio.run(scenario())
+        finally:
+            pool.shutdown()
+        assert backend.calls == 2
+        assert all(image is cached for image in images)
+        assert cached.content.startswith(b"20x20:")
+        assert (larger.width, larger.height) == (40, 40)
+        stats = renderer.get_stats()
+        assert stats["rasterized"] == 2
+        assert stats["coalesced"] == 2
+        assert stats["cache"]["hits"] == 1
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.skipif(raster_renderer.cairosvg is None, reason="cairosvg absent")
+    def test_cairosvg_png(self):
+        """Le moteur par défaut produit un PNG aux dimensions demandées"""
+        png = rasterize_svg(SVG.content, 32, 16)
+        assert png.startswith(b"\x89PNG\r\n\x1a\n")
+        assert int.from_bytes(png[16:20], "big") == 32
+        assert int.from_bytes(png[20:24], "big") == 16
+
+    @pytest.mark.skipif(raster_renderer.cairosvg is None, reason="cairosvg absent")
+    def test_cairosvg_multiple_sizes(self):
+        """Une analyse, un PNG par côté demandé"""
+        images = raster_renderer.rasterize_svg_sizes(SVG.content, [16, 64, 16])
+        assert sorted(images) == [16, 64]
+        assert int.from_bytes(images[64][16:20], "big") == 64
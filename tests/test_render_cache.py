@@ -0,0 +1,72 @@
+"""
+🧪 Tests pour le cache de rendu SVG
+"""
+
+import pytest
+
+from src.render_cache import RenderCache, RenderedSVG
+
+
+class FakeClock:
+    """Horloge contrôlable pour les tests de TTL"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRenderedSVG:
+    """Tests du rendu adressé par contenu"""
+
+    def test_digest_is_content_addressed(self):
+        """Deux contenus identiques ont la même empreinte"""
+        first = RenderedSVG.from_content("<svg/>")
+        second = RenderedSVG.from_content(b"<svg/>")
+        assert first == second
+        assert len(first.digest) == 64
+        assert len(first) == 6
+
+
+class TestRenderCache:
+    """Tests du cache LRU/TTL"""
+
+    def test_invalid_size(self):
+        """Une taille nulle est refusée"""
+        with pytest.raises(ValueError):
+            RenderCache(max_size=0)
+
+    def test_hit_and_miss(self):
+        """Les accès sont comptabilisés"""
+        cache = RenderCache(max_size=4)
+        key = ("ultimate", "serenity", 200)
+        assert cache.get(key) is None
+        cache.put(key, RenderedSVG.from_content("<svg/>"))
+        assert cache.get(key).content == b"<svg/>"
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["bytes"] == 6
+
+    def test_lru_eviction(self):
+        """L'entrée la moins récemment utilisée est évincée"""
+        cache = RenderCache(max_size=2)
+        cache.put("a", RenderedSVG.from_content("a"))
+        cache.put("b", RenderedSVG.from_content("b"))
+        cache.get("a")
+        cache.put("c", RenderedSVG.from_content("c"))
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.evictions == 1
+
+    def test_ttl_expiration(self):
+        """Une entrée expirée n'est plus servie"""
+        clock = FakeClock()
+        cache = RenderCache(max_size=2, ttl=10, clock=clock)
+        cache.put("a", RenderedSVG.from_content("a"))
+        clock.now = 9
+        assert cache.get("a") is not None
+        clock.now = 11
+        assert cache.get("a") is None
+        assert len(cache) == 0
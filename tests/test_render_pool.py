@@ -0,0 +1,93 @@
+"""
+🧪 Tests pour le pool de rendu borné
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.render_pool import RenderPool, RenderPoolSaturatedError
+
+
+def _slow_identity(value, delay=0.05):
+    """Fonction de rendu factice"""
+    time.sleep(delay)
+    return value
+
+
+class TestRenderPool:
+    """Tests du pool de rendu"""
+
+    def test_invalid_mode(self):
+        """Un mode inconnu est refusé"""
+        with pytest.raises(ValueError):
+            RenderPool(mode="fiber")
+
+    def test_run_off_event_loop(self):
+        """Le rendu s'exécute dans un thread du pool"""
+        pool = RenderPool(max_workers=2, max_queue=4)
+
+        async def scenario():
+            pool.start()
+            return await pool.run("simple", threading.current_thread)
+
+        try:
+            thread = asyncio.run(scenario())
+            assert thread is not threading.main_thread()
+            assert thread.name.startswith("render")
+        finally:
+            pool.shutdown()
+
+    def test_back_pressure_when_queue_full(self):
+        """Au-delà de max_queue, le pool lève une erreur de saturation"""
+        pool = RenderPool(max_workers=1, max_queue=2, retry_after=7)
+
+        async def scenario():
+            pool.start()
+            tasks = [
+                asyncio.ensure_future(pool.run("ultimate", _slow_identity, i, 0.2))
+                for i in range(2)
+            ]
+            await asyncio.sleep(0.01)
+            with pytest.raises(RenderPoolSaturatedError) as exc_info:
+                await pool.run("ultimate", _slow_identity, 99)
+            return exc_info.value, await asyncio.gather(*tasks)
+
+        try:
+            error, results = asyncio.run(scenario())
+            assert error.retry_after == 7
+            assert results == [0, 1]
+            stats = pool.get_stats()
+            assert stats["rejected"] == 1
+            assert stats["pending"] == 0
+        finally:
+            pool.shutdown()
+
+    def test_per_generator_limit(self):
+        """La limite par type de générateur borne la concurrence"""
+        pool = RenderPool(max_workers=4, max_queue=16, generator_limits={"ultimate": 1})
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def tracked():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+        async def scenario():
+            pool.start()
+            await asyncio.gather(*(pool.run("ultimate", tracked) for _ in range(4)))
+
+        try:
+            asyncio.run(scenario())
+            assert max(peak) == 1
+            assert pool.get_limit("ultimate") == 1
+            assert pool.get_limit("simple") == 4
+        finally:
+            pool.shutdown()
@@ -0,0 +1,165 @@
+"""
+🧪 Tests de l'optimisation et de la pré-compression des SVG
+"""
+
+import gzip
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from src.svg_builder_dashboard import DashboardSVGBuilder
+from src.svg_builder_ultimate import UltimateSVGBuilder
+from src.svg_optimizer import (
+    SVG_NS,
+    SVGOptimizer,
+    compress,
+    negotiate_encoding,
+    precompressed_path,
+    remove_unused_defs,
+)
+from src.variants import LogoVariants
+
+SAMPLE = """<?xml version="1.0" encoding="utf-8" ?>
+<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">
+  <defs>
+    <linearGradient id="used"><stop offset="0.123456" /></linearGradient>
+    <linearGradient id="base" />
+    <linearGradient id="derived" xlink:href="#base" />
+    <filter id="orphan" />
+  </defs>
+  <circle cx="10.123456" cy="-0.00001" r="2.5000" fill="url(#used)" />
+  <rect x="1" y="1" width="2" height="2" fill="url(#derived)" />
+  <circle cx="1" cy="1" r="1" fill="#ffffff" stroke="#000000" />
+  <circle cx="2" cy="2" r="1" fill="#ffffff" stroke="#000000" />
+  <circle cx="3" cy="3" r="1" fill="#ffffff" stroke="#000000" />
+</svg>
+"""
+
+
+def _ids(svg):
+    return {el.get("id") for el in ET.fromstring(svg.encode()).iter() if el.get("id")}
+
+
+class TestSVGOptimizer:
+    """Tests des niveaux d'optimisation"""
+
+    def test_level_zero_is_identity(self):
+        """Le niveau 0 ne modifie pas le document"""
+        assert SVGOptimizer(0).optimize(SAMPLE) == SAMPLE
+
+    def test_invalid_level(self):
+        """Un niveau hors de 0-3 est refusé"""
+        with pytest.raises(ValueError):
+            SVGOptimizer(4)
+
+    def test_whitespace_stripping(self):
+        """Le niveau 1 supprime l'indentation sans toucher aux valeurs"""
+        optimized = SVGOptimizer(1).optimize(SAMPLE)
+        assert "\n  " not in optimized
+        assert 'cx="10.123456"' in optimized
+        assert optimized.startswith('<?xml version="1.0" encoding="utf-8" ?>')
+
+    def test_precision_and_unused_defs(self):
+        """Le niveau 2 arrondit les nombres et supprime les defs orphelines"""
+        optimized = SVGOptimizer(2).optimize(SAMPLE)
+        assert 'cx="10.123"' in optimized
+        assert 'cy="0"' in optimized
+        assert 'r="2.5"' in optimized
+        assert 'offset="0.123"' in optimized
+        assert _ids(optimized) == {"used", "base", "derived"}
+
+    def test_unused_defs_chains_and_cycles(self):
+        """Les chaînes orphelines et les auto-références disparaissent"""
+        svg = (
+            f'<svg xmlns="{SVG_NS}"><defs>'
+            '<g id="a" fill="url(#b)" /><g id="b" fill="url(#c)" /><g id="c" />'
+            '<g id="self" fill="url(#self)" />'
+            '<g id="kept"><use href="#inner" /></g><g id="inner" />'
+            '</defs><rect fill="url(#kept)" /></svg>'
+        )
+        root = ET.fromstring(svg)
+        assert remove_unused_defs(root) == 4
+        assert {el.get("id") for el in root.iter() if el.get("id")} == {
+            "kept",
+            "inner",
+        }
+
+    def test_unused_defs_long_chain(self):
+        """Une longue chaîne de defs est retirée en un seul parcours"""
+        chain = "".join(f'<g id="d{i}" fill="url(#d{i + 1})" />' for i in range(500))
+        root = ET.fromstring(f'<svg xmlns="{SVG_NS}"><defs>{chain}</defs></svg>')
+        assert remove_unused_defs(root) == 500
+
+    def test_group_level_attributes(self):
+        """Le niveau 3 regroupe les attributs hérités répétés"""
+        optimized = SVGOptimizer(3).optimize(SAMPLE)
+        root = ET.fromstring(optimized.encode())
+        groups = root.findall(f"{{{SVG_NS}}}g")
+        assert len(groups) == 1
+        assert groups[0].get("fill") == "#ffffff"
+        assert groups[0].get("stroke") == "#000000"
+        assert all(c.get("fill") is None for c in groups[0])
+        assert len(optimized) < len(SVGOptimizer(2).optimize(SAMPLE))
+
+    @pytest.mark.parametrize("builder_class", [DashboardSVGBuilder, UltimateSVGBuilder])
+    def test_real_logos_shrink_and_keep_references(self, builder_class):
+        """Les logos optimisés restent valides et bien plus légers"""
+        svg = builder_class(LogoVariants()).render_logo("power", 200)
+        optimized = SVGOptimizer(3).optimize(svg)
+        root = ET.fromstring(optimized.encode())
+        ids = _ids(optimized)
+        for element in root.iter():
+            for value in element.attrib.values():
+                if value.startswith("url(#"):
+                    assert value[5:-1] in ids
+        assert len(optimized) < 0.8 * len(svg)
+
+    def test_from_config(self):
+        """Les réglages SVG_* de la configuration sont respectés"""
+        optimizer = SVGOptimizer.from_config(
+            {"compression": True, "minification": False, "optimization_level": 3}
+        )
+        assert optimizer.level == 0
+        assert "gzip" in optimizer.encodings
+
+
+class TestPrecompression:
+    """Tests de la pré-compression"""
+
+    def test_gzip_is_reproducible(self):
+        """La compression gzip est déterministe (ETag stable)"""
+        data = SAMPLE.encode()
+        assert compress(data, "gzip") == compress(data, "gzip")
+        assert gzip.decompress(compress(data, "gzip")) == data
+
+    def test_write_precompressed(self, tmp_path):
+        """Les variantes .svgz sont écrites à côté du SVG"""
+        path = tmp_path / "logo.svg"
+        written = SVGOptimizer(1, compress=True).write_precompressed(path, b"<svg/>")
+        assert tmp_path / "logo.svgz" in written
+        assert gzip.decompress((tmp_path / "logo.svgz").read_bytes()) == b"<svg/>"
+        assert precompressed_path(path, "br").name == "logo.svg.br"
+
+    def test_negotiate_encoding(self):
+        """La négociation respecte l'ordre de préférence et q=0"""
+        assert negotiate_encoding("gzip, deflate, br", ["br", "gzip"]) == "br"
+        assert negotiate_encoding("gzip;q=1.0", ["br", "gzip"]) == "gzip"
+        assert negotiate_encoding("gzip;q=0", ["gzip"]) is None
+        assert negotiate_encoding("br;q=0.0, gzip", ["br", "gzip"]) == "gzip"
+        assert negotiate_encoding("gzip; q=0.00", ["gzip"]) is None
+        assert negotiate_encoding("gzip;q=0 ", ["gzip"]) is None
+        assert negotiate_encoding("gzip;q=abc", ["gzip"]) is None
+        assert negotiate_encoding("br;q=0.5", ["br"]) == "br"
+        assert negotiate_encoding("", ["gzip"]) is None
+
+    def test_save_logo_with_optimizer(self, tmp_path):
+        """save_logo applique l'optimiseur et pré-compresse"""
+        builder = DashboardSVGBuilder(LogoVariants())
+        builder.optimizer = SVGOptimizer(3, compress=True)
+        path = tmp_path / "dashboard.svg"
+        builder.save_logo("mystery", 100, path)
+        content = path.read_text(encoding="utf-8")
+        assert "\n  " not in content
+        assert gzip.decompress((tmp_path / "dashboard.svgz").read_bytes()) == (
+            content.encode("utf-8")
+        )
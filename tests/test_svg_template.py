@@ -0,0 +1,250 @@
+"""
+🧪 Tests de parité du moteur de rendu compilé (gabarits SVG)
+"""
+
+import dataclasses
+
+import pytest
+
+from src.logo_generator import ArkaliaLunaLogo
+from src.svg_builder import SVGBuilder
+from src.svg_builder_advanced import AdvancedSVGBuilder
+from src.svg_builder_ai_moon import AIMoonSVGBuilder
+from src.svg_builder_dashboard import DashboardSVGBuilder
+from src.svg_builder_realism_max import RealismMaxSVGBuilder
+from src.svg_builder_simple_advanced import SimpleAdvancedSVGBuilder
+from src.svg_builder_ultimate import UltimateSVGBuilder
+from src.svg_builder_ultra_max import UltraMaxSVGBuilder
+from src.svg_optimizer import SVGOptimizer
+from src.svg_template import (
+    TemplateEngine,
+    compile_template,
+    render_variant,
+    template_engine,
+)
+from src.variants import ColorScheme, LogoVariants
+
+ALL_BUILDERS = [
+    AdvancedSVGBuilder,
+    AIMoonSVGBuilder,
+    DashboardSVGBuilder,
+    RealismMaxSVGBuilder,
+    SimpleAdvancedSVGBuilder,
+    UltimateSVGBuilder,
+    UltraMaxSVGBuilder,
+]
+VARIANTS = LogoVariants().list_variants()
+
+
+class ComparingSVGBuilder(SVGBuilder):
+    """Builder dont la structure dépend de la valeur de glow_intensity"""
+
+    def build_logo(self, variant_name, size):
+        variant = self.variants_manager.get_variant(variant_name)
+        drawing = self.create_drawing(size)
+        if variant.glow_intensity > 0.8:
+            drawing.add(drawing.circle(center=(1, 1), r=1))
+        return drawing
+
+
+@pytest.mark.parametrize("builder_class", ALL_BUILDERS)
+class TestTemplateParity:
+    """Le chemin compilé produit exactement la sortie svgwrite"""
+
+    @pytest.mark.parametrize("variant_name", VARIANTS)
+    @pytest.mark.parametrize("size", [64, 200])
+    def test_compiled_matches_svgwrite(self, builder_class, variant_name, size):
+        """Parité octet par octet pour chaque variante et taille"""
+        builder = builder_class(LogoVariants())
+        expected = builder.render_logo(variant_name, size)
+        assert builder.render_compiled(variant_name, size) == expected
+        # Deuxième rendu : servi par le gabarit en cache
+        assert builder.render_compiled(variant_name, size) == expected
+
+    def test_compiled_matches_custom_parameters(self, builder_class):
+        """Parité pour des couleurs et timings hors des variantes prédéfinies"""
+        builder = builder_class(LogoVariants())
+        base = builder.variants_manager.get_variant("power")
+        custom = dataclasses.replace(
+            base,
+            colors=ColorScheme("#101010", "#202020", "#303030", "#404040"),
+            animation_speed=0.37,
+            glow_intensity=0.42,
+        )
+        engine = TemplateEngine()
+        assert engine.render(builder, custom, 120) == render_variant(
+            builder, custom, 120
+        )
+        assert engine.get_stats()["compiled"] == 1
+
+
+class TestTemplateEngine:
+    """Tests du moteur de gabarits"""
+
+    def test_template_has_parameter_slots(self):
+        """Les couleurs et les timings deviennent des emplacements"""
+        builder = DashboardSVGBuilder(LogoVariants())
+        variant = builder.variants_manager.get_variant("serenity")
+        template = compile_template(builder, variant, 100)
+        assert template is not None
+        assert "primary" in template.slots
+        assert template.slot_count > 4
+        assert variant.colors.primary not in "".join(template.literals)
+
+    def test_value_dependent_structure_falls_back(self):
+        """Une structure dépendant des paramètres n'est pas compilée"""
+        builder = ComparingSVGBuilder(LogoVariants())
+        engine = TemplateEngine()
+        for variant_name in ("serenity", "creative"):
+            variant = builder.variants_manager.get_variant(variant_name)
+            assert compile_template(builder, variant, 50) is None
+            assert engine.render(builder, variant, 50) == builder.render_logo(
+                variant_name, 50
+            )
+        assert engine.get_stats() == {"templates": 2, "compiled": 0, "fallbacks": 2}
+
+    def test_seed_is_part_of_the_key(self):
+        """Changer la graine du builder produit un autre gabarit"""
+        builder = UltimateSVGBuilder(LogoVariants())
+        reference = builder.render_compiled("mystery", 100)
+        builder.seed = 7
+        assert builder.render_compiled("mystery", 100) != reference
+        assert builder.render_compiled("mystery", 100) == builder.render_logo(
+            "mystery", 100
+        )
+
+    def test_unknown_variant(self):
+        """Une variante inconnue est refusée"""
+        builder = DashboardSVGBuilder(LogoVariants())
+        with pytest.raises(ValueError):
+            builder.render_compiled("inexistante", 100)
+
+    def test_shared_engine_is_populated(self):
+        """Le moteur partagé mémorise les gabarits compilés"""
+        builder = RealismMaxSVGBuilder(LogoVariants())
+        builder.render_compiled("awakening", 80)
+        variant = builder.variants_manager.get_variant("awakening")
+        assert template_engine.get_template(builder, variant, 80) is not None
+
+    def test_template_cache_is_bounded(self):
+        """Les gabarits les moins récemment utilisés sont évincés (LRU)"""
+        builder = DashboardSVGBuilder(LogoVariants())
+        engine = TemplateEngine(max_templates=2)
+        variant = builder.variants_manager.get_variant("serenity")
+        first = engine.get_template(builder, variant, 40)
+        engine.get_template(builder, variant, 50)
+        assert engine.get_template(builder, variant, 40) is first
+        engine.get_template(builder, variant, 60)
+        assert len(engine) == 2
+        assert engine.get_template(builder, variant, 40) is first
+        assert engine.get_stats()["compiled"] == 3
+
+    def test_off_grid_density_is_not_compiled(self):
+        """Une densité arbitraire est rendue par svgwrite, sans gabarit stocké"""
+        builder = UltraMaxSVGBuilder(LogoVariants())
+        engine = TemplateEngine()
+        variant = builder.variants_manager.get_variant("power")
+        for density in (1.0001, 1.0002, 37.5):
+            dense = builder.with_density(density)
+            assert engine.render(dense, variant, 60) == dense.render_logo("power", 60)
+        assert len(engine) == 0
+        assert engine.get_template(builder.with_density(2), variant, 60) is not None
+        assert len(engine) == 1
+
+
+class TestColorSkeleton:
+    """Squelettes paramétrés par la palette"""
+
+    PALETTE = ColorScheme("#0a0b0c", "#1a1b1c", "#2a2b2c", "#3a3b3c")
+
+    @pytest.mark.parametrize("builder_class", ALL_BUILDERS)
+    def test_palette_matches_svgwrite(self, builder_class):
+        """Une palette arbitraire donne la sortie svgwrite de cette palette"""
+        builder = builder_class(LogoVariants())
+        base = builder.variants_manager.get_variant("creative")
+        expected = render_variant(
+            builder, dataclasses.replace(base, colors=self.PALETTE), 150
+        )
+        assert builder.render_palette("creative", self.PALETTE, 150) == expected
+
+    def test_skeleton_shared_by_palettes(self):
+        """Un seul squelette par (builder, variante, taille, paramètres)"""
+        builder = UltimateSVGBuilder(LogoVariants())
+        engine = TemplateEngine()
+        base = builder.variants_manager.get_variant("serenity")
+        skeleton = engine.get_skeleton(builder, base, 200)
+        assert "primary" in skeleton.fields
+        assert base.colors.primary not in "".join(skeleton.pieces)
+        custom = dataclasses.replace(base, colors=self.PALETTE)
+        assert engine.get_skeleton(builder, custom, 200) is skeleton
+        assert engine.render(builder, custom, 200) == skeleton.render(self.PALETTE)
+        assert engine.get_stats()["templates"] == 1
+
+    def test_skeleton_cache_is_bounded(self):
+        """Les squelettes liés à des paramètres arbitraires sont évincés (LRU)"""
+        builder = DashboardSVGBuilder(LogoVariants())
+        engine = TemplateEngine(max_skeletons=2)
+        base = builder.variants_manager.get_variant("power")
+        for speed in (0.5, 1.0, 1.5):
+            variant = dataclasses.replace(base, animation_speed=speed)
+            assert engine.render(builder, variant, 64) == render_variant(
+                builder, variant, 64
+            )
+        assert len(engine._skeletons) == 2
+        assert engine.get_stats()["templates"] == 1
+
+    def test_generator_renders_custom_palette(self, tmp_path):
+        """Le générateur accepte une palette à la place de celle de la variante"""
+        generator = ArkaliaLunaLogo(tmp_path)
+        svg = generator.render_svg_logo("power", 100, colors=self.PALETTE)
+        assert b"#3a3b3c" in svg
+        assert generator.get_variant_info("power")["colors"]["glow"].encode() not in svg
+
+
+class TestOptimizedSkeleton:
+    """Squelettes optimisés une fois, palette substituée à chaque rendu"""
+
+    PALETTE = ColorScheme("#0a0b0c", "#1a1b1c", "#2a2b2c", "#3a3b3c")
+
+    @pytest.mark.parametrize("builder_class", ALL_BUILDERS)
+    @pytest.mark.parametrize("level", [1, 2, 3])
+    def test_matches_full_optimization(self, builder_class, level):
+        """Sortie identique à ``optimizer.optimize`` sur le rendu svgwrite"""
+        builder = builder_class(LogoVariants())
+        optimizer = SVGOptimizer(level=level)
+        engine = TemplateEngine()
+        base = builder.variants_manager.get_variant("power")
+        for variant in (base, dataclasses.replace(base, colors=self.PALETTE)):
+            expected = optimizer.optimize(render_variant(builder, variant, 120))
+            assert engine.render(builder, variant, 120, optimizer) == expected
+
+    def test_hot_path_does_not_reoptimize(self, monkeypatch):
+        """Une fois le squelette optimisé, les rendus ne ré-optimisent plus"""
+        builder = UltimateSVGBuilder(LogoVariants())
+        optimizer = SVGOptimizer(level=3)
+        engine = TemplateEngine()
+        variant = builder.variants_manager.get_variant("mystery")
+        expected = engine.render(builder, variant, 200, optimizer)
+
+        def must_not_optimize(svg):
+            raise AssertionError("Le squelette optimisé aurait dû être utilisé")
+
+        monkeypatch.setattr(optimizer, "optimize", must_not_optimize)
+        custom = dataclasses.replace(variant, colors=self.PALETTE)
+        assert engine.render(builder, variant, 200, optimizer) == expected
+        assert b"#3a3b3c" in engine.render(builder, custom, 200, optimizer).encode()
+
+    def test_ambiguous_palette_falls_back(self):
+        """Deux couleurs identiques : l'optimisation complète est appliquée"""
+        builder = DashboardSVGBuilder(LogoVariants())
+        optimizer = SVGOptimizer(level=3)
+        engine = TemplateEngine()
+        base = builder.variants_manager.get_variant("serenity")
+        flat = dataclasses.replace(
+            base, colors=ColorScheme("#101010", "#101010", "#101010", "#101010")
+        )
+        skeleton = engine.get_optimized_skeleton(builder, flat, 90, optimizer)
+        assert skeleton.render(flat.colors) is None
+        assert engine.render(builder, flat, 90, optimizer) == optimizer.optimize(
+            render_variant(builder, flat, 90)
+        )
@@ -2,6 +2,9 @@
 🧪 Tests pour le module variants
 """
 
+import dataclasses
+import json
+import pickle
 import sys
 from pathlib import Path
 
@@ -10,7 +13,16 @@ import pytest
 # Ajout du chemin src pour les imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from variants import ColorScheme, LogoVariant, LogoVariants, VariantType
+from variants import (
+    ColorScheme,
+    CustomVariantRegistry,
+    LogoVariant,
+    LogoVariants,
+    VariantType,
+    custom_variants,
+    normalize_color,
+    variants_registry,
+)
 
 
 class TestColorScheme:
@@ -159,5 +171,116 @@ class TestLogoVariants:
         assert "glow_intensity" in variant_info
 
 
+class TestCustomVariants:
+    """Tests des variantes personnalisées internées"""
+
+    def test_normalize_color(self):
+        """Forme canonique #rrggbb, entrées invalides refusées"""
+        assert normalize_color("#ABC") == "#aabbcc"
+        assert normalize_color(" 1E3A8A ") == "#1e3a8a"
+        for invalid in ("#12", "blue", "#gggggg"):
+            with pytest.raises(ValueError):
+                normalize_color(invalid)
+
+    def test_equivalent_palettes_share_a_name(self):
+        """Deux écritures d'une même palette donnent la même spécification"""
+        variants_manager = LogoVariants()
+        first = variants_manager.custom_palette(
+            "power", {"primary": "#FFF"}, animation_speed=1.25
+        )
+        second = variants_manager.custom_palette(
+            "power", {"primary": "#ffffff", "glow": "#A855F7"}, 1.2500001
+        )
+        assert first == second
+        assert first.name.startswith("custom-")
+        assert (
+            first.glow_intensity == variants_manager.get_variant("power").glow_intensity
+        )
+        other = variants_manager.custom_palette("mystery", {"primary": "#fff"})
+        assert other.name != first.name
+
+    def test_custom_palette_validation(self):
+        """Base inconnue, couleur inconnue ou paramètres hors bornes"""
+        variants_manager = LogoVariants()
+        with pytest.raises(ValueError):
+            variants_manager.custom_palette("unknown", {"primary": "#fff"})
+        with pytest.raises(ValueError):
+            variants_manager.custom_palette("power", {"background": "#fff"})
+        with pytest.raises(ValueError):
+            variants_manager.custom_palette("power", animation_speed=0)
+        with pytest.raises(ValueError):
+            variants_manager.custom_palette("power", glow_intensity=3)
+
+    def test_registered_variant_is_shared(self):
+        """Une variante internée est visible de tous les gestionnaires"""
+        palette = LogoVariants().custom_palette("serenity", {"accent": "#123456"})
+        variant = LogoVariants().register_custom(palette)
+        assert LogoVariants().register_custom(palette) is variant
+        other_manager = LogoVariants()
+        assert other_manager.validate_variant(palette.name)
+        assert other_manager.get_variant(palette.name) is variant
+        assert variant.variant_type == VariantType.SERENITY
+        assert variant.colors.accent == "#123456"
+        assert palette.name not in other_manager.list_variants()
+        assert palette.name in custom_variants
+
+    def test_registry_is_bounded(self):
+        """Le registre évince les variantes les moins récemment utilisées"""
+        registry = CustomVariantRegistry(max_size=2)
+        variants_manager = LogoVariants()
+        base = variants_manager.get_variant("creative")
+        palettes = [
+            variants_manager.custom_palette("creative", {"primary": f"#00000{i}"})
+            for i in range(3)
+        ]
+        registry.intern(palettes[0], base)
+        registry.intern(palettes[1], base)
+        assert registry.get(palettes[0].name) is not None
+        registry.intern(palettes[2], base)
+        assert palettes[1].name not in registry
+        assert palettes[0].name in registry
+        assert registry.get_stats()["evictions"] == 1
+
+
+class TestCompactVariants:
+    """Variantes immuables, hachables et partagées"""
+
+    def test_frozen_and_hashable(self):
+        """Les variantes sont figées et servent directement de clés"""
+        variant = LogoVariants().get_variant("power")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            variant.glow_intensity = 0.1
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            variant.colors.primary = "#000000"
+        assert not hasattr(variant, "__dict__")
+        copy = dataclasses.replace(variant, colors=dataclasses.replace(variant.colors))
+        assert copy == variant and copy is not variant
+        assert {variant: 1}[copy] == 1
+
+    def test_precomputed_representations(self):
+        """RGB, dictionnaire et JSON calculés une seule fois"""
+        variant = LogoVariants().get_variant("serenity")
+        assert variant.colors.rgb[0] == (0x1E, 0x3A, 0x8A)
+        assert variant.to_dict() is variant.to_dict()
+        assert variant.to_dict()["colors"] is variant.colors.to_dict()
+        assert variant.to_json() is variant.to_json()
+        assert json.loads(variant.to_json())["name"] == "🌙 Sérénité"
+        assert ColorScheme("red", "#000", "#000", "#000").rgb is None
+
+    def test_pickle_round_trip(self):
+        """Les variantes figées restent picklables"""
+        variant = LogoVariants().get_variant("mystery")
+        restored = pickle.loads(pickle.dumps(variant))
+        assert restored == variant
+        assert restored.to_dict() == variant.to_dict()
+
+    def test_builtin_variants_shared(self):
+        """Les gestionnaires partagent les mêmes variantes prédéfinies"""
+        assert LogoVariants().get_all_variants() is variants_registry.get_all_variants()
+        assert LogoVariants().get_variant("awakening") is variants_registry.get_variant(
+            "awakening"
+        )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,46 +1,27 @@
 #!/usr/bin/env python3
 """
 Conversion des logos SVG ULTIMES en PNG
+
+Raccourci vers la commande unifiée ``python -m src.cli convert`` : pool de
+processus et manifeste (seuls les SVG modifiés sont reconvertis).
 """
 
+import sys
 from pathlib import Path
 
-import cairosvg
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.cli import cli  # noqa: E402
 
 
 def convert_svg_to_png():
     """Convertit tous les logos SVG ULTIMES en PNG"""
-
     svg_dir = Path("exports-ultimate")
     if not svg_dir.exists():
         print("❌ Répertoire exports-ultimate non trouvé")
         return
-
-    # Trouver tous les fichiers SVG
-    svg_files = list(svg_dir.glob("*.svg"))
-    print(f"🔍 {len(svg_files)} fichiers SVG trouvés")
-
-    for svg_file in svg_files:
-        if "ultimate" in svg_file.name:
-            png_name = svg_file.stem + ".png"
-            png_path = svg_dir / png_name
-
-            print(f"🔄 Conversion de {svg_file.name} vers {png_name}")
-
-            try:
-                # Convertir SVG vers PNG avec cairosvg
-                cairosvg.svg2png(
-                    url=str(svg_file),
-                    write_to=str(png_path),
-                    output_width=200,
-                    output_height=200,
-                )
-                print(f"✅ {png_name} créé avec succès")
-
-            except Exception as e:
-                print(f"❌ Erreur lors de la conversion de {svg_file.name}: {e}")
-
-    print("\n🎉 Conversion terminée !")
+    cli(["-o", str(svg_dir), "convert", "-s", "200"])
 
 
 if __name__ == "__main__":